@@ -6,13 +6,12 @@ from llmao_py import LLMClient
 
 # Load config from file
 # Create a config.json with your settings first (see example below)
-client = LLMClient(config_path="config.json")
+with LLMClient(config_path="config.json") as client:
+    print(f"Configured models: {client.models()}")
 
-print(f"Configured models: {client.models()}")
-
-print("\nSending request...")
-response = client.completion([{"role": "user", "content": "Hello!"}])
-print(f"Response: {response['choices'][0]['message']['content']}")
+    print("\nSending request...")
+    response = client.completion([{"role": "user", "content": "Hello!"}])
+    print(f"Response: {response['choices'][0]['message']['content']}")
 
 
 # Example config.json:
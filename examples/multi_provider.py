@@ -2,7 +2,10 @@
 
 Configure multiple providers with different API keys.
 Specify model when calling completion() to choose which provider to use.
+Requests to different providers can run concurrently with the async API.
 """
+import asyncio
+
 from llmao_py import LLMClient
 
 # Config with multiple providers
@@ -18,27 +21,55 @@ config = {
     }
 }
 
-print("Initializing with multiple providers...")
-client = LLMClient(config=config)
-print(f"Configured models: {client.models()}")
-
-# When multiple models are configured, specify which one to use
-print("\n--- Testing Cerebras ---")
-try:
-    response = client.completion(
-        [{"role": "user", "content": "Hello!"}],
-        model="cerebras/llama3.1-8b"
-    )
-    print(f"Response: {response['choices'][0]['message']['content'][:50]}")
-except Exception as e:
-    print(f"Error: {e}")
-
-print("\n--- Testing Groq ---")
-try:
-    response = client.completion(
-        [{"role": "user", "content": "Hello!"}],
-        model="groq/llama-3.1-8b"
-    )
-    print(f"Response: {response['choices'][0]['message']['content'][:50]}")
-except Exception as e:
-    print(f"Error: {e}")
+MODELS = ["cerebras/llama3.1-8b", "groq/llama-3.1-8b"]
+
+
+async def race(client: LLMClient, messages: list[dict]) -> None:
+    """Send the same request to every provider and keep the first success."""
+    tasks = {
+        asyncio.create_task(client.acompletion(messages, model=model)): model
+        for model in MODELS
+    }
+    pending = set(tasks)
+
+    while pending:
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            if task.exception() is not None:
+                print(f"{tasks[task]} failed: {task.exception()}")
+                continue
+
+            response = task.result()
+            print(f"Winner: {tasks[task]}")
+            print(f"Response: {response['choices'][0]['message']['content'][:50]}")
+            for other in pending:
+                other.cancel()
+            return
+
+    print("All providers failed")
+
+
+async def main() -> None:
+    print("Initializing with multiple providers...")
+    client = LLMClient(config=config)
+    print(f"Configured models: {client.models()}")
+
+    # Race all providers, fastest successful response wins
+    print("\n--- Racing providers ---")
+    await race(client, [{"role": "user", "content": "Hello!"}])
+
+    # Fan out several prompts to one provider at once
+    print("\n--- Batch on Groq ---")
+    prompts = ["Hello!", "What is the capital of Indonesia?", "Say hi in French."]
+    try:
+        responses = await client.completion_batch(
+            [[{"role": "user", "content": p}] for p in prompts],
+            model="groq/llama-3.1-8b"
+        )
+        for prompt, response in zip(prompts, responses):
+            print(f"{prompt} -> {response['choices'][0]['message']['content'][:50]}")
+    except Exception as e:
+        print(f"Error: {e}")
+
+
+asyncio.run(main())
@@ -8,12 +8,22 @@ from llmao_py import LLMClient
 # Keys are loaded from environment variables automatically
 # export CEREBRAS_API_KEY="your-key-here"
 
-client = LLMClient()
+# The context manager closes pooled connections when done
+with LLMClient() as client:
+    print("Sending request...")
+    response = client.completion(
+        [{"role": "user", "content": "Hello! Say hi in one word."}],
+        model="cerebras/llama3.1-70b",
+    )
 
-print("Sending request...")
-response = client.completion(
-    model="cerebras/llama3.1-70b"
-    [{"role": "user", "content": "Hello! Say hi in one word."}],
-)
+    print(f"Response: {response['choices'][0]['message']['content']}")
 
-print(f"Response: {response['choices'][0]['message']['content']}")
+    # Stream the reply to print tokens as soon as they arrive
+    print("Streaming: ", end="", flush=True)
+    for chunk in client.completion(
+        [{"role": "user", "content": "Count from 1 to 10."}],
+        model="cerebras/llama3.1-70b",
+        stream=True,
+    ):
+        print(chunk["choices"][0]["delta"].get("content", ""), end="", flush=True)
+    print()
@@ -5,9 +5,69 @@ A fast, multi-provider LLM client with rate limiting and key rotation.
 """
 
 from ._llmao import LLMClient as _RustLLMClient, completion as _rust_completion, __version__
-from typing import Any, Iterator, Union
+from .semantic_cache import SemanticCache
+from typing import Any, AsyncIterator, Awaitable, Iterator, Union
+from concurrent.futures import Future, ThreadPoolExecutor
+import asyncio
+import atexit
+import contextlib
+import functools
 import queue
 import threading
+import uuid
+import weakref
+
+# Prefix of ids for batches run locally, for providers without a Batch API
+_LOCAL_BATCH_PREFIX = "local-"
+
+# Clients still open, closed at interpreter exit so pooled sockets are released
+_open_clients: "weakref.WeakSet[LLMClient]" = weakref.WeakSet()
+
+
+@atexit.register
+def _close_open_clients() -> None:
+    for client in list(_open_clients):
+        with contextlib.suppress(Exception):
+            client.close()
+
+
+def _is_cacheable(temperature: float | None, kwargs: dict[str, Any]) -> bool:
+    """Whether a call's response may be cached: opted in with cache=, or deterministic"""
+    # Same rule as the Rust response cache (ResponseCache::is_cacheable)
+    if (cache := kwargs.get("cache")) is not None:
+        return bool(cache)
+    return temperature is not None and temperature <= 0
+
+
+def _settle(future: asyncio.Future, result: Any, error: BaseException | None) -> None:
+    """Settle a future with a call's outcome, unless its awaiter was cancelled"""
+    if future.done():
+        return
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
+
+
+async def _await_call(start: Any) -> Any:
+    """
+    Await a call started on the client's runtime.
+    
+    `start(callback)` starts the call and returns its PendingCall; the runtime
+    calls back from its own thread when the call finishes, so no Python thread
+    waits on the request. Cancelling the awaiting task aborts the call.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    
+    def callback(result: Any, error: BaseException | None) -> None:
+        loop.call_soon_threadsafe(_settle, future, result, error)
+    
+    call = start(callback)
+    try:
+        return await future
+    finally:
+        call.cancel()
 
 
 class LLMClient:
@@ -19,24 +79,91 @@ class LLMClient:
         client = LLMClient()
         response = client.completion(messages=[...])
         
+        # Context manager closes pooled connections on exit
+        with LLMClient() as client:
+            response = client.completion(messages=[...])
+        
         # Streaming
         for chunk in client.completion(messages=[...], stream=True):
             print(chunk['choices'][0]['delta']['content'])
     """
     
-    def __init__(self, config_path: str | None = None):
-        self._client = _RustLLMClient(config_path) if config_path else _RustLLMClient()
+    def __init__(
+        self,
+        config_path: str | None = None,
+        config: dict[str, Any] | None = None,
+        cache_ttl: float | None = None,
+        cache_size: int = 1024,
+        semantic_cache: bool | SemanticCache = False,
+        prewarm: bool = True,
+    ):
+        """
+        Args:
+            config_path: Path to a JSON config file
+            config: Config dict (takes precedence over config_path)
+            cache_ttl: Seconds to cache deterministic (temperature=0) responses,
+                and those of calls made with cache=True; None disables the cache
+            cache_size: Maximum number of cached responses
+            semantic_cache: True (or a configured SemanticCache) to also reuse
+                responses for similar prompts, for the same calls the response
+                cache takes; requires llmao-py[semantic]
+            prewarm: Connect to the configured providers in the background so
+                the first request skips the TLS handshake
+        """
+        self._client = _RustLLMClient(
+            config_path=config_path,
+            config=config,
+            cache_ttl=cache_ttl,
+            cache_size=cache_size,
+            prewarm=prewarm,
+        )
+        self._semantic_cache = SemanticCache() if semantic_cache is True else (semantic_cache or None)
+        
+        # batch id -> model, so batch_poll/batch_results can find the provider
+        self._batch_models: dict[str, str | None] = {}
+        # Local fallback batches for providers without a Batch API; kept so
+        # their results can be read more than once
+        self._local_batches: dict[str, Future] = {}
+        self._batch_executor: ThreadPoolExecutor | None = None
+        
+        _open_clients.add(self)
+    
+    def close(self) -> None:
+        """
+        Close the client and release its pooled connections. Safe to call twice.
+        
+        Calls still running on other threads (e.g. an abandoned acompletion)
+        raise "Client is closed" instead of keeping the connections alive.
+        """
+        _open_clients.discard(self)
+        if self._batch_executor is not None:
+            self._batch_executor.shutdown(wait=False)
+            self._batch_executor = None
+        self._client.close()
+    
+    def __del__(self) -> None:
+        # Last resort for clients that were never closed; __init__ may have failed
+        if getattr(self, "_client", None) is not None:
+            with contextlib.suppress(Exception):
+                self.close()
+    
+    def __enter__(self) -> "LLMClient":
+        return self
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
     
     def completion(
         self,
-        messages: list[dict[str, Any]],
+        messages: list[dict[str, Any]] | None = None,
         model: str | None = None,
         temperature: float | None = None,
         max_tokens: int | None = None,
         stream: bool = False,
         tools: list[dict[str, Any]] | None = None,
+        prompts: list[str] | None = None,
         **kwargs: Any
-    ) -> Union[dict[str, Any], Iterator[dict[str, Any]]]:
+    ) -> Union[dict[str, Any], Iterator[dict[str, Any]], list[dict[str, Any]]]:
         """
         Create a chat completion.
         
@@ -47,22 +174,185 @@ class LLMClient:
             max_tokens: Max tokens to generate
             stream: If True, returns iterator of chunks; if False, returns complete response
             tools: Tool definitions for function calling
-            **kwargs: Additional provider-specific params
+            prompts: Independent user prompts to complete instead of `messages`.
+                Sent as one request to providers with `use_legacy_completions`
+                (its usage is reported on the first response), otherwise as
+                concurrent chat completions.
+            **kwargs: Additional provider-specific params. cache_control=True
+                marks system messages and tools for provider-side prompt caching.
+                cache=True caches the response even if temperature > 0
+                (cache=False never caches it); this one is not sent.
         
         Returns:
-            dict if stream=False, Iterator[dict] if stream=True
+            dict if stream=False, Iterator[dict] if stream=True,
+            list[dict] (one per prompt) if prompts is given
         """
+        if prompts is not None:
+            return self._client.completion_prompts(
+                prompts,
+                model=model,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                **kwargs
+            )
+        
+        if messages is None:
+            raise ValueError("Either messages or prompts must be provided")
+        
         if not stream:
+            cached, cache_key, embedding = self._semantic_lookup(
+                messages, model, temperature, max_tokens, tools, kwargs
+            )
+            if cached is not None:
+                return cached
+            
             # Non-streaming: use existing Rust method
-            return self._client.completion(
+            response = self._client.completion(
                 messages=messages,
                 model=model,
                 temperature=temperature,
                 max_tokens=max_tokens,
                 **kwargs
             )
+            
+            self._semantic_store(cache_key, embedding, response)
+            return response
+        
+        return self._stream(
+            messages=messages,
+            model=model,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            tools=tools,
+            **kwargs
+        )
+    
+    def _semantic_lookup(
+        self,
+        messages: list[dict[str, Any]],
+        model: str | None,
+        temperature: float | None,
+        max_tokens: int | None,
+        tools: list[dict[str, Any]] | None,
+        kwargs: dict[str, Any],
+    ) -> tuple[dict[str, Any] | None, str | None, Any]:
+        """
+        Check the caches on the last message before going to the network.
+        
+        The exact-match response cache is checked first, so its hits skip the
+        embedding. Returns the cached response (or None), plus the key and
+        embedding to store the real response under in the semantic cache;
+        both None if it does not apply.
+        """
+        if not self._uses_semantic_cache(messages, temperature, tools, kwargs):
+            return None, None, None
+        
+        cached = self._client.cached(
+            messages, model=model, temperature=temperature, max_tokens=max_tokens, **kwargs
+        )
+        if cached is not None:
+            return cached, None, None
+        
+        # cache= decides whether to cache, not what the response is
+        params = {k: v for k, v in kwargs.items() if k != "cache"}
+        cache_key = self._semantic_cache.context_key(
+            model, messages, temperature=temperature, max_tokens=max_tokens, **params
+        )
+        embedding = self._semantic_cache.embed(str(messages[-1].get("content") or ""))
+        return self._semantic_cache.search(cache_key, embedding), cache_key, embedding
+    
+    def _uses_semantic_cache(
+        self,
+        messages: list[dict[str, Any]],
+        temperature: float | None,
+        tools: list[dict[str, Any]] | None,
+        kwargs: dict[str, Any],
+    ) -> bool:
+        """Whether a call is looked up in and stored to the semantic cache"""
+        return (
+            self._semantic_cache is not None
+            and bool(messages)
+            and not tools
+            and _is_cacheable(temperature, kwargs)
+        )
+    
+    def _semantic_store(self, cache_key: str | None, embedding: Any, response: dict[str, Any]) -> None:
+        """Store a fetched response under the key from _semantic_lookup(), if any"""
+        if cache_key is not None:
+            self._semantic_cache.add(cache_key, embedding, response)
+    
+    def completion_text(
+        self,
+        messages: list[dict[str, Any]],
+        model: str | None = None,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        **kwargs: Any
+    ) -> str | None:
+        """
+        Create a chat completion and return only the first message's content.
+        
+        Cheaper than completion() when only the text is needed, since the full
+        response dict is never built.
+        """
+        if self._semantic_cache is not None:
+            response = self.completion(
+                messages, model=model, temperature=temperature, max_tokens=max_tokens, **kwargs
+            )
+            return response["choices"][0]["message"]["content"] if response["choices"] else None
         
-        # Streaming: convert callback to iterator
+        return self._client.completion_text(
+            messages=messages,
+            model=model,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            **kwargs
+        )
+    
+    def bind(
+        self,
+        model: str | None = None,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        system: str | None = None,
+        **kwargs: Any
+    ) -> "BoundCompletion":
+        """
+        Fix the model, params and system prompt for repeated completions.
+        
+        The returned BoundCompletion is called with just the user message. The
+        rest of the request body is serialized once, here, instead of per call.
+        
+        Example:
+            ```python
+            ask = client.bind(model="groq/llama-3.1-8b", temperature=0.7, system="Be brief.")
+            response = ask("Hello!")
+            ```
+        """
+        return BoundCompletion(
+            self,
+            self._client.bind(
+                model=model,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                system=system,
+                **kwargs
+            ),
+            system,
+            dict(model=model, temperature=temperature, max_tokens=max_tokens, **kwargs),
+        )
+    
+    def _stream(
+        self,
+        messages: list[dict[str, Any]],
+        model: str | None,
+        temperature: float | None,
+        max_tokens: int | None,
+        tools: list[dict[str, Any]] | None,
+        **kwargs: Any
+    ) -> Iterator[dict[str, Any]]:
+        """Stream a chat completion, yielding OpenAI-style chunks"""
+        # Convert callback to iterator
         chunk_queue = queue.Queue()
         done_event = threading.Event()
         error_holder = []
@@ -96,25 +386,7 @@ class LLMClient:
         while not done_event.is_set() or not chunk_queue.empty():
             try:
                 chunk = chunk_queue.get(timeout=0.1)
-                
-                # Convert to OpenAI-style streaming format
-                yield {
-                    'id': chunk.get('id', ''),
-                    'object': 'chat.completion.chunk',
-                    'created': chunk.get('created', 0),
-                    'model': chunk.get('model', ''),
-                    'choices': [{
-                        'index': chunk.get('index', 0),
-                        'delta': {
-                            k: v for k, v in {
-                                'role': chunk.get('role'),
-                                'content': chunk.get('content'),
-                                'tool_calls': chunk.get('tool_calls'),
-                            }.items() if v is not None
-                        },
-                        'finish_reason': chunk.get('finish_reason'),
-                    }]
-                }
+                yield self._to_openai_chunk(chunk)
             except queue.Empty:
                 if error_holder:
                     raise error_holder[0]
@@ -124,15 +396,290 @@ class LLMClient:
         if error_holder:
             raise error_holder[0]
     
+    @staticmethod
+    def _to_openai_chunk(chunk: dict[str, Any]) -> dict[str, Any]:
+        """Convert a flat chunk from the Rust callback to OpenAI streaming format"""
+        return {
+            'id': chunk.get('id', ''),
+            'object': 'chat.completion.chunk',
+            'created': chunk.get('created', 0),
+            'model': chunk.get('model', ''),
+            'choices': [{
+                'index': chunk.get('index', 0),
+                'delta': {
+                    k: v for k, v in {
+                        'role': chunk.get('role'),
+                        'content': chunk.get('content'),
+                        'tool_calls': chunk.get('tool_calls'),
+                    }.items() if v is not None
+                },
+                'finish_reason': chunk.get('finish_reason'),
+            }]
+        }
+    
+    def acompletion(
+        self,
+        messages: list[dict[str, Any]],
+        model: str | None = None,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        stream: bool = False,
+        **kwargs: Any
+    ) -> Union[Awaitable[dict[str, Any]], AsyncIterator[dict[str, Any]]]:
+        """
+        Create a chat completion without blocking the event loop.
+        
+        The request runs on the client's Rust runtime rather than a Python
+        thread, so any number of acompletion() calls can be awaited at once.
+        Cancelling the awaiting task aborts the request.
+        
+        Returns an awaitable response, or with stream=True an async iterator
+        of chunks to use with `async for`.
+        """
+        if stream:
+            return self._astream(
+                messages,
+                model=model,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                **kwargs
+            )
+        return self._acompletion(
+            messages,
+            model=model,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            **kwargs
+        )
+    
+    async def _acompletion(
+        self,
+        messages: list[dict[str, Any]],
+        model: str | None,
+        temperature: float | None,
+        max_tokens: int | None,
+        **kwargs: Any
+    ) -> dict[str, Any]:
+        """Run a non-streaming completion on the client's runtime"""
+        cache_key = embedding = None
+        if self._uses_semantic_cache(messages, temperature, kwargs.get("tools"), kwargs):
+            # Embedding the prompt is CPU-bound, so keep it off the event loop
+            cached, cache_key, embedding = await asyncio.get_running_loop().run_in_executor(
+                None,
+                self._semantic_lookup,
+                messages,
+                model,
+                temperature,
+                max_tokens,
+                kwargs.get("tools"),
+                kwargs,
+            )
+            if cached is not None:
+                return cached
+        
+        response = await _await_call(
+            functools.partial(
+                self._client.spawn_completion,
+                messages=messages,
+                model=model,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                **kwargs
+            )
+        )
+        
+        self._semantic_store(cache_key, embedding, response)
+        return response
+    
+    async def _astream(
+        self,
+        messages: list[dict[str, Any]],
+        model: str | None,
+        temperature: float | None,
+        max_tokens: int | None,
+        tools: list[dict[str, Any]] | None = None,
+        **kwargs: Any
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Stream a chat completion on the client's runtime, yielding chunks as they arrive"""
+        loop = asyncio.get_running_loop()
+        chunk_queue: asyncio.Queue = asyncio.Queue()
+        done = object()
+        error_holder = []
+        
+        def on_chunk(chunk: dict):
+            """Callback for each streaming chunk, run on a runtime thread"""
+            loop.call_soon_threadsafe(chunk_queue.put_nowait, chunk)
+        
+        def on_done(result: Any, error: BaseException | None):
+            """Callback for the end of the stream, run on a runtime thread"""
+            if error is not None:
+                error_holder.append(error)
+            loop.call_soon_threadsafe(chunk_queue.put_nowait, done)
+        
+        call = self._client.spawn_stream(
+            on_chunk,
+            on_done,
+            messages=messages,
+            model=model,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            tools=tools,
+            **kwargs
+        )
+        try:
+            while (chunk := await chunk_queue.get()) is not done:
+                yield self._to_openai_chunk(chunk)
+        finally:
+            # Stops the request if the consumer stopped iterating early
+            call.cancel()
+        
+        # Surface any error raised by the stream
+        if error_holder:
+            raise error_holder[0]
+    
+    async def completion_batch(
+        self,
+        messages_list: list[list[dict[str, Any]]],
+        model: str | None = None,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        max_concurrency: int | None = None,
+        **kwargs: Any
+    ) -> list[dict[str, Any]]:
+        """
+        Create one chat completion per message list, all in flight at once.
+        
+        The batch takes roughly as long as its slowest request instead of the
+        sum of all of them. Responses are returned in input order.
+        
+        Args:
+            max_concurrency: Cap on requests in flight at once (None for no cap)
+        """
+        return await _await_call(
+            functools.partial(
+                self._client.spawn_completion_batch,
+                messages_list=messages_list,
+                model=model,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                max_concurrency=max_concurrency,
+                **kwargs
+            )
+        )
+    
+    def batch_submit(
+        self,
+        messages_list: list[list[dict[str, Any]]],
+        model: str | None = None,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        max_concurrency: int = 16,
+        **kwargs: Any
+    ) -> str:
+        """
+        Submit one request per message list as a batch job and return its id.
+        
+        Providers with a Batch API (OpenAI, Groq) process the job server-side,
+        typically at half price within 24 hours. Other providers fall back to
+        running the requests in the background, at most `max_concurrency` at once.
+        Collect the output with batch_results().
+        """
+        if self._client.supports_batch(model):
+            batch_id = self._client.batch_submit(
+                messages_list,
+                model=model,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                **kwargs
+            )["id"]
+        else:
+            if self._batch_executor is None:
+                self._batch_executor = ThreadPoolExecutor(thread_name_prefix="llmao-batch")
+            batch_id = f"{_LOCAL_BATCH_PREFIX}{uuid.uuid4().hex}"
+            self._local_batches[batch_id] = self._batch_executor.submit(
+                self._client.completion_batch,
+                messages_list,
+                model=model,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                max_concurrency=max_concurrency,
+                return_errors=True,
+                **kwargs
+            )
+        
+        self._batch_models[batch_id] = model
+        return batch_id
+    
+    def _local_batch(self, batch_id: str) -> Future | None:
+        """Get a local fallback batch, or None for a provider batch id"""
+        if not batch_id.startswith(_LOCAL_BATCH_PREFIX):
+            return None
+        if (future := self._local_batches.get(batch_id)) is None:
+            # Never a provider's id, so don't ask the provider about it
+            raise ValueError(
+                f"Unknown batch {batch_id!r}: local batches can only be read from "
+                "the client that submitted them"
+            )
+        return future
+    
+    def batch_poll(self, batch_id: str, model: str | None = None) -> dict[str, Any]:
+        """Get the status of a batch job without waiting for it"""
+        if (future := self._local_batch(batch_id)) is not None:
+            if not future.done():
+                status = "in_progress"
+            else:
+                status = "failed" if future.exception() is not None else "completed"
+            return {"id": batch_id, "status": status}
+        
+        return self._client.batch_poll(batch_id, model=model or self._batch_models.get(batch_id))
+    
+    def batch_results(self, batch_id: str, model: str | None = None) -> dict[str, dict[str, Any]]:
+        """
+        Wait for a batch job to finish and return its responses.
+        
+        Responses are keyed by custom_id, the request's index in the submitted
+        list as a string. Failed requests map to {"error": "..."}.
+        """
+        if (future := self._local_batch(batch_id)) is not None:
+            responses = future.result()
+            return {str(i): response for i, response in enumerate(responses)}
+        
+        return self._client.batch_results(batch_id, model=model or self._batch_models.get(batch_id))
+    
+    def cache_stats(self) -> dict[str, int]:
+        """Get response cache statistics: hits, misses and size"""
+        return self._client.cache_stats()
+    
+    def semantic_cache_stats(self) -> dict[str, int] | None:
+        """Get semantic cache statistics, or None if it is disabled"""
+        return self._semantic_cache.stats() if self._semantic_cache is not None else None
+    
     def providers(self) -> list[str]:
         """List available providers"""
         return self._client.providers()
     
+    def models(self) -> list[str]:
+        """List configured models"""
+        return self._client.models()
+    
     def provider_info(self, name: str) -> dict | None:
         """Get provider information"""
         return self._client.provider_info(name)
 
 
+_default_client: LLMClient | None = None
+_default_client_lock = threading.Lock()
+
+
+def _get_default_client() -> LLMClient:
+    """Get the shared client used by completion(), creating it on first use"""
+    global _default_client
+    with _default_client_lock:
+        if _default_client is None:
+            _default_client = LLMClient()
+        return _default_client
+
+
 def completion(
     model: str,
     messages: list[dict[str, Any]],
@@ -154,7 +701,7 @@ def completion(
         for chunk in completion(model="openai/gpt-4", messages=[...], stream=True):
             print(chunk['choices'][0]['delta'].get('content', ''), end='')
     """
-    client = LLMClient()
+    client = _get_default_client()
     return client.completion(
         messages=messages,
         model=model,
@@ -165,4 +712,102 @@ def completion(
     )
 
 
-__all__ = ["LLMClient", "completion", "__version__"]
+class BoundCompletion:
+    """
+    Chat completion with a fixed model, params and system prompt.
+    
+    Created by LLMClient.bind(); call it with the user message.
+    """
+    
+    def __init__(self, client: LLMClient, bound: Any, system: str | None, params: dict[str, Any]):
+        self._client = client
+        self._bound = bound
+        self._system = system
+        self._params = params
+    
+    @property
+    def model(self) -> str:
+        """Model the request was bound to"""
+        return self._bound.model
+    
+    def _messages(self, user: str) -> list[dict[str, Any]]:
+        """Full message list for a user message"""
+        messages = [{"role": "user", "content": user}]
+        if self._system is not None:
+            messages.insert(0, {"role": "system", "content": self._system})
+        return messages
+    
+    def __call__(self, user: str) -> dict[str, Any]:
+        """Create a chat completion for a user message"""
+        # The semantic cache lives in Python, so go through the client to use it
+        if self._client._semantic_cache is not None:
+            return self._client.completion(self._messages(user), **self._params)
+        return self._bound(user)
+    
+    def text(self, user: str) -> str | None:
+        """Create a chat completion for a user message and return only its content"""
+        if self._client._semantic_cache is not None:
+            return self._client.completion_text(self._messages(user), **self._params)
+        return self._bound.text(user)
+    
+    async def batch(self, users: list[str], max_concurrency: int | None = None) -> list[dict[str, Any]]:
+        """
+        Create one chat completion per user message, all in flight at once.
+        
+        Responses are returned in input order. With a semantic cache, only
+        the messages it misses are sent; messages within one batch don't hit
+        each other.
+        """
+        if not self._uses_semantic_cache():
+            return await _await_call(
+                functools.partial(self._bound.spawn_batch, users=users, max_concurrency=max_concurrency)
+            )
+        
+        # Embedding the prompts is CPU-bound, so keep it off the event loop
+        lookups = await asyncio.get_running_loop().run_in_executor(
+            None, lambda: [self._semantic_lookup(user) for user in users]
+        )
+        responses = [cached for cached, _, _ in lookups]
+        misses = [i for i, response in enumerate(responses) if response is None]
+        if misses:
+            fetched = await _await_call(
+                functools.partial(
+                    self._bound.spawn_batch,
+                    users=[users[i] for i in misses],
+                    max_concurrency=max_concurrency,
+                )
+            )
+            for i, response in zip(misses, fetched):
+                _, cache_key, embedding = lookups[i]
+                self._client._semantic_store(cache_key, embedding, response)
+                responses[i] = response
+        return responses
+    
+    def _semantic_params(self) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Bound params split into the named ones and the rest, as completion() takes them"""
+        kwargs = dict(self._params)
+        named = {name: kwargs.pop(name) for name in ("model", "temperature", "max_tokens", "tools")
+                 if name in kwargs}
+        return named, kwargs
+    
+    def _uses_semantic_cache(self) -> bool:
+        """Whether calls are looked up in and stored to the client's semantic cache"""
+        named, kwargs = self._semantic_params()
+        return self._client._uses_semantic_cache(
+            self._messages(""), named.get("temperature"), named.get("tools"), kwargs
+        )
+    
+    def _semantic_lookup(self, user: str) -> tuple[dict[str, Any] | None, str | None, Any]:
+        """LLMClient._semantic_lookup() for a user message"""
+        named, kwargs = self._semantic_params()
+        return self._client._semantic_lookup(
+            self._messages(user),
+            named.get("model"),
+            named.get("temperature"),
+            named.get("max_tokens"),
+            named.get("tools"),
+            kwargs,
+        )
+
+
+__all__ = ["BoundCompletion", "LLMClient", "SemanticCache", "completion", "__version__"]
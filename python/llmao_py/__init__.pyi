@@ -2,7 +2,7 @@
 Type stubs for LLMAO - Lightweight LLM API Orchestrator
 """
 
-from typing import Any, Iterator, Optional, TypedDict, Union
+from typing import Any, AsyncIterator, Awaitable, Iterator, Optional, TypedDict, Union
 
 class Message(TypedDict, total=False):
     role: str
@@ -41,6 +41,47 @@ class StreamChunk(TypedDict, total=False):
     model: str
     choices: list[StreamChoice]
 
+class CacheStats(TypedDict):
+    hits: int
+    misses: int
+    size: int
+
+class BatchRequestCounts(TypedDict):
+    total: int
+    completed: int
+    failed: int
+
+class BatchJob(TypedDict, total=False):
+    id: str
+    status: str
+    output_file_id: Optional[str]
+    error_file_id: Optional[str]
+    request_counts: BatchRequestCounts
+
+class SemanticCache:
+    """
+    Cache that reuses responses for semantically similar prompts.
+    
+    Prompts are embedded locally with fastembed; a cached response is returned
+    when the cosine similarity of the last message is at least `threshold` and
+    the model, params and earlier messages match exactly.
+    """
+    
+    threshold: float
+    ttl: float
+    max_entries: int
+    
+    def __init__(
+        self,
+        threshold: float = 0.92,
+        ttl: float = 3600,
+        max_entries: int = 1024,
+        embedding_model: str = "sentence-transformers/all-MiniLM-L6-v2",
+        embedder: Any = None,
+    ) -> None: ...
+    
+    def stats(self) -> CacheStats: ...
+
 class LLMClient:
     """
     Lightweight LLM API client with multi-provider support.
@@ -68,18 +109,56 @@ class LLMClient:
         ```
     """
     
-    def __init__(self, config_path: Optional[str] = None) -> None: ...
+    def __init__(
+        self,
+        config_path: Optional[str] = None,
+        config: Optional[dict[str, Any]] = None,
+        cache_ttl: Optional[float] = None,
+        cache_size: int = 1024,
+        semantic_cache: Union[bool, SemanticCache] = False,
+        prewarm: bool = True,
+    ) -> None:
+        """
+        Create a client.
+        
+        Args:
+            config_path: Path to a JSON config file.
+            config: Config dict (takes precedence over config_path).
+            cache_ttl: Seconds to cache deterministic (temperature=0) responses,
+                       and those of calls made with cache=True. None disables the cache.
+            cache_size: Maximum number of cached responses.
+            semantic_cache: True (or a configured SemanticCache) to also reuse
+                            responses for similar prompts, for the same calls the
+                            response cache takes. Requires llmao-py[semantic].
+            prewarm: Connect to the configured providers in the background so
+                     the first request skips the TLS handshake.
+        """
+        ...
+    
+    def close(self) -> None:
+        """
+        Close the client and release its pooled connections. Safe to call twice.
+        Calls still running on other threads raise "Client is closed".
+        
+        Clients still open are closed when garbage collected or at interpreter exit.
+        """
+        ...
+    
+    def __enter__(self) -> "LLMClient": ...
+    
+    def __exit__(self, *exc_info: Any) -> None: ...
     
     def completion(
         self,
-        messages: list[dict[str, Any]],
+        messages: Optional[list[dict[str, Any]]] = None,
         model: Optional[str] = None,
         temperature: Optional[float] = None,
         max_tokens: Optional[int] = None,
         stream: bool = False,
         tools: Optional[list[dict[str, Any]]] = None,
+        prompts: Optional[list[str]] = None,
         **kwargs: Any
-    ) -> Union[CompletionResponse, Iterator[StreamChunk]]:
+    ) -> Union[CompletionResponse, Iterator[StreamChunk], list[CompletionResponse]]:
         """
         Create a chat completion.
         
@@ -91,10 +170,19 @@ class LLMClient:
             max_tokens: Maximum tokens to generate.
             stream: If True, returns iterator; if False, returns complete response.
             tools: Tool definitions for function calling.
-            **kwargs: Additional provider-specific parameters.
+            prompts: Independent user prompts to complete instead of `messages`.
+                     Providers with `use_legacy_completions` receive them in a
+                     single request, whose usage is reported on the first
+                     response; others get concurrent chat completions.
+            **kwargs: Additional provider-specific parameters. Pass
+                      `cache_control=True` to mark system messages and tools for
+                      provider-side prompt caching (Anthropic, OpenRouter), or
+                      `cache=True` to cache the response even if temperature > 0
+                      (`cache=False` never caches it; neither is sent).
         
         Returns:
-            CompletionResponse dict if stream=False, Iterator[StreamChunk] if stream=True.
+            CompletionResponse dict if stream=False, Iterator[StreamChunk] if stream=True,
+            list[CompletionResponse] (one per prompt) if prompts is given.
         
         Example:
             ```python
@@ -117,14 +205,185 @@ class LLMClient:
         """
         ...
     
+    def completion_text(
+        self,
+        messages: list[dict[str, Any]],
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        **kwargs: Any
+    ) -> Optional[str]:
+        """
+        Create a chat completion and return only the first message's content.
+        
+        Cheaper than `completion()` when only the text is needed, since the
+        full response dict is never built.
+        
+        Example:
+            ```python
+            text = client.completion_text(
+                [{"role": "user", "content": "Hello!"}],
+                model="groq/llama-3.1-8b"
+            )
+            ```
+        """
+        ...
+    
+    def bind(
+        self,
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        system: Optional[str] = None,
+        **kwargs: Any
+    ) -> BoundCompletion:
+        """
+        Fix the model, params and system prompt for repeated completions.
+        
+        The request body is serialized once; each call only encodes the user message.
+        
+        Example:
+            ```python
+            ask = client.bind(model="groq/llama-3.1-8b", temperature=0.7, system="Be brief.")
+            response = ask("Hello!")
+            texts = [ask.text(q) for q in questions]
+            responses = await ask.batch(questions)
+            ```
+        """
+        ...
+    
+    def acompletion(
+        self,
+        messages: list[dict[str, Any]],
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        stream: bool = False,
+        **kwargs: Any
+    ) -> Union[Awaitable[CompletionResponse], AsyncIterator[StreamChunk]]:
+        """
+        Create a chat completion without blocking the event loop.
+        
+        Returns an awaitable response, or an async iterator of chunks if stream=True.
+        
+        Example:
+            ```python
+            responses = await asyncio.gather(
+                client.acompletion(messages, model="groq/llama-3.1-8b"),
+                client.acompletion(messages, model="cerebras/llama3.1-8b"),
+            )
+            
+            async for chunk in client.acompletion(messages, model="groq/llama-3.1-8b", stream=True):
+                print(chunk["choices"][0]["delta"].get("content", ""), end="")
+            ```
+        """
+        ...
+    
+    async def completion_batch(
+        self,
+        messages_list: list[list[dict[str, Any]]],
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        **kwargs: Any
+    ) -> list[CompletionResponse]:
+        """
+        Create one chat completion per message list, all in flight at once.
+        
+        Responses are returned in input order. Raises the first error if any
+        request fails. `max_concurrency` caps the requests in flight at once.
+        """
+        ...
+    
+    def batch_submit(
+        self,
+        messages_list: list[list[dict[str, Any]]],
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        max_concurrency: int = 16,
+        **kwargs: Any
+    ) -> str:
+        """
+        Submit one request per message list as a batch job and return its id.
+        
+        Providers with a Batch API (OpenAI, Groq) run the job server-side,
+        typically at half price within 24 hours. Other providers fall back to
+        running the requests in the background, `max_concurrency` at a time.
+        
+        Example:
+            ```python
+            batch_id = client.batch_submit(
+                [[{"role": "user", "content": p}] for p in prompts],
+                model="openai/gpt-4o-mini"
+            )
+            print(client.batch_poll(batch_id)["status"])
+            results = client.batch_results(batch_id)  # waits until done
+            print(results["0"]["choices"][0]["message"]["content"])
+            ```
+        """
+        ...
+    
+    def batch_poll(self, batch_id: str, model: Optional[str] = None) -> BatchJob:
+        """Get the status of a batch job without waiting for it."""
+        ...
+    
+    def batch_results(
+        self, batch_id: str, model: Optional[str] = None
+    ) -> dict[str, CompletionResponse]:
+        """
+        Wait for a batch job to finish and return its responses keyed by custom_id
+        (the request's index as a string). Failed requests map to {"error": "..."}.
+        """
+        ...
+    
+    def cache_stats(self) -> CacheStats:
+        """Get response cache statistics."""
+        ...
+    
+    def semantic_cache_stats(self) -> Optional[CacheStats]:
+        """Get semantic cache statistics, or None if it is disabled."""
+        ...
+    
     def providers(self) -> list[str]:
         """List available provider names."""
         ...
     
+    def models(self) -> list[str]:
+        """List configured models."""
+        ...
+    
     def provider_info(self, name: str) -> Optional[dict[str, Any]]:
         """Get information about a specific provider."""
         ...
 
+class BoundCompletion:
+    """Chat completion with a fixed model, params and system prompt. Created by LLMClient.bind()."""
+    
+    @property
+    def model(self) -> str:
+        """Model the request was bound to."""
+        ...
+    
+    def __call__(self, user: str) -> CompletionResponse:
+        """Create a chat completion for a user message."""
+        ...
+    
+    def text(self, user: str) -> Optional[str]:
+        """Create a chat completion for a user message and return only its content."""
+        ...
+    
+    async def batch(
+        self, users: list[str], max_concurrency: Optional[int] = None
+    ) -> list[CompletionResponse]:
+        """
+        Create one chat completion per user message, all in flight at once.
+        
+        With a semantic cache, only the messages it misses are sent.
+        """
+        ...
+
 def completion(
     model: str,
     messages: list[dict[str, Any]],
@@ -0,0 +1,160 @@
+"""
+Semantic response cache.
+
+Returns a cached response when a new prompt is close enough in meaning to one
+seen before, e.g. "What is the capital of Indonesia?" and "Tell me Indonesia's
+capital". Prompts are embedded locally with fastembed (ONNX, no torch), so a
+lookup costs a few milliseconds instead of a full LLM call.
+
+Requires the optional dependency: pip install 'llmao-py[semantic]'
+"""
+
+from typing import Any
+import copy
+import json
+import threading
+import time
+
+
+DEFAULT_EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+
+
+class SemanticCache:
+    """
+    Cache of responses keyed by prompt embedding.
+
+    Only the last message is compared semantically; the model, sampling params
+    and all earlier messages must match exactly, so a hit never crosses
+    conversations or system prompts.
+
+    Example:
+        cache = SemanticCache(threshold=0.9)
+        client = LLMClient(semantic_cache=cache)
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.92,
+        ttl: float = 3600,
+        max_entries: int = 1024,
+        embedding_model: str = DEFAULT_EMBEDDING_MODEL,
+        embedder: Any = None,
+    ):
+        """
+        Args:
+            threshold: Minimum cosine similarity for a hit (0.0-1.0)
+            ttl: Seconds a cached response stays valid
+            max_entries: Maximum number of cached responses (oldest evicted first)
+            embedding_model: fastembed model used to embed prompts
+            embedder: Object with a fastembed-style embed(texts) method, used
+                instead of loading embedding_model
+        """
+        try:
+            import numpy as np
+            if embedder is None:
+                from fastembed import TextEmbedding
+                embedder = TextEmbedding(embedding_model)
+        except ImportError as e:
+            raise ImportError(
+                "Semantic caching requires fastembed. Install it with: pip install 'llmao-py[semantic]'"
+            ) from e
+
+        self._np = np
+        self._embedder = embedder
+        self.threshold = threshold
+        self.ttl = ttl
+        self.max_entries = max_entries
+
+        # context key -> (embedding matrix, [(expires_at, response)])
+        self._entries: dict[str, tuple[Any, list[tuple[float, dict[str, Any]]]]] = {}
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def embed(self, text: str) -> Any:
+        """Embed text as a unit-length vector"""
+        vector = next(iter(self._embedder.embed([text])))
+        return vector / self._np.linalg.norm(vector)
+
+    @staticmethod
+    def context_key(model: str | None, messages: list[dict[str, Any]], **params: Any) -> str:
+        """Key for everything that must match exactly: model, params and all but the last message"""
+        return json.dumps(
+            {"model": model, "messages": messages[:-1], "params": params},
+            sort_keys=True,
+            default=str,
+        )
+
+    def search(self, key: str, embedding: Any) -> dict[str, Any] | None:
+        """Return the most similar live cached response if it is above the threshold"""
+        with self._lock:
+            entry = self._prune(key, time.monotonic())
+            if entry is not None:
+                matrix, items = entry
+                scores = matrix @ embedding
+                best = int(scores.argmax())
+                if scores[best] >= self.threshold:
+                    self.hits += 1
+                    return copy.deepcopy(items[best][1])
+            self.misses += 1
+            return None
+
+    def add(self, key: str, embedding: Any, response: dict[str, Any]) -> None:
+        """Store a copy of a response for the given context and prompt embedding"""
+        with self._lock:
+            now = time.monotonic()
+            self._prune(key, now)
+            if self._size >= self.max_entries:
+                self._evict()
+
+            matrix, items = self._entries.get(key, (None, []))
+            matrix = embedding[None, :] if matrix is None else self._np.vstack([matrix, embedding])
+            self._entries[key] = (matrix, items + [(now + self.ttl, copy.deepcopy(response))])
+            self._size += 1
+
+    def _prune(self, key: str, now: float) -> tuple[Any, list[tuple[float, dict[str, Any]]]] | None:
+        """Drop the expired entries for one context, returning what is left"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        matrix, items = entry
+        keep = [i for i, (expires_at, _) in enumerate(items) if expires_at > now]
+        if len(keep) == len(items):
+            return entry
+
+        self._size -= len(items) - len(keep)
+        if not keep:
+            del self._entries[key]
+            return None
+        entry = (matrix[keep], [items[i] for i in keep])
+        self._entries[key] = entry
+        return entry
+
+    def _evict(self) -> None:
+        """Drop expired entries, or the oldest entry if none have expired"""
+        now = time.monotonic()
+        oldest_key, oldest_index, oldest_expiry = None, 0, float("inf")
+
+        for key in list(self._entries):
+            entry = self._prune(key, now)
+            if entry is None:
+                continue
+            for i, (expires_at, _) in enumerate(entry[1]):
+                if expires_at < oldest_expiry:
+                    oldest_key, oldest_index, oldest_expiry = key, i, expires_at
+
+        if self._size >= self.max_entries and oldest_key is not None:
+            matrix, items = self._entries[oldest_key]
+            keep = [i for i in range(len(items)) if i != oldest_index]
+            if keep:
+                self._entries[oldest_key] = (matrix[keep], [items[i] for i in keep])
+            else:
+                del self._entries[oldest_key]
+            self._size -= 1
+
+    def stats(self) -> dict[str, int]:
+        """Get cache statistics: hits, misses and size"""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": self._size}
@@ -0,0 +1,200 @@
+//! Batch API
+//!
+//! Types for OpenAI-style batch jobs: requests are uploaded as a JSONL file,
+//! processed asynchronously by the provider, and read back as a JSONL file.
+
+use crate::api::completion::CompletionResponse;
+use crate::error::{LlmaoError, Result};
+use serde::{Deserialize, Serialize};
+
+/// Endpoint every request in a batch is sent to
+pub const BATCH_ENDPOINT: &str = "/v1/chat/completions";
+
+/// How long the provider may take to finish a batch
+pub const BATCH_COMPLETION_WINDOW: &str = "24h";
+
+/// One line of a batch input file
+#[derive(Debug, Serialize)]
+struct BatchRequestLine<'a> {
+    custom_id: String,
+    method: &'static str,
+    url: &'static str,
+    body: &'a serde_json::Value,
+}
+
+/// Build a batch input file, one request per line
+///
+/// Each request's `custom_id` is its index in `bodies`.
+pub fn build_batch_input(bodies: &[serde_json::Value]) -> Result<Vec<u8>> {
+    let mut jsonl = Vec::new();
+    for (i, body) in bodies.iter().enumerate() {
+        serde_json::to_writer(
+            &mut jsonl,
+            &BatchRequestLine {
+                custom_id: i.to_string(),
+                method: "POST",
+                url: BATCH_ENDPOINT,
+                body,
+            },
+        )?;
+        jsonl.push(b'\n');
+    }
+    Ok(jsonl)
+}
+
+/// A batch job as reported by the provider
+#[derive(Debug, Clone, Serialize, Deserialize)]
+pub struct BatchJob {
+    /// Batch ID
+    pub id: String,
+
+    /// Status: "validating", "in_progress", "finalizing", "completed",
+    /// "failed", "expired", "cancelling" or "cancelled"
+    pub status: String,
+
+    /// File with the successful results (once completed)
+    #[serde(default, skip_serializing_if = "Option::is_none")]
+    pub output_file_id: Option<String>,
+
+    /// File with the failed requests (if any)
+    #[serde(default, skip_serializing_if = "Option::is_none")]
+    pub error_file_id: Option<String>,
+
+    /// Request counts (total, completed, failed)
+    #[serde(default, skip_serializing_if = "Option::is_none")]
+    pub request_counts: Option<BatchRequestCounts>,
+}
+
+/// Progress counters for a batch job
+#[derive(Debug, Clone, Default, Serialize, Deserialize)]
+pub struct BatchRequestCounts {
+    #[serde(default)]
+    pub total: u32,
+    #[serde(default)]
+    pub completed: u32,
+    #[serde(default)]
+    pub failed: u32,
+}
+
+impl BatchJob {
+    /// Check if the job has stopped and will not change anymore
+    pub fn is_finished(&self) -> bool {
+        matches!(
+            self.status.as_str(),
+            "completed" | "failed" | "expired" | "cancelled"
+        )
+    }
+}
+
+/// One line of a batch output or error file
+#[derive(Debug, Deserialize)]
+struct BatchOutputLine {
+    custom_id: String,
+    #[serde(default)]
+    response: Option<BatchOutputResponse>,
+    #[serde(default)]
+    error: Option<serde_json::Value>,
+}
+
+/// The HTTP response recorded for one batch request
+#[derive(Debug, Deserialize)]
+struct BatchOutputResponse {
+    status_code: u16,
+    body: serde_json::Value,
+}
+
+/// Result of one request in a batch
+#[derive(Debug)]
+pub struct BatchResult {
+    /// Index of the request in the submitted batch
+    pub custom_id: String,
+
+    /// The completion, or why the request failed
+    pub result: Result<CompletionResponse>,
+}
+
+/// Parse a batch output or error file
+pub fn parse_batch_output(jsonl: &[u8]) -> Result<Vec<BatchResult>> {
+    let mut results = Vec::new();
+    for line in jsonl.split(|&b| b == b'\n') {
+        if line.iter().all(u8::is_ascii_whitespace) {
+            continue;
+        }
+
+        let line: BatchOutputLine = crate::api::json::from_slice(line)
+            .map_err(|e| LlmaoError::Response(format!("Failed to parse batch output: {}", e)))?;
+
+        let result = match (line.response, line.error) {
+            (Some(response), None) if response.status_code == 200 => {
+                serde_json::from_value(response.body).map_err(|e| {
+                    LlmaoError::Response(format!("Failed to parse batch response: {}", e))
+                })
+            }
+            (Some(response), _) => Err(LlmaoError::Request(format!(
+                "Batch request failed with status {}: {}",
+                response.status_code, response.body
+            ))),
+            (None, error) => Err(LlmaoError::Request(format!(
+                "Batch request failed: {}",
+                error.unwrap_or_default()
+            ))),
+        };
+
+        results.push(BatchResult {
+            custom_id: line.custom_id,
+            result,
+        });
+    }
+    Ok(results)
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_build_batch_input() {
+        let bodies = vec![
+            serde_json::json!({"model": "gpt-4o-mini", "messages": []}),
+            serde_json::json!({"model": "gpt-4o-mini", "messages": []}),
+        ];
+        let jsonl = String::from_utf8(build_batch_input(&bodies).unwrap()).unwrap();
+        let lines: Vec<serde_json::Value> = jsonl
+            .lines()
+            .map(|l| serde_json::from_str(l).unwrap())
+            .collect();
+
+        assert_eq!(lines.len(), 2);
+        assert_eq!(lines[1]["custom_id"], "1");
+        assert_eq!(lines[1]["url"], BATCH_ENDPOINT);
+        assert_eq!(lines[1]["body"]["model"], "gpt-4o-mini");
+    }
+
+    #[test]
+    fn test_parse_batch_output() {
+        let jsonl = br#"{"id":"r1","custom_id":"1","response":{"status_code":200,"body":{"id":"c1","object":"chat.completion","created":1,"model":"m","choices":[{"index":0,"message":{"role":"assistant","content":"Hi"},"finish_reason":"stop"}]}},"error":null}
+{"id":"r0","custom_id":"0","response":{"status_code":400,"body":{"error":"bad"}},"error":null}
+"#;
+        let results = parse_batch_output(jsonl).unwrap();
+
+        assert_eq!(results.len(), 2);
+        assert_eq!(results[0].custom_id, "1");
+        assert_eq!(
+            results[0].result.as_ref().unwrap().content(),
+            Some("Hi".to_string())
+        );
+        assert!(results[1].result.is_err());
+    }
+
+    #[test]
+    fn test_batch_job_finished() {
+        let job: BatchJob =
+            serde_json::from_str(r#"{"id":"batch_1","status":"in_progress"}"#).unwrap();
+        assert!(!job.is_finished());
+
+        let job: BatchJob =
+            serde_json::from_str(r#"{"id":"batch_1","status":"completed","output_file_id":"f"}"#)
+                .unwrap();
+        assert!(job.is_finished());
+    }
+}
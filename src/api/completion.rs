@@ -32,6 +32,31 @@ pub struct Message {
     pub tool_call_id: Option<String>,
 }
 
+impl Message {
+    /// Create a plain text message
+    pub fn text(role: &str, content: impl Into<String>) -> Self {
+        Self {
+            role: role.to_string(),
+            content: MessageContent::Text(content.into()),
+            reasoning: None,
+            name: None,
+            tool_calls: None,
+            tool_call_id: None,
+        }
+    }
+
+    /// Get the text to show for this message: the content, or the reasoning
+    /// if the content is empty
+    pub fn text_or_reasoning(&self) -> String {
+        let content = self.content.to_string_content();
+        if content.is_empty() {
+            self.reasoning.clone().unwrap_or_default()
+        } else {
+            content
+        }
+    }
+}
+
 /// Message content - can be a simple string or array of parts
 #[derive(Debug, Clone, Serialize, Deserialize)]
 #[serde(untagged)]
@@ -171,6 +196,10 @@ pub struct CompletionRequest {
     #[serde(skip_serializing_if = "Option::is_none")]
     pub tool_choice: Option<ToolChoice>,
 
+    /// Whether the response may be cached (None: only if deterministic); never sent
+    #[serde(skip)]
+    pub cache: Option<bool>,
+
     /// Additional parameters (provider-specific)
     #[serde(flatten)]
     pub extra: HashMap<String, serde_json::Value>,
@@ -192,6 +221,7 @@ impl CompletionRequest {
             stream: None,
             tools: None,
             tool_choice: None,
+            cache: None,
             extra: HashMap::new(),
         }
     }
@@ -214,6 +244,12 @@ impl CompletionRequest {
         self
     }
 
+    /// Opt in to (or out of) response caching, regardless of temperature
+    pub fn with_cache(mut self, cache: bool) -> Self {
+        self.cache = Some(cache);
+        self
+    }
+
     /// Convert content lists to strings for providers that don't support arrays
     pub fn convert_content_to_strings(&mut self) {
         for message in &mut self.messages {
@@ -340,6 +376,12 @@ impl CompletionResponse {
             .map(|c| c.message.content.to_string_content())
     }
 
+    /// Get the first message's text, falling back to its reasoning if the
+    /// content is empty (see `Message::text_or_reasoning`)
+    pub fn text(&self) -> Option<String> {
+        self.choices.first().map(|c| c.message.text_or_reasoning())
+    }
+
     /// Get tool calls from the first choice
     pub fn tool_calls(&self) -> Option<&Vec<ToolCall>> {
         self.choices
@@ -348,6 +390,94 @@ impl CompletionResponse {
     }
 }
 
+/// Legacy text completion response (from the `/completions` endpoint)
+#[derive(Debug, Clone, Serialize, Deserialize)]
+pub struct TextCompletionResponse {
+    /// Response ID
+    pub id: String,
+
+    /// Object type
+    #[serde(default)]
+    pub object: String,
+
+    /// Creation timestamp
+    pub created: u64,
+
+    /// Model used
+    pub model: String,
+
+    /// Response choices
+    pub choices: Vec<TextChoice>,
+
+    /// Token usage (for the whole request)
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub usage: Option<Usage>,
+}
+
+/// A choice in a legacy text completion response
+#[derive(Debug, Clone, Serialize, Deserialize)]
+pub struct TextChoice {
+    /// Choice index
+    pub index: u32,
+
+    /// Generated text
+    pub text: String,
+
+    /// Finish reason
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub finish_reason: Option<String>,
+}
+
+impl TextCompletionResponse {
+    /// Split a multi-prompt response into one chat-style response per prompt
+    ///
+    /// Choices are indexed `prompt_index * n + sample_index`, so each prompt gets
+    /// its `n` samples back in order. Usage covers the whole request and can't be
+    /// split, so it is attached to the first response only; summing usage over
+    /// the responses gives the request's total.
+    pub fn split_by_prompt(self, prompt_count: usize, n: usize) -> Vec<CompletionResponse> {
+        let n = n.max(1);
+        let mut responses: Vec<CompletionResponse> = (0..prompt_count)
+            .map(|_| CompletionResponse {
+                id: self.id.clone(),
+                object: "chat.completion".to_string(),
+                created: self.created,
+                model: self.model.clone(),
+                choices: Vec::new(),
+                usage: None,
+            })
+            .collect();
+
+        for choice in self.choices {
+            let index = choice.index as usize;
+            if let Some(response) = responses.get_mut(index / n) {
+                response.choices.push(Choice {
+                    index: (index % n) as u32,
+                    message: Message {
+                        role: "assistant".to_string(),
+                        content: MessageContent::Text(choice.text),
+                        reasoning: None,
+                        name: None,
+                        tool_calls: None,
+                        tool_call_id: None,
+                    },
+                    finish_reason: choice.finish_reason,
+                });
+            }
+        }
+
+        for response in &mut responses {
+            response.choices.sort_by_key(|c| c.index);
+        }
+
+        if let Some(first) = responses.first_mut() {
+            first.usage = self.usage;
+        }
+
+        responses
+    }
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
@@ -421,4 +551,53 @@ mod tests {
         assert_eq!(response.content(), Some("Hello!".to_string()));
         assert_eq!(response.usage.unwrap().total_tokens, 15);
     }
+
+    #[test]
+    fn test_completion_text_falls_back_to_reasoning() {
+        let json = r#"{
+            "id": "chatcmpl-123",
+            "object": "chat.completion",
+            "created": 1677652288,
+            "model": "gpt-oss-120b",
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": "", "reasoning": "Jakarta"},
+                "finish_reason": "stop"
+            }]
+        }"#;
+
+        let response: CompletionResponse = serde_json::from_str(json).unwrap();
+        assert_eq!(response.content(), Some(String::new()));
+        assert_eq!(response.text(), Some("Jakarta".to_string()));
+
+        let message = Message::text("assistant", "Hello!");
+        assert_eq!(message.text_or_reasoning(), "Hello!");
+    }
+
+    #[test]
+    fn test_text_completion_split_by_prompt() {
+        let json = r#"{
+            "id": "cmpl-123",
+            "object": "text_completion",
+            "created": 1677652288,
+            "model": "gpt-3.5-turbo-instruct",
+            "choices": [
+                {"index": 1, "text": "Jakarta", "finish_reason": "stop"},
+                {"index": 0, "text": "Hi!", "finish_reason": "stop"}
+            ],
+            "usage": {"prompt_tokens": 10, "completion_tokens": 4, "total_tokens": 14}
+        }"#;
+
+        let response: TextCompletionResponse = serde_json::from_str(json).unwrap();
+        let split = response.split_by_prompt(2, 1);
+
+        assert_eq!(split.len(), 2);
+        assert_eq!(split[0].content(), Some("Hi!".to_string()));
+        assert_eq!(split[1].content(), Some("Jakarta".to_string()));
+        assert_eq!(split[1].choices[0].index, 0);
+
+        // The request's usage goes to the first response only
+        assert_eq!(split[0].usage.as_ref().unwrap().total_tokens, 14);
+        assert!(split[1].usage.is_none());
+    }
 }
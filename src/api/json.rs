@@ -0,0 +1,84 @@
+//! JSON Parsing
+//!
+//! Deserialization for provider responses. With the `simd` feature, parsing
+//! uses simd-json (AVX2, SSE4.2 or NEON, detected at runtime); otherwise
+//! serde_json.
+
+use crate::error::LlmaoError;
+use bytes::Bytes;
+use serde::de::DeserializeOwned;
+
+/// Error returned by `from_slice`
+#[cfg(feature = "simd")]
+pub type Error = simd_json::Error;
+
+/// Error returned by `from_slice`
+#[cfg(not(feature = "simd"))]
+pub type Error = serde_json::Error;
+
+/// Deserialize a value from JSON bytes
+#[cfg(feature = "simd")]
+pub fn from_slice<T: DeserializeOwned>(bytes: &[u8]) -> std::result::Result<T, Error> {
+    // simd-json parses in place, so it needs its own mutable copy
+    let mut buffer = bytes.to_vec();
+    simd_json::serde::from_slice(&mut buffer)
+}
+
+/// Deserialize a value from JSON bytes
+#[cfg(not(feature = "simd"))]
+pub fn from_slice<T: DeserializeOwned>(bytes: &[u8]) -> std::result::Result<T, Error> {
+    serde_json::from_slice(bytes)
+}
+
+/// Deserialize a response body, taking ownership of it
+///
+/// With the `simd` feature the body is parsed in place, without the copy
+/// `from_slice` needs, as long as nothing else holds a reference to it.
+#[cfg(feature = "simd")]
+pub fn from_body<T: DeserializeOwned>(body: Bytes) -> crate::error::Result<T> {
+    let mut buffer = Vec::from(body);
+    let result = simd_json::serde::from_slice(&mut buffer);
+    result.map_err(|e| body_error(e, &buffer))
+}
+
+/// Deserialize a response body, taking ownership of it
+#[cfg(not(feature = "simd"))]
+pub fn from_body<T: DeserializeOwned>(body: Bytes) -> crate::error::Result<T> {
+    serde_json::from_slice(&body).map_err(|e| body_error(e, &body))
+}
+
+/// Error for a response body that failed to parse, with the start of the body
+fn body_error(error: Error, body: &[u8]) -> LlmaoError {
+    LlmaoError::Response(format!(
+        "Failed to parse response: {}. Body: {}",
+        error,
+        String::from_utf8_lossy(&body[..body.len().min(500)])
+    ))
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use crate::api::CompletionResponse;
+
+    #[test]
+    fn test_from_slice() {
+        let json = br#"{"id":"c1","object":"chat.completion","created":1,"model":"m","choices":[{"index":0,"message":{"role":"assistant","content":"Hi"},"finish_reason":"stop"}]}"#;
+        let response: CompletionResponse = from_slice(json).unwrap();
+        assert_eq!(response.content(), Some("Hi".to_string()));
+
+        assert!(from_slice::<CompletionResponse>(b"{not json").is_err());
+    }
+
+    #[test]
+    fn test_from_body() {
+        let body = Bytes::from_static(
+            br#"{"id":"c1","object":"chat.completion","created":1,"model":"m","choices":[]}"#,
+        );
+        let response: CompletionResponse = from_body(body).unwrap();
+        assert_eq!(response.id, "c1");
+
+        let error = from_body::<CompletionResponse>(Bytes::from_static(b"<html>502</html>"));
+        assert!(error.unwrap_err().to_string().contains("<html>502</html>"));
+    }
+}
@@ -2,11 +2,17 @@
 //!
 //! Chat completion API types and streaming support.
 
+pub mod batch;
 pub mod completion;
+pub mod json;
 pub mod streaming;
 
+pub use batch::{BatchJob, BatchRequestCounts, BatchResult};
 pub use completion::{
     Choice, CompletionRequest, CompletionResponse, ContentPart, FunctionCall, FunctionDefinition,
-    ImageUrl, Message, MessageContent, Tool, ToolCall, ToolChoice, Usage,
+    ImageUrl, Message, MessageContent, TextChoice, TextCompletionResponse, Tool, ToolCall,
+    ToolChoice, Usage,
+};
+pub use streaming::{
+    parse_sse_line, SseDecoder, StreamAccumulator, StreamChoice, StreamChunk, StreamDelta,
 };
-pub use streaming::{parse_sse_line, StreamAccumulator, StreamChoice, StreamChunk, StreamDelta};
@@ -242,8 +242,8 @@ pub fn parse_sse_line(line: &str) -> Result<Option<StreamChunk>> {
         return Ok(None);
     }
 
-    // Parse data: prefix
-    if let Some(data) = line.strip_prefix("data: ") {
+    // Parse data: prefix (the space after the colon is optional)
+    if let Some(data) = line.strip_prefix("data:") {
         let data = data.trim();
 
         // Check for [DONE] signal
@@ -252,7 +252,7 @@ pub fn parse_sse_line(line: &str) -> Result<Option<StreamChunk>> {
         }
 
         // Parse JSON
-        let chunk: StreamChunk = serde_json::from_str(data).map_err(|e| {
+        let chunk: StreamChunk = crate::api::json::from_slice(data.as_bytes()).map_err(|e| {
             LlmaoError::Stream(format!("Failed to parse SSE chunk: {}. Data: {}", e, data))
         })?;
 
@@ -263,6 +263,45 @@ pub fn parse_sse_line(line: &str) -> Result<Option<StreamChunk>> {
     Ok(None)
 }
 
+/// Incremental SSE decoder
+///
+/// Buffers raw bytes and only decodes complete lines, so multi-byte UTF-8
+/// characters split across network chunks are reassembled intact.
+#[derive(Debug, Default)]
+pub struct SseDecoder {
+    buffer: Vec<u8>,
+}
+
+impl SseDecoder {
+    /// Create an empty decoder
+    pub fn new() -> Self {
+        Self::default()
+    }
+
+    /// Feed bytes from the network, returning every chunk completed by them
+    pub fn push(&mut self, bytes: &[u8]) -> Result<Vec<StreamChunk>> {
+        self.buffer.extend_from_slice(bytes);
+
+        let mut chunks = Vec::new();
+        let mut start = 0;
+        while let Some(pos) = self.buffer[start..].iter().position(|&b| b == b'\n') {
+            let line = String::from_utf8_lossy(&self.buffer[start..start + pos]);
+            if let Some(chunk) = parse_sse_line(&line)? {
+                chunks.push(chunk);
+            }
+            start += pos + 1;
+        }
+        self.buffer.drain(..start);
+
+        Ok(chunks)
+    }
+
+    /// Parse whatever is left once the stream ends
+    pub fn finish(self) -> Result<Option<StreamChunk>> {
+        parse_sse_line(&String::from_utf8_lossy(&self.buffer))
+    }
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
@@ -282,6 +321,22 @@ mod tests {
         assert!(parse_sse_line(line).unwrap().is_none());
     }
 
+    #[test]
+    fn test_sse_decoder_split_chunks() {
+        let line = "data: {\"id\":\"c\",\"object\":\"chat.completion.chunk\",\"created\":1,\"model\":\"m\",\"choices\":[{\"index\":0,\"delta\":{\"content\":\"héllo\"}}]}\n\n";
+        let bytes = line.as_bytes();
+        // Split inside the two-byte 'é'
+        let split = line.find('é').unwrap() + 1;
+
+        let mut decoder = SseDecoder::new();
+        assert!(decoder.push(&bytes[..split]).unwrap().is_empty());
+        let chunks = decoder.push(&bytes[split..]).unwrap();
+
+        assert_eq!(chunks.len(), 1);
+        assert_eq!(chunks[0].choices[0].delta.content.as_deref(), Some("héllo"));
+        assert!(decoder.finish().unwrap().is_none());
+    }
+
     #[test]
     fn test_stream_accumulator() {
         let mut acc = StreamAccumulator::new();
@@ -0,0 +1,7 @@
+//! Cache Module
+//!
+//! In-process caching of completion responses.
+
+pub mod response;
+
+pub use response::{CacheStats, ResponseCache};
@@ -0,0 +1,289 @@
+//! Response Cache
+//!
+//! Exact-match LRU cache for deterministic completion requests.
+
+use crate::api::{CompletionRequest, CompletionResponse};
+use crate::error::Result;
+use parking_lot::Mutex;
+use std::collections::HashMap;
+use std::sync::atomic::{AtomicU64, Ordering};
+use std::time::{Duration, Instant};
+
+/// A cached response with bookkeeping for expiry and LRU eviction
+#[derive(Debug)]
+struct CacheEntry {
+    /// The cached response
+    response: CompletionResponse,
+
+    /// When the entry was stored
+    inserted_at: Instant,
+
+    /// Logical timestamp of last access (for LRU eviction)
+    last_used: u64,
+}
+
+/// In-memory LRU cache of completion responses with a TTL
+#[derive(Debug)]
+pub struct ResponseCache {
+    /// Cached entries keyed by the canonical request JSON
+    entries: Mutex<HashMap<String, CacheEntry>>,
+
+    /// Maximum number of entries
+    capacity: usize,
+
+    /// How long an entry stays valid
+    ttl: Duration,
+
+    /// Logical clock for LRU ordering
+    clock: AtomicU64,
+
+    /// Number of lookups served from the cache
+    hits: AtomicU64,
+
+    /// Number of lookups that missed
+    misses: AtomicU64,
+}
+
+impl ResponseCache {
+    /// Create a new cache
+    pub fn new(capacity: usize, ttl: Duration) -> Self {
+        Self {
+            entries: Mutex::new(HashMap::new()),
+            capacity: capacity.max(1),
+            ttl,
+            clock: AtomicU64::new(0),
+            hits: AtomicU64::new(0),
+            misses: AtomicU64::new(0),
+        }
+    }
+
+    /// Check whether a request's response may be cached
+    ///
+    /// Non-streaming requests are cached when they opt in with `cache`, or by
+    /// default when they are deterministic (`temperature <= 0`).
+    pub fn is_cacheable(request: &CompletionRequest) -> bool {
+        request.stream != Some(true)
+            && request
+                .cache
+                .unwrap_or_else(|| request.temperature.is_some_and(|t| t <= 0.0))
+    }
+
+    /// Build the cache key for a request to `model` ("provider/model")
+    ///
+    /// The key is the request serialized with sorted object keys, so it covers
+    /// model, messages, sampling params and any extra kwargs exactly.
+    pub fn key(model: &str, request: &CompletionRequest) -> Result<String> {
+        let mut value = serde_json::to_value(request)?;
+        if let Some(obj) = value.as_object_mut() {
+            obj.insert(
+                "model".to_string(),
+                serde_json::Value::String(model.to_string()),
+            );
+        }
+        Ok(serde_json::to_string(&value)?)
+    }
+
+    /// Look up a cached response
+    pub fn get(&self, key: &str) -> Option<CompletionResponse> {
+        let hit = self.lookup(key);
+        if hit.is_none() {
+            self.misses.fetch_add(1, Ordering::Relaxed);
+        }
+        hit
+    }
+
+    /// Look up a cached response, counting it only if it hits
+    ///
+    /// For checks made ahead of a request, whose own `get` counts the miss.
+    pub fn lookup(&self, key: &str) -> Option<CompletionResponse> {
+        let mut entries = self.entries.lock();
+
+        let hit = match entries.get_mut(key) {
+            Some(entry) if entry.inserted_at.elapsed() < self.ttl => {
+                entry.last_used = self.clock.fetch_add(1, Ordering::Relaxed);
+                Some(entry.response.clone())
+            }
+            Some(_) => {
+                entries.remove(key);
+                None
+            }
+            None => None,
+        };
+
+        if hit.is_some() {
+            self.hits.fetch_add(1, Ordering::Relaxed);
+        }
+        hit
+    }
+
+    /// Store a response, evicting the least recently used entry if full
+    pub fn insert(&self, key: String, response: CompletionResponse) {
+        let mut entries = self.entries.lock();
+
+        if entries.len() >= self.capacity && !entries.contains_key(&key) {
+            // Drop expired entries first, then fall back to LRU
+            entries.retain(|_, e| e.inserted_at.elapsed() < self.ttl);
+            if entries.len() >= self.capacity {
+                if let Some(oldest) = entries
+                    .iter()
+                    .min_by_key(|(_, e)| e.last_used)
+                    .map(|(k, _)| k.clone())
+                {
+                    entries.remove(&oldest);
+                }
+            }
+        }
+
+        entries.insert(
+            key,
+            CacheEntry {
+                response,
+                inserted_at: Instant::now(),
+                last_used: self.clock.fetch_add(1, Ordering::Relaxed),
+            },
+        );
+    }
+
+    /// Remove all entries (statistics are kept)
+    pub fn clear(&self) {
+        self.entries.lock().clear();
+    }
+
+    /// Get statistics about the cache
+    pub fn stats(&self) -> CacheStats {
+        CacheStats {
+            hits: self.hits.load(Ordering::Relaxed),
+            misses: self.misses.load(Ordering::Relaxed),
+            size: self.entries.lock().len(),
+        }
+    }
+}
+
+/// Statistics about a response cache
+#[derive(Debug, Clone, Default)]
+pub struct CacheStats {
+    pub hits: u64,
+    pub misses: u64,
+    pub size: usize,
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use crate::api::{Message, MessageContent};
+
+    fn request(content: &str, temperature: Option<f32>) -> CompletionRequest {
+        let mut request = CompletionRequest::new(
+            "openai/gpt-4".to_string(),
+            vec![Message {
+                role: "user".to_string(),
+                content: MessageContent::Text(content.to_string()),
+                reasoning: None,
+                name: None,
+                tool_calls: None,
+                tool_call_id: None,
+            }],
+        );
+        request.temperature = temperature;
+        request
+    }
+
+    fn response(id: &str) -> CompletionResponse {
+        CompletionResponse {
+            id: id.to_string(),
+            object: "chat.completion".to_string(),
+            created: 0,
+            model: "gpt-4".to_string(),
+            choices: vec![],
+            usage: None,
+        }
+    }
+
+    #[test]
+    fn test_is_cacheable() {
+        assert!(ResponseCache::is_cacheable(&request("Hello", Some(0.0))));
+        assert!(!ResponseCache::is_cacheable(&request("Hello", Some(0.7))));
+        assert!(!ResponseCache::is_cacheable(&request("Hello", None)));
+
+        let streaming = request("Hello", Some(0.0)).with_stream(true);
+        assert!(!ResponseCache::is_cacheable(&streaming));
+
+        // Explicit opt-in and opt-out win over the temperature
+        assert!(ResponseCache::is_cacheable(
+            &request("Hello", Some(0.7)).with_cache(true)
+        ));
+        assert!(ResponseCache::is_cacheable(
+            &request("Hello", None).with_cache(true)
+        ));
+        assert!(!ResponseCache::is_cacheable(
+            &request("Hello", Some(0.0)).with_cache(false)
+        ));
+    }
+
+    #[test]
+    fn test_cache_flag_is_not_part_of_the_key() {
+        let key = ResponseCache::key("openai/gpt-4", &request("Hello", Some(0.7))).unwrap();
+        let opted_in = request("Hello", Some(0.7)).with_cache(true);
+
+        assert_eq!(ResponseCache::key("openai/gpt-4", &opted_in).unwrap(), key);
+        assert!(!key.contains("cache"));
+    }
+
+    #[test]
+    fn test_hit_and_miss() {
+        let cache = ResponseCache::new(10, Duration::from_secs(60));
+        let key = ResponseCache::key("openai/gpt-4", &request("Hello", Some(0.0))).unwrap();
+        let other = ResponseCache::key("openai/gpt-4", &request("Bye", Some(0.0))).unwrap();
+        let other_provider =
+            ResponseCache::key("groq/gpt-4", &request("Hello", Some(0.0))).unwrap();
+
+        assert!(cache.get(&key).is_none());
+        cache.insert(key.clone(), response("a"));
+
+        assert_eq!(cache.get(&key).unwrap().id, "a");
+        assert!(cache.get(&other).is_none());
+        assert!(cache.get(&other_provider).is_none());
+
+        let stats = cache.stats();
+        assert_eq!(stats.hits, 1);
+        assert_eq!(stats.misses, 3);
+        assert_eq!(stats.size, 1);
+    }
+
+    #[test]
+    fn test_lookup_counts_only_hits() {
+        let cache = ResponseCache::new(10, Duration::from_secs(60));
+
+        assert!(cache.lookup("key").is_none());
+        cache.insert("key".to_string(), response("a"));
+        assert_eq!(cache.lookup("key").unwrap().id, "a");
+
+        let stats = cache.stats();
+        assert_eq!(stats.hits, 1);
+        assert_eq!(stats.misses, 0);
+    }
+
+    #[test]
+    fn test_expired_entries_miss() {
+        let cache = ResponseCache::new(10, Duration::ZERO);
+        cache.insert("key".to_string(), response("a"));
+
+        assert!(cache.get("key").is_none());
+        assert_eq!(cache.stats().size, 0);
+    }
+
+    #[test]
+    fn test_lru_eviction() {
+        let cache = ResponseCache::new(2, Duration::from_secs(60));
+        cache.insert("a".to_string(), response("a"));
+        cache.insert("b".to_string(), response("b"));
+
+        // Touch "a" so "b" becomes least recently used
+        cache.get("a");
+        cache.insert("c".to_string(), response("c"));
+
+        assert!(cache.get("a").is_some());
+        assert!(cache.get("b").is_none());
+        assert!(cache.get("c").is_some());
+    }
+}
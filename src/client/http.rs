@@ -4,9 +4,10 @@
 
 use crate::client::rate_limiter::RateLimitTracker;
 use crate::error::{LlmaoError, Result};
-use backoff::ExponentialBackoff;
+use backoff::backoff::Backoff;
+use backoff::{ExponentialBackoff, ExponentialBackoffBuilder};
 use futures::Stream;
-use reqwest::header::{HeaderMap, HeaderValue, AUTHORIZATION, CONTENT_TYPE};
+use reqwest::header::HeaderMap;
 use reqwest::{Client, StatusCode};
 use serde::de::DeserializeOwned;
 use serde::Serialize;
@@ -29,7 +30,13 @@ impl HttpClient {
         let client = Client::builder()
             .timeout(Duration::from_secs(300)) // 5 minute timeout for long completions
             .connect_timeout(Duration::from_secs(10))
+            // Keep warm connections around so repeated calls skip the TCP + TLS handshake.
+            // HTTP/2 is negotiated via ALPN, letting concurrent requests share one socket.
+            // Idle sockets are capped and dropped after 30s so bursty, long-running
+            // workers don't hold file descriptors between bursts.
             .pool_max_idle_per_host(10)
+            .pool_idle_timeout(Duration::from_secs(30))
+            .tcp_keepalive(Duration::from_secs(60))
             .build()
             .map_err(|e| LlmaoError::Internal(format!("Failed to create HTTP client: {}", e)))?;
 
@@ -45,12 +52,13 @@ impl HttpClient {
     }
 
     /// Make a POST request with retry logic
+    ///
+    /// `headers` are the key's precomputed JSON request headers (see `ApiKey::json_headers`).
     pub async fn post_with_retry<T, R>(
         &self,
         url: &str,
         body: &T,
-        api_key: &str,
-        extra_headers: Option<&HeaderMap>,
+        headers: &HeaderMap,
         provider: &str,
         max_retries: u32,
     ) -> Result<R>
@@ -58,31 +66,23 @@ impl HttpClient {
         T: Serialize,
         R: DeserializeOwned,
     {
-        let mut headers = HeaderMap::new();
-        headers.insert(CONTENT_TYPE, HeaderValue::from_static("application/json"));
-        headers.insert(
-            AUTHORIZATION,
-            HeaderValue::from_str(&format!("Bearer {}", api_key))
-                .map_err(|e| LlmaoError::Config(format!("Invalid API key format: {}", e)))?,
-        );
-
-        // Add extra headers
-        if let Some(extra) = extra_headers {
-            for (key, value) in extra {
-                headers.insert(key.clone(), value.clone());
-            }
-        }
-
-        let body_json = serde_json::to_string(body)?;
-
-        let backoff = ExponentialBackoff {
-            max_elapsed_time: Some(Duration::from_secs(120)),
-            max_interval: Duration::from_secs(30),
-            initial_interval: Duration::from_millis(500),
-            multiplier: 2.0,
-            ..Default::default()
-        };
+        let body = bytes::Bytes::from(serde_json::to_vec(body)?);
+        self.post_bytes_with_retry(url, body, headers, provider, max_retries)
+            .await
+    }
 
+    /// Make a POST request with an already serialized JSON body, with retry logic
+    ///
+    /// `body` is reference counted, so retries resend it without copying.
+    pub async fn post_bytes_with_retry<R: DeserializeOwned>(
+        &self,
+        url: &str,
+        body: bytes::Bytes,
+        headers: &HeaderMap,
+        provider: &str,
+        max_retries: u32,
+    ) -> Result<R> {
+        let mut backoff = retry_backoff();
         let mut retries = 0;
 
         loop {
@@ -95,7 +95,7 @@ impl HttpClient {
                 .client
                 .post(url)
                 .headers(headers.clone())
-                .body(body_json.clone())
+                .body(body.clone())
                 .send()
                 .await;
 
@@ -108,32 +108,25 @@ impl HttpClient {
                         .update_from_response(provider, resp.headers(), None, None);
 
                     if status.is_success() {
-                        let body = resp.text().await?;
-                        return serde_json::from_str(&body).map_err(|e| {
-                            LlmaoError::Response(format!(
-                                "Failed to parse response: {}. Body: {}",
-                                e,
-                                &body[..body.len().min(500)]
-                            ))
-                        });
+                        // Parse straight from the raw bytes, skipping the UTF-8 String copy
+                        return crate::api::json::from_body(resp.bytes().await?);
                     }
 
+                    let retry_after = RateLimitTracker::parse_retry_after(resp.headers(), None);
                     let response_body = resp.text().await.unwrap_or_default();
 
-                    // Handle rate limit
+                    // Rate limits are per key; hand back to the caller so it can switch keys
                     if RateLimitTracker::is_rate_limit_error(status.as_u16(), &response_body) {
-                        // Parse headers from a new request since we consumed the response
+                        return Err(LlmaoError::RateLimited {
+                            provider: provider.to_string(),
+                            retry_after: retry_after.map(ceil_secs),
+                        });
+                    }
+
+                    // Server errors are usually transient; retry with the same key
+                    if status.is_server_error() && retries < max_retries {
                         retries += 1;
-                        if retries > max_retries {
-                            return Err(LlmaoError::RateLimited {
-                                provider: provider.to_string(),
-                                retry_after: None,
-                            });
-                        }
-
-                        // Wait with exponential backoff
-                        let wait = backoff.initial_interval * 2u32.pow(retries);
-                        tokio::time::sleep(wait).await;
+                        tokio::time::sleep(next_delay(&mut backoff)).await;
                         continue;
                     }
 
@@ -152,15 +145,10 @@ impl HttpClient {
                     )));
                 }
                 Err(e) => {
-                    retries += 1;
-                    if retries > max_retries {
-                        return Err(e.into());
-                    }
-
                     // Retry on connection errors
-                    if e.is_connect() || e.is_timeout() {
-                        let wait = backoff.initial_interval * 2u32.pow(retries);
-                        tokio::time::sleep(wait).await;
+                    if (e.is_connect() || e.is_timeout()) && retries < max_retries {
+                        retries += 1;
+                        tokio::time::sleep(next_delay(&mut backoff)).await;
                         continue;
                     }
 
@@ -175,28 +163,12 @@ impl HttpClient {
         &self,
         url: &str,
         body: &impl Serialize,
-        api_key: &str,
-        extra_headers: Option<&HeaderMap>,
+        headers: &HeaderMap,
         provider: &str,
     ) -> Result<Pin<Box<dyn Stream<Item = Result<bytes::Bytes>> + Send>>> {
         use async_stream::stream;
         use futures::StreamExt;
 
-        let mut headers = HeaderMap::new();
-        headers.insert(CONTENT_TYPE, HeaderValue::from_static("application/json"));
-        headers.insert(
-            AUTHORIZATION,
-            HeaderValue::from_str(&format!("Bearer {}", api_key))
-                .map_err(|e| LlmaoError::Config(format!("Invalid API key format: {}", e)))?,
-        );
-
-        // Add extra headers
-        if let Some(extra) = extra_headers {
-            for (key, value) in extra {
-                headers.insert(key.clone(), value.clone());
-            }
-        }
-
         // Check rate limits
         if let Some(wait) = self.rate_limiter.should_wait(provider) {
             tokio::time::sleep(wait).await;
@@ -205,7 +177,7 @@ impl HttpClient {
         let response = self
             .client
             .post(url)
-            .headers(headers)
+            .headers(headers.clone())
             .json(body)
             .send()
             .await?;
@@ -217,12 +189,13 @@ impl HttpClient {
             .update_from_response(provider, response.headers(), None, None);
 
         if !status.is_success() {
+            let retry_after = RateLimitTracker::parse_retry_after(response.headers(), None);
             let body = response.text().await.unwrap_or_default();
 
             if RateLimitTracker::is_rate_limit_error(status.as_u16(), &body) {
                 return Err(LlmaoError::RateLimited {
                     provider: provider.to_string(),
-                    retry_after: None,
+                    retry_after: retry_after.map(ceil_secs),
                 });
             }
 
@@ -242,6 +215,119 @@ impl HttpClient {
 
         Ok(Box::pin(s))
     }
+
+    /// Open a connection to a host ahead of the first real request
+    ///
+    /// Sends a HEAD request and ignores the outcome; the point is the TCP + TLS
+    /// handshake, after which the connection waits in the pool.
+    pub async fn prewarm(&self, url: &str) {
+        let _ = self
+            .client
+            .head(url)
+            .timeout(Duration::from_secs(10))
+            .send()
+            .await;
+    }
+
+    /// Make a GET request, returning the raw response body
+    pub async fn get_bytes(
+        &self,
+        url: &str,
+        headers: &HeaderMap,
+        provider: &str,
+    ) -> Result<bytes::Bytes> {
+        let response = self.client.get(url).headers(headers.clone()).send().await?;
+
+        let response = self.check_response(response, provider).await?;
+        Ok(response.bytes().await?)
+    }
+
+    /// Make a GET request and parse the JSON response
+    pub async fn get_json<R: DeserializeOwned>(
+        &self,
+        url: &str,
+        headers: &HeaderMap,
+        provider: &str,
+    ) -> Result<R> {
+        crate::api::json::from_body(self.get_bytes(url, headers, provider).await?)
+    }
+
+    /// POST a multipart form (e.g. a file upload) and parse the JSON response
+    pub async fn post_multipart<R: DeserializeOwned>(
+        &self,
+        url: &str,
+        form: reqwest::multipart::Form,
+        headers: &HeaderMap,
+        provider: &str,
+    ) -> Result<R> {
+        let response = self
+            .client
+            .post(url)
+            .headers(headers.clone())
+            .multipart(form)
+            .send()
+            .await?;
+
+        let body = self
+            .check_response(response, provider)
+            .await?
+            .bytes()
+            .await?;
+        crate::api::json::from_body(body)
+    }
+
+    /// Record rate limit headers and turn an unsuccessful response into an error
+    async fn check_response(
+        &self,
+        response: reqwest::Response,
+        provider: &str,
+    ) -> Result<reqwest::Response> {
+        let status = response.status();
+        self.rate_limiter
+            .update_from_response(provider, response.headers(), None, None);
+
+        if status.is_success() {
+            return Ok(response);
+        }
+
+        let retry_after = RateLimitTracker::parse_retry_after(response.headers(), None);
+        let body = response.text().await.unwrap_or_default();
+        if RateLimitTracker::is_rate_limit_error(status.as_u16(), &body) {
+            return Err(LlmaoError::RateLimited {
+                provider: provider.to_string(),
+                retry_after: retry_after.map(ceil_secs),
+            });
+        }
+        if status == StatusCode::UNAUTHORIZED || status == StatusCode::FORBIDDEN {
+            return Err(LlmaoError::Auth(format!("Authentication failed: {}", body)));
+        }
+        Err(LlmaoError::Request(format!(
+            "Request failed with status {}: {}",
+            status, body
+        )))
+    }
+}
+
+/// Backoff between retries: 500ms doubling up to 30s, each delay randomized
+/// by ±50% so clients that failed together don't retry in lockstep
+pub fn retry_backoff() -> ExponentialBackoff {
+    ExponentialBackoffBuilder::new()
+        .with_initial_interval(Duration::from_millis(500))
+        .with_multiplier(2.0)
+        .with_max_interval(Duration::from_secs(30))
+        .with_randomization_factor(0.5)
+        .with_max_elapsed_time(None)
+        .build()
+}
+
+/// Get the next delay from a retry backoff
+pub fn next_delay(backoff: &mut ExponentialBackoff) -> Duration {
+    backoff.next_backoff().unwrap_or(backoff.max_interval)
+}
+
+/// Round a retry-after duration up to whole seconds
+pub fn ceil_secs(duration: Duration) -> u64 {
+    duration.as_secs() + u64::from(duration.subsec_nanos() > 0)
 }
 
 impl Default for HttpClient {
@@ -259,4 +345,10 @@ mod tests {
         let client = HttpClient::new();
         assert!(client.is_ok());
     }
+
+    #[test]
+    fn test_ceil_secs() {
+        assert_eq!(ceil_secs(Duration::from_secs(2)), 2);
+        assert_eq!(ceil_secs(Duration::from_millis(500)), 1);
+    }
 }
@@ -6,4 +6,4 @@ pub mod http;
 pub mod rate_limiter;
 
 pub use http::HttpClient;
-pub use rate_limiter::RateLimitTracker;
+pub use rate_limiter::{RateLimitTracker, TokenBucket};
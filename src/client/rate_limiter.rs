@@ -5,6 +5,7 @@
 use parking_lot::RwLock;
 use reqwest::header::HeaderMap;
 use std::collections::HashMap;
+use std::sync::atomic::{AtomicU64, Ordering};
 use std::time::{Duration, Instant};
 
 /// Tracks rate limit status for providers
@@ -83,33 +84,32 @@ impl RateLimitTracker {
         let mut providers = self.providers.write();
         let info = providers.entry(provider.to_string()).or_default();
 
-        // Parse retry-after header
-        let retry_key = retry_after_header.unwrap_or("retry-after");
-        let retry_duration = if let Some(value) = headers.get(retry_key) {
-            if let Ok(s) = value.to_str() {
-                // Try parsing as seconds
-                if let Ok(secs) = s.parse::<u64>() {
-                    Some(Duration::from_secs(secs))
-                }
-                // Try parsing as duration string
-                else {
-                    parse_duration_string(s)
-                }
-            } else {
-                None
-            }
-        } else {
-            None
-        };
-
         // Default to 60 seconds if no header
-        let duration = retry_duration.unwrap_or(Duration::from_secs(60));
+        let duration =
+            Self::parse_retry_after(headers, retry_after_header).unwrap_or(Duration::from_secs(60));
         info.retry_after = Some(duration);
         info.reset_at = Some(Instant::now() + duration);
 
         duration
     }
 
+    /// Parse a retry-after header (default name: "retry-after")
+    ///
+    /// Accepts plain seconds or a duration string (e.g., "1m30s").
+    pub fn parse_retry_after(
+        headers: &HeaderMap,
+        retry_after_header: Option<&str>,
+    ) -> Option<Duration> {
+        let value = headers.get(retry_after_header.unwrap_or("retry-after"))?;
+        let s = value.to_str().ok()?;
+
+        // Try parsing as seconds, then as a duration string
+        match s.parse::<u64>() {
+            Ok(secs) => Some(Duration::from_secs(secs)),
+            Err(_) => parse_duration_string(s),
+        }
+    }
+
     /// Check if we should wait before making a request
     pub fn should_wait(&self, provider: &str) -> Option<Duration> {
         let providers = self.providers.read();
@@ -164,6 +164,71 @@ impl RateLimitTracker {
     }
 }
 
+/// Client-side token bucket enforcing a requests-per-minute limit
+///
+/// Holds up to one minute's worth of requests, so bursts go out immediately,
+/// and refills continuously. The bucket is tracked as the time the next
+/// request would be due if requests were evenly spaced (GCRA), which fits in
+/// a single atomic: taking a token is one compare-and-swap, and a caller that
+/// finds the bucket empty sleeps asynchronously until its token is due.
+#[derive(Debug)]
+pub struct TokenBucket {
+    /// Reference point for the stored time
+    epoch: Instant,
+
+    /// Time between tokens, in nanoseconds
+    interval: u64,
+
+    /// How far ahead of schedule a burst may run, in nanoseconds
+    burst: u64,
+
+    /// Nanoseconds since `epoch` at which the next evenly spaced request is due
+    next_due: AtomicU64,
+}
+
+impl TokenBucket {
+    /// Create a bucket allowing `requests_per_minute` requests (at least 1)
+    pub fn per_minute(requests_per_minute: u32) -> Self {
+        let capacity = u64::from(requests_per_minute.max(1));
+        let interval = 60_000_000_000 / capacity;
+        Self {
+            epoch: Instant::now(),
+            interval,
+            burst: interval * (capacity - 1),
+            next_due: AtomicU64::new(0),
+        }
+    }
+
+    /// Take a token, returning how long to wait before using it
+    ///
+    /// The token is reserved either way, so concurrent callers queue up
+    /// instead of all waking at once.
+    pub fn reserve(&self) -> Duration {
+        let now = self.epoch.elapsed().as_nanos() as u64;
+        let mut current = self.next_due.load(Ordering::Relaxed);
+        loop {
+            let due = current.max(now);
+            match self.next_due.compare_exchange_weak(
+                current,
+                due + self.interval,
+                Ordering::Relaxed,
+                Ordering::Relaxed,
+            ) {
+                Ok(_) => return Duration::from_nanos(due.saturating_sub(self.burst + now)),
+                Err(actual) => current = actual,
+            }
+        }
+    }
+
+    /// Wait until a token is available
+    pub async fn acquire(&self) {
+        let wait = self.reserve();
+        if !wait.is_zero() {
+            tokio::time::sleep(wait).await;
+        }
+    }
+}
+
 /// Parse a duration string like "1m30s" or "2h" into a Duration
 fn parse_duration_string(s: &str) -> Option<Duration> {
     let s = s.trim();
@@ -238,6 +303,22 @@ mod tests {
         );
     }
 
+    #[test]
+    fn test_token_bucket() {
+        let bucket = TokenBucket::per_minute(3);
+
+        // A full minute's worth goes out immediately
+        for _ in 0..3 {
+            assert!(bucket.reserve().is_zero());
+        }
+
+        // Then requests are spaced 20s apart
+        let wait = bucket.reserve();
+        assert!(wait > Duration::from_secs(19) && wait <= Duration::from_secs(20));
+        let wait = bucket.reserve();
+        assert!(wait > Duration::from_secs(39) && wait <= Duration::from_secs(40));
+    }
+
     #[test]
     fn test_is_rate_limit_error() {
         assert!(RateLimitTracker::is_rate_limit_error(429, ""));
@@ -2,10 +2,87 @@
 //!
 //! Handles loading and merging provider configurations from multiple sources.
 
-use crate::config::provider::ProvidersConfig;
+use crate::config::provider::{ProviderRegistry, ProvidersConfig};
 use crate::error::{LlmaoError, Result};
+use parking_lot::Mutex;
 use std::collections::HashMap;
 use std::path::{Path, PathBuf};
+use std::sync::OnceLock;
+use std::time::SystemTime;
+
+/// Built-in provider registry, parsed on first use
+static REGISTRY: OnceLock<std::result::Result<ProviderRegistry, String>> = OnceLock::new();
+
+/// Most config files kept parsed at once
+const FILE_CACHE_CAPACITY: usize = 32;
+
+/// Config files parsed so far, keyed by path
+///
+/// An entry is reused while the file's modification time and size are
+/// unchanged, so clients created from the same file skip the read and parse.
+/// Entries for deleted files are dropped and the least recently used one is
+/// evicted past `FILE_CACHE_CAPACITY`, so configs from temporary files (and
+/// the API keys in them) don't stay in memory for the life of the process.
+static FILE_CACHE: OnceLock<Mutex<FileCache>> = OnceLock::new();
+
+/// LRU cache of parsed config files
+#[derive(Default)]
+struct FileCache {
+    entries: HashMap<PathBuf, CachedFile>,
+
+    /// Logical clock for LRU ordering
+    clock: u64,
+}
+
+/// A parsed config file and the metadata of the file it was parsed from
+struct CachedFile {
+    modified: SystemTime,
+    len: u64,
+    config: ProvidersConfig,
+
+    /// Logical timestamp of last access (for LRU eviction)
+    last_used: u64,
+}
+
+impl FileCache {
+    /// Get the config parsed from `path`, if the file is unchanged since
+    fn get(&mut self, path: &Path, modified: SystemTime, len: u64) -> Option<ProvidersConfig> {
+        let entry = self
+            .entries
+            .get_mut(path)
+            .filter(|c| c.modified == modified && c.len == len)?;
+        self.clock += 1;
+        entry.last_used = self.clock;
+        Some(entry.config.clone())
+    }
+
+    /// Store the config parsed from `path`
+    fn insert(&mut self, path: PathBuf, modified: SystemTime, len: u64, config: ProvidersConfig) {
+        // Drop files that were deleted, then the least recently used if still full
+        self.entries.retain(|path, _| path.exists());
+        if self.entries.len() >= FILE_CACHE_CAPACITY && !self.entries.contains_key(&path) {
+            if let Some(oldest) = self
+                .entries
+                .iter()
+                .min_by_key(|(_, c)| c.last_used)
+                .map(|(p, _)| p.clone())
+            {
+                self.entries.remove(&oldest);
+            }
+        }
+
+        self.clock += 1;
+        self.entries.insert(
+            path,
+            CachedFile {
+                modified,
+                len,
+                config,
+                last_used: self.clock,
+            },
+        );
+    }
+}
 
 /// Configuration loader with support for multiple sources
 pub struct ConfigLoader {
@@ -64,14 +141,16 @@ impl ConfigLoader {
     }
 
     /// Load built-in provider registry from registry.json
+    ///
+    /// The registry is compiled in, so it is parsed once per process.
     fn load_provider_registry(&mut self) -> Result<()> {
-        let defaults = include_str!("../../registry.json");
-        let registry: crate::config::provider::ProviderRegistry = serde_json::from_str(defaults)
-            .map_err(|e| {
-                LlmaoError::Config(format!("Failed to parse built-in registry.json: {}", e))
-            })?;
+        let registry = REGISTRY.get_or_init(|| {
+            let defaults = include_str!("../../registry.json");
+            serde_json::from_str(defaults)
+                .map_err(|e| format!("Failed to parse built-in registry.json: {}", e))
+        });
 
-        self.provider_registry = registry;
+        self.provider_registry = registry.clone().map_err(LlmaoError::Config)?;
         Ok(())
     }
 
@@ -115,14 +194,39 @@ impl ConfigLoader {
     }
 
     /// Load configuration from a specific file
+    ///
+    /// Parsed files are cached; see `FILE_CACHE`.
     fn load_from_file(&mut self, path: impl AsRef<Path>) -> Result<()> {
         let path = path.as_ref();
-        let content = std::fs::read_to_string(path)
-            .map_err(|e| LlmaoError::Config(format!("Failed to read {}: {}", path.display(), e)))?;
+        let read_error = |e: std::io::Error| {
+            LlmaoError::Config(format!("Failed to read {}: {}", path.display(), e))
+        };
 
-        let config: ProvidersConfig = serde_json::from_str(&content).map_err(|e| {
-            LlmaoError::Config(format!("Failed to parse {}: {}", path.display(), e))
-        })?;
+        let metadata = std::fs::metadata(path).map_err(read_error)?;
+        let key = path.canonicalize().unwrap_or_else(|_| path.to_path_buf());
+        let cache = FILE_CACHE.get_or_init(Default::default);
+
+        // Without a modification time there is nothing to validate an entry against
+        let modified = metadata.modified().ok();
+        let cached = modified.and_then(|modified| cache.lock().get(&key, modified, metadata.len()));
+
+        let config = match cached {
+            Some(config) => config,
+            None => {
+                let content = std::fs::read(path).map_err(read_error)?;
+                let config: ProvidersConfig =
+                    crate::api::json::from_slice(&content).map_err(|e| {
+                        LlmaoError::Config(format!("Failed to parse {}: {}", path.display(), e))
+                    })?;
+
+                if let Some(modified) = modified {
+                    cache
+                        .lock()
+                        .insert(key, modified, metadata.len(), config.clone());
+                }
+                config
+            }
+        };
 
         self.merge_config(config);
         Ok(())
@@ -136,7 +240,7 @@ impl ConfigLoader {
     }
 
     /// Get the loaded provider registry
-    pub fn provider_registry(&self) -> &crate::config::provider::ProviderRegistry {
+    pub fn provider_registry(&self) -> &ProviderRegistry {
         &self.provider_registry
     }
 
@@ -191,6 +295,54 @@ mod tests {
         assert!(loader.config().contains_key("custom_provider/model-v1"));
     }
 
+    #[test]
+    fn test_config_file_cache() {
+        let mut file = NamedTempFile::new().unwrap();
+        writeln!(file, r#"{{"cached/model-v1": {{"keys": ["key1"]}}}}"#).unwrap();
+
+        let loader = ConfigLoader::from_path(file.path()).unwrap();
+        assert!(loader.config().contains_key("cached/model-v1"));
+        let loader = ConfigLoader::from_path(file.path()).unwrap();
+        assert!(loader.config().contains_key("cached/model-v1"));
+
+        // Changing the file invalidates the cached entry
+        std::fs::write(
+            file.path(),
+            r#"{"cached/model-v2": {"keys": ["key2", "key3"]}}"#,
+        )
+        .unwrap();
+        let loader = ConfigLoader::from_path(file.path()).unwrap();
+        assert!(loader.config().contains_key("cached/model-v2"));
+        assert!(!loader.config().contains_key("cached/model-v1"));
+    }
+
+    #[test]
+    fn test_config_file_cache_is_bounded() {
+        let cache = FILE_CACHE.get_or_init(Default::default);
+        let config_file = || {
+            let mut file = NamedTempFile::new().unwrap();
+            writeln!(file, r#"{{"temp/model-v1": {{"keys": ["key1"]}}}}"#).unwrap();
+            ConfigLoader::from_path(file.path()).unwrap();
+            file
+        };
+
+        // Deleted files are dropped the next time a file is parsed
+        let deleted = config_file();
+        let deleted_path = deleted.path().canonicalize().unwrap();
+        assert!(cache.lock().entries.contains_key(&deleted_path));
+        drop(deleted);
+        let _kept = config_file();
+        assert!(!cache.lock().entries.contains_key(&deleted_path));
+
+        // Files still on disk are evicted past the capacity
+        let files: Vec<_> = (0..FILE_CACHE_CAPACITY + 8)
+            .map(|_| config_file())
+            .collect();
+        assert!(cache.lock().entries.len() <= FILE_CACHE_CAPACITY);
+        let last = files.last().unwrap().path().canonicalize().unwrap();
+        assert!(cache.lock().entries.contains_key(&last));
+    }
+
     #[test]
     fn test_merge_configs() {
         let mut loader = ConfigLoader::new().unwrap();
@@ -208,6 +360,7 @@ mod tests {
                 headers: HashMap::new(),
                 param_mappings: HashMap::new(),
                 rate_limit: None,
+                special_handling: Default::default(),
             },
         );
 
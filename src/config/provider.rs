@@ -47,6 +47,17 @@ pub struct ModelConfig {
     /// Optional: Rate limit configuration
     #[serde(skip_serializing_if = "Option::is_none")]
     pub rate_limit: Option<RateLimitConfig>,
+
+    /// Optional: Special handling flags (for custom providers)
+    #[serde(default, skip_serializing_if = "SpecialHandling::is_default")]
+    pub special_handling: SpecialHandling,
+}
+
+impl ModelConfig {
+    /// Get the configured requests-per-minute limit, if any
+    pub fn requests_per_minute(&self) -> Option<u32> {
+        self.rate_limit.as_ref()?.requests_per_minute
+    }
 }
 
 /// Provider registry - maps provider names to their base configurations
@@ -159,8 +170,17 @@ pub struct SpecialHandling {
     pub add_text_to_tool_calls: bool,
 
     /// Use legacy completion endpoint instead of chat
+    /// (also lets `prompts=[...]` batches go out as a single request)
     #[serde(default)]
     pub use_legacy_completions: bool,
+
+    /// Supports explicit `cache_control` prompt caching markers (Anthropic-style)
+    #[serde(default)]
+    pub prompt_cache_control: bool,
+
+    /// Supports the OpenAI-style Batch API (`/files` + `/batches`)
+    #[serde(default)]
+    pub batch_api: bool,
 }
 
 impl SpecialHandling {
@@ -168,6 +188,8 @@ impl SpecialHandling {
         !self.convert_content_list_to_string
             && !self.add_text_to_tool_calls
             && !self.use_legacy_completions
+            && !self.prompt_cache_control
+            && !self.batch_api
     }
 }
 
@@ -207,6 +229,56 @@ impl ProviderConfig {
         keys
     }
 
+    /// Apply prompt caching if requested with a `cache_control` parameter
+    ///
+    /// The parameter is consumed here. It may be `true` (ephemeral cache) or an
+    /// explicit marker object. Providers with `prompt_cache_control` get the marker
+    /// on every system message and the last tool definition, which covers the
+    /// static prefix of the prompt. Other providers (e.g. OpenAI, which caches
+    /// long static prefixes automatically) need no markers.
+    pub fn apply_prompt_caching(&self, params: &mut serde_json::Value) {
+        let Some(obj) = params.as_object_mut() else {
+            return;
+        };
+
+        let marker = match obj.remove("cache_control") {
+            Some(serde_json::Value::Bool(true)) => serde_json::json!({"type": "ephemeral"}),
+            Some(marker @ serde_json::Value::Object(_)) => marker,
+            _ => return,
+        };
+
+        if !self.special_handling.prompt_cache_control {
+            return;
+        }
+
+        if let Some(messages) = obj.get_mut("messages").and_then(|m| m.as_array_mut()) {
+            for message in messages
+                .iter_mut()
+                .filter(|m| m.get("role").and_then(|r| r.as_str()) == Some("system"))
+            {
+                // Markers live on content parts, so promote plain strings to a text part
+                if let Some(text) = message.get("content").and_then(|c| c.as_str()) {
+                    message["content"] = serde_json::json!([{"type": "text", "text": text}]);
+                }
+                if let Some(last) = message
+                    .get_mut("content")
+                    .and_then(|c| c.as_array_mut())
+                    .and_then(|parts| parts.last_mut())
+                {
+                    last["cache_control"] = marker.clone();
+                }
+            }
+        }
+
+        if let Some(last_tool) = obj
+            .get_mut("tools")
+            .and_then(|t| t.as_array_mut())
+            .and_then(|tools| tools.last_mut())
+        {
+            last_tool["cache_control"] = marker;
+        }
+    }
+
     /// Apply parameter mappings to a request body
     pub fn apply_param_mappings(&self, params: &mut serde_json::Value) {
         if let Some(obj) = params.as_object_mut() {
@@ -273,4 +345,47 @@ mod tests {
         assert!(params.get("max_completion_tokens").is_none());
         assert_eq!(params.get("max_tokens").unwrap(), 1000);
     }
+
+    #[test]
+    fn test_apply_prompt_caching() {
+        let mut config: ProviderConfig = serde_json::from_str(
+            r#"{
+                "base_url": "https://api.anthropic.com/v1",
+                "special_handling": {"prompt_cache_control": true}
+            }"#,
+        )
+        .unwrap();
+
+        let body = serde_json::json!({
+            "cache_control": true,
+            "messages": [
+                {"role": "system", "content": "You are a helpful assistant."},
+                {"role": "user", "content": "Hello!"}
+            ],
+            "tools": [{"type": "function"}, {"type": "function"}]
+        });
+
+        let mut params = body.clone();
+        config.apply_prompt_caching(&mut params);
+
+        assert!(params.get("cache_control").is_none());
+        assert_eq!(
+            params["messages"][0]["content"][0]["cache_control"]["type"],
+            "ephemeral"
+        );
+        assert_eq!(params["messages"][1]["content"], "Hello!");
+        assert!(params["tools"][0].get("cache_control").is_none());
+        assert_eq!(params["tools"][1]["cache_control"]["type"], "ephemeral");
+
+        // Providers without explicit markers only drop the flag
+        config.special_handling.prompt_cache_control = false;
+        let mut params = body;
+        config.apply_prompt_caching(&mut params);
+
+        assert!(params.get("cache_control").is_none());
+        assert_eq!(
+            params["messages"][0]["content"],
+            "You are a helpful assistant."
+        );
+    }
 }
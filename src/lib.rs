@@ -3,22 +3,33 @@
 //! A high-performance Python library written in Rust for unified LLM provider access
 //! with intelligent rate limiting and key rotation.
 
+use parking_lot::RwLock;
 use pyo3::prelude::*;
 use pyo3::types::{PyDict, PyList};
 use std::collections::HashMap;
-use std::sync::Arc;
+use std::sync::{Arc, OnceLock};
 
 pub mod api;
+pub mod cache;
 pub mod client;
 pub mod config;
 pub mod error;
 pub mod router;
 
-use api::{CompletionRequest, CompletionResponse, Message, MessageContent};
+use api::batch::{BATCH_COMPLETION_WINDOW, BATCH_ENDPOINT};
+use api::{
+    BatchJob, BatchResult, CompletionRequest, CompletionResponse, Message, MessageContent,
+    TextCompletionResponse,
+};
+use cache::{CacheStats, ResponseCache};
 use client::HttpClient;
 use config::{ConfigLoader, ProviderConfig};
 use error::{LlmaoError, Result};
-use router::{KeyPool, ModelRoute};
+use router::provider::build_extra_headers;
+use router::{KeyPool, ModelRoute, ProviderHandle, ResolvedModel};
+
+/// Longest a request waits for a rate limited key before giving up
+const MAX_KEY_WAIT: std::time::Duration = std::time::Duration::from_secs(60);
 
 /// The main LLM client
 pub struct LlmClient {
@@ -33,10 +44,22 @@ pub struct LlmClient {
     model_configs: HashMap<String, config::ModelConfig>,
 
     /// API key pools per provider
-    key_pools: HashMap<String, KeyPool>,
+    key_pools: HashMap<String, Arc<KeyPool>>,
+
+    /// Requests per minute allowed per provider, from user config
+    rate_limits: HashMap<String, u32>,
+
+    /// Providers resolved on first use
+    provider_handles: RwLock<HashMap<String, Arc<ProviderHandle>>>,
+
+    /// Model strings ("provider/model") resolved to their provider
+    model_index: RwLock<HashMap<String, Arc<ResolvedModel>>>,
 
     /// HTTP client
     http_client: HttpClient,
+
+    /// Cache for deterministic (temperature <= 0) or opted-in responses, if enabled
+    response_cache: Option<ResponseCache>,
 }
 
 impl LlmClient {
@@ -60,6 +83,7 @@ impl LlmClient {
         // Expand user config into individual model configurations
         let mut model_configs = HashMap::new();
         let mut key_pools = HashMap::new();
+        let mut rate_limits = HashMap::new();
         let mut custom_providers: HashMap<String, ProviderConfig> = HashMap::new();
 
         for (key, model_config) in user_config {
@@ -81,6 +105,11 @@ impl LlmClient {
                     );
                 }
 
+                // Client-side rate limit for this provider, if not set already
+                if let Some(rpm) = model_config.requests_per_minute() {
+                    rate_limits.entry(provider_name.to_string()).or_insert(rpm);
+                }
+
                 // If this provider is not in registry and has a base_url, create a custom provider entry
                 if !provider_registry.contains_key(provider_name) {
                     if let Some(base_url) = &model_config.base_url {
@@ -96,7 +125,7 @@ impl LlmClient {
                                     param_mappings: model_config.param_mappings.clone(),
                                     headers: model_config.headers.clone(),
                                     rate_limit: model_config.rate_limit.clone(),
-                                    special_handling: Default::default(),
+                                    special_handling: model_config.special_handling.clone(),
                                 },
                             );
                         }
@@ -121,6 +150,11 @@ impl LlmClient {
                     );
                 }
 
+                // Client-side rate limit for this provider
+                if let Some(rpm) = model_config.requests_per_minute() {
+                    rate_limits.insert(provider_name.clone(), rpm);
+                }
+
                 // If this provider is not in registry and has a base_url, create a custom provider entry
                 if !provider_registry.contains_key(provider_name) {
                     if let Some(base_url) = &model_config.base_url {
@@ -136,7 +170,7 @@ impl LlmClient {
                                     param_mappings: model_config.param_mappings.clone(),
                                     headers: model_config.headers.clone(),
                                     rate_limit: model_config.rate_limit.clone(),
-                                    special_handling: Default::default(),
+                                    special_handling: model_config.special_handling.clone(),
                                 },
                             );
                         }
@@ -151,13 +185,49 @@ impl LlmClient {
             }
         }
 
-        Ok(Self {
+        // Now that every provider is known, build each key's headers once
+        let key_pools = key_pools
+            .into_iter()
+            .map(|(name, pool): (String, KeyPool)| {
+                let extra_headers = provider_registry
+                    .get(&name)
+                    .or_else(|| custom_providers.get(&name))
+                    .and_then(build_extra_headers);
+                let pool = pool.with_headers(extra_headers.as_ref());
+                (name, Arc::new(pool))
+            })
+            .collect();
+
+        let client = Self {
             provider_registry,
             custom_providers,
             model_configs,
             key_pools,
+            rate_limits,
+            provider_handles: RwLock::new(HashMap::new()),
+            model_index: RwLock::new(HashMap::new()),
             http_client: HttpClient::new()?,
-        })
+            response_cache: None,
+        };
+
+        // Index configured models up front; errors (e.g. unknown provider)
+        // are reported when the model is actually used
+        for model in client.model_configs.keys() {
+            let _ = client.resolve_model(model);
+        }
+
+        Ok(client)
+    }
+
+    /// Enable caching of deterministic responses
+    pub fn with_response_cache(mut self, capacity: usize, ttl: std::time::Duration) -> Self {
+        self.response_cache = Some(ResponseCache::new(capacity, ttl));
+        self
+    }
+
+    /// Get response cache statistics (None if caching is disabled)
+    pub fn cache_stats(&self) -> Option<CacheStats> {
+        self.response_cache.as_ref().map(|c| c.stats())
     }
 
     /// Get a provider configuration from registry or custom providers
@@ -172,6 +242,43 @@ impl LlmClient {
             .ok_or_else(|| LlmaoError::ProviderNotFound(name.to_string()))
     }
 
+    /// Get a resolved provider, building it on first use
+    fn get_provider_handle(&self, name: &str) -> Result<Arc<ProviderHandle>> {
+        if let Some(handle) = self.provider_handles.read().get(name) {
+            return Ok(handle.clone());
+        }
+
+        let config = self.get_provider(name)?.clone();
+        let key_pool = self.key_pools.get(name).cloned();
+        let rate_limit = self.rate_limits.get(name).copied();
+        let handle = self
+            .provider_handles
+            .write()
+            .entry(name.to_string())
+            .or_insert_with(|| {
+                Arc::new(ProviderHandle::new(name, config, key_pool).with_rate_limit(rate_limit))
+            })
+            .clone();
+        Ok(handle)
+    }
+
+    /// Resolve a "provider/model" string, indexing it on first use
+    fn resolve_model(&self, model: &str) -> Result<Arc<ResolvedModel>> {
+        if let Some(resolved) = self.model_index.read().get(model) {
+            return Ok(resolved.clone());
+        }
+
+        let route = ModelRoute::parse(model)?;
+        let resolved = Arc::new(ResolvedModel {
+            provider: self.get_provider_handle(&route.provider)?,
+            model_id: route.model_id(),
+        });
+        self.model_index
+            .write()
+            .insert(model.to_string(), resolved.clone());
+        Ok(resolved)
+    }
+
     /// Get the default model (first configured model)
     pub fn get_default_model(&self) -> Option<String> {
         self.model_configs.keys().next().cloned()
@@ -182,105 +289,204 @@ impl LlmClient {
         self.model_configs.keys().cloned().collect()
     }
 
-    /// Get an API key for a provider
-    fn get_api_key(&self, provider: &str) -> Result<String> {
-        if let Some(pool) = self.key_pools.get(provider) {
-            pool.get_key()
-                .map(|k| k.value().to_string())
-                .ok_or_else(|| LlmaoError::NoKeysAvailable(provider.to_string()))
-        } else {
-            // Try single env var from provider config
-            let config = self.get_provider(provider)?;
-            config
-                .get_api_keys()
-                .into_iter()
-                .next()
-                .ok_or_else(|| LlmaoError::NoKeysAvailable(provider.to_string()))
+    /// Make a completion request
+    pub async fn completion(
+        &self,
+        model: &str,
+        request: CompletionRequest,
+    ) -> Result<CompletionResponse> {
+        let resolved = self.resolve_model(model)?;
+        let provider = &resolved.provider;
+
+        // Serve deterministic and opted-in requests from the cache when possible
+        let cache_key = match &self.response_cache {
+            Some(cache) if ResponseCache::is_cacheable(&request) => {
+                let key = ResponseCache::key(model, &request)?;
+                if let Some(response) = cache.get(&key) {
+                    return Ok(response);
+                }
+                Some(key)
+            }
+            _ => None,
+        };
+
+        let body = build_chat_body(&resolved, &request)?;
+
+        let response: CompletionResponse = self
+            .post_with_key_rotation(provider, provider.chat_url(), &body)
+            .await?;
+
+        if let (Some(cache), Some(key)) = (&self.response_cache, cache_key) {
+            cache.insert(key, response.clone());
         }
+
+        Ok(response)
     }
 
-    /// Mark an API key as rate limited
-    fn mark_key_rate_limited(&self, provider: &str, key: &str, duration: std::time::Duration) {
-        if let Some(pool) = self.key_pools.get(provider) {
-            pool.mark_rate_limited(key, duration);
+    /// Look up a request in the response cache without sending it
+    ///
+    /// Returns None if the cache is disabled or the request is not cacheable.
+    /// Only hits are counted; on a miss, the `completion` call that follows
+    /// counts it.
+    pub fn cached(
+        &self,
+        model: &str,
+        request: &CompletionRequest,
+    ) -> Result<Option<CompletionResponse>> {
+        match &self.response_cache {
+            Some(cache) if ResponseCache::is_cacheable(request) => {
+                Ok(cache.lookup(&ResponseCache::key(model, request)?))
+            }
+            _ => Ok(None),
         }
     }
 
-    /// Make a completion request
-    pub async fn completion(
+    /// Fix the model, params and system prompt for repeated completions
+    ///
+    /// `request` holds everything but the user message. Its body is serialized
+    /// once, around a placeholder; each `completion_bound` call only encodes
+    /// the user message and splices it in.
+    pub fn bind(&self, model: &str, mut request: CompletionRequest) -> Result<BoundCompletion> {
+        let resolved = self.resolve_model(model)?;
+
+        request
+            .messages
+            .push(Message::text("user", USER_PLACEHOLDER));
+        let body = serde_json::to_vec(&build_chat_body(&resolved, &request)?)?;
+        let placeholder = serde_json::to_vec(USER_PLACEHOLDER)?;
+
+        let mut matches = body
+            .windows(placeholder.len())
+            .enumerate()
+            .filter(|(_, window)| *window == placeholder.as_slice())
+            .map(|(i, _)| i);
+        let (Some(start), None) = (matches.next(), matches.next()) else {
+            return Err(LlmaoError::Config(
+                "Could not build a request template for bind()".to_string(),
+            ));
+        };
+
+        Ok(BoundCompletion {
+            model: model.to_string(),
+            prefix: body[..start].to_vec(),
+            suffix: body[start + placeholder.len()..].to_vec(),
+            resolved,
+            template: request,
+        })
+    }
+
+    /// Make a completion request for a user message with a bound request
+    pub async fn completion_bound(
         &self,
-        model: &str,
-        request: CompletionRequest,
+        bound: &BoundCompletion,
+        user: &str,
     ) -> Result<CompletionResponse> {
-        let route = ModelRoute::parse(model)?;
-        let provider_config = self.get_provider(&route.provider)?;
+        // Cache keys cover the whole request, so cacheable calls take the regular path
+        if self.response_cache.is_some() && ResponseCache::is_cacheable(&bound.template) {
+            return self.completion(&bound.model, bound.request(user)).await;
+        }
 
-        // Build request body
-        let mut body = serde_json::to_value(&request)?;
+        let provider = &bound.resolved.provider;
+        self.post_bytes_with_key_rotation(provider, provider.chat_url(), bound.body(user)?)
+            .await
+    }
 
-        // Set the actual model name
-        if let Some(obj) = body.as_object_mut() {
-            obj.insert(
-                "model".to_string(),
-                serde_json::Value::String(route.model_id()),
-            );
-        }
+    /// Make bound completion requests concurrently, one per user message
+    ///
+    /// Results are in input order; see `completion_batch`.
+    pub async fn completion_bound_batch(
+        &self,
+        bound: &BoundCompletion,
+        users: &[String],
+        max_concurrency: Option<usize>,
+    ) -> Vec<Result<CompletionResponse>> {
+        use futures::StreamExt;
 
-        // Apply parameter mappings
-        provider_config.apply_param_mappings(&mut body);
+        let limit = max_concurrency.unwrap_or(users.len()).max(1);
+        futures::stream::iter(users.iter().map(|user| self.completion_bound(bound, user)))
+            .buffered(limit)
+            .collect()
+            .await
+    }
 
-        // Build URL
-        let base_url = provider_config.get_base_url();
-        let url = format!("{}/chat/completions", base_url.trim_end_matches('/'));
+    /// POST a request body, rotating to the next key when one is rate limited
+    async fn post_with_key_rotation<R: serde::de::DeserializeOwned>(
+        &self,
+        provider: &ProviderHandle,
+        url: &str,
+        body: &serde_json::Value,
+    ) -> Result<R> {
+        // Serialize once; every attempt shares the same buffer
+        let body = bytes::Bytes::from(serde_json::to_vec(body)?);
+        self.post_bytes_with_key_rotation(provider, url, body).await
+    }
 
-        // Build extra headers
-        let extra_headers = if provider_config.headers.is_empty() {
-            None
-        } else {
-            let mut headers = reqwest::header::HeaderMap::new();
-            for (key, value) in &provider_config.headers {
-                if let (Ok(name), Ok(val)) = (
-                    reqwest::header::HeaderName::try_from(key.as_str()),
-                    reqwest::header::HeaderValue::from_str(value),
-                ) {
-                    headers.insert(name, val);
+    /// POST a serialized request body, rotating to the next key when one is rate limited
+    ///
+    /// Each key gets one try in turn; after that, retries back off with jitter.
+    /// When every key is rate limited, the next attempt waits until one comes
+    /// back (up to `MAX_KEY_WAIT`). Keys that keep getting rate limited are
+    /// taken out of rotation for a while (see `ApiKey::record_rate_limited`);
+    /// once that has happened to all of them, requests fail straight away.
+    async fn post_bytes_with_key_rotation<R: serde::de::DeserializeOwned>(
+        &self,
+        provider: &ProviderHandle,
+        url: &str,
+        body: bytes::Bytes,
+    ) -> Result<R> {
+        let max_retries = 3;
+        let key_pool = provider.key_pool();
+        let pool_size = key_pool.len().max(1);
+        let mut backoff = client::http::retry_backoff();
+        let mut last_error = None;
+
+        for attempt in 0..pool_size + max_retries as usize {
+            // Every key has had a turn; wait before trying again
+            let mut delay = if attempt >= pool_size {
+                client::http::next_delay(&mut backoff)
+            } else {
+                std::time::Duration::ZERO
+            };
+
+            // With every key rate limited, wait for the first one to come back
+            if key_pool.all_rate_limited() {
+                if let Some(wait) = key_pool.min_wait_time() {
+                    if key_pool.all_circuits_open() || wait > MAX_KEY_WAIT {
+                        return Err(LlmaoError::RateLimited {
+                            provider: provider.name().to_string(),
+                            retry_after: Some(client::http::ceil_secs(wait)),
+                        });
+                    }
+                    delay = delay.max(wait);
                 }
             }
-            Some(headers)
-        };
 
-        // Try with key rotation on rate limit
-        let max_attempts = self
-            .key_pools
-            .get(&route.provider)
-            .map(|p| p.len())
-            .unwrap_or(1);
-        let mut last_error = None;
+            if !delay.is_zero() {
+                tokio::time::sleep(delay).await;
+            }
 
-        for _ in 0..max_attempts {
-            let api_key = self.get_api_key(&route.provider)?;
+            provider.wait_for_capacity().await;
+            let key = provider.get_key()?;
 
             match self
                 .http_client
-                .post_with_retry::<_, CompletionResponse>(
-                    &url,
-                    &body,
-                    &api_key,
-                    extra_headers.as_ref(),
-                    &route.provider,
-                    3,
+                .post_bytes_with_retry::<R>(
+                    url,
+                    body.clone(),
+                    key.json_headers()?,
+                    provider.name(),
+                    max_retries,
                 )
                 .await
             {
-                Ok(response) => return Ok(response),
+                Ok(response) => {
+                    key.record_success();
+                    return Ok(response);
+                }
                 Err(LlmaoError::RateLimited { retry_after, .. }) => {
-                    // Mark this key as rate limited and try next
-                    let duration = retry_after
-                        .map(std::time::Duration::from_secs)
-                        .unwrap_or(std::time::Duration::from_secs(60));
-                    self.mark_key_rate_limited(&route.provider, &api_key, duration);
+                    key.record_rate_limited(retry_after.map(std::time::Duration::from_secs));
                     last_error = Some(LlmaoError::RateLimited {
-                        provider: route.provider.clone(),
+                        provider: provider.name().to_string(),
                         retry_after,
                     });
                 }
@@ -288,7 +494,219 @@ impl LlmClient {
             }
         }
 
-        Err(last_error.unwrap_or(LlmaoError::NoKeysAvailable(route.provider)))
+        Err(last_error.unwrap_or_else(|| LlmaoError::NoKeysAvailable(provider.name().to_string())))
+    }
+
+    /// Complete several independent prompts
+    ///
+    /// Providers flagged with `use_legacy_completions` get every prompt in a single
+    /// `/completions` request; others fall back to concurrent chat completions.
+    /// Returns one chat-style response per prompt, in input order. For a single
+    /// request, its usage is reported on the first response.
+    pub async fn completion_prompts(
+        &self,
+        model: &str,
+        prompts: Vec<String>,
+        request: CompletionRequest,
+    ) -> Result<Vec<CompletionResponse>> {
+        let resolved = self.resolve_model(model)?;
+        let provider = &resolved.provider;
+
+        if !provider.config().special_handling.use_legacy_completions {
+            let requests = prompts
+                .into_iter()
+                .map(|prompt| {
+                    let mut request = request.clone();
+                    request.messages = vec![Message {
+                        role: "user".to_string(),
+                        content: MessageContent::Text(prompt),
+                        reasoning: None,
+                        name: None,
+                        tool_calls: None,
+                        tool_call_id: None,
+                    }];
+                    request
+                })
+                .collect();
+            return self
+                .completion_batch(model, requests, None)
+                .await
+                .into_iter()
+                .collect();
+        }
+
+        // Samples per prompt, used to demux choices back to their prompt
+        let n = request.extra.get("n").and_then(|v| v.as_u64()).unwrap_or(1) as usize;
+        let prompt_count = prompts.len();
+
+        // Build request body with all prompts in one list
+        let mut body = serde_json::to_value(&request)?;
+        if let Some(obj) = body.as_object_mut() {
+            obj.remove("messages");
+            obj.insert(
+                "model".to_string(),
+                serde_json::Value::String(resolved.model_id.clone()),
+            );
+            obj.insert("prompt".to_string(), serde_json::json!(prompts));
+        }
+
+        // Apply prompt caching and parameter mappings
+        provider.config().apply_prompt_caching(&mut body);
+        provider.config().apply_param_mappings(&mut body);
+
+        let response: TextCompletionResponse = self
+            .post_with_key_rotation(provider, provider.completions_url(), &body)
+            .await?;
+
+        Ok(response.split_by_prompt(prompt_count, n))
+    }
+
+    /// Make several completion requests concurrently
+    ///
+    /// At most `max_concurrency` requests are in flight at once (all of them if
+    /// None). Results are returned in the same order as `requests`.
+    pub async fn completion_batch(
+        &self,
+        model: &str,
+        requests: Vec<CompletionRequest>,
+        max_concurrency: Option<usize>,
+    ) -> Vec<Result<CompletionResponse>> {
+        use futures::StreamExt;
+
+        let limit = max_concurrency.unwrap_or(requests.len()).max(1);
+        futures::stream::iter(
+            requests
+                .into_iter()
+                .map(|request| self.completion(model, request)),
+        )
+        .buffered(limit)
+        .collect()
+        .await
+    }
+
+    /// Check if a model's provider supports the Batch API
+    pub fn supports_batch(&self, model: &str) -> Result<bool> {
+        let resolved = self.resolve_model(model)?;
+        Ok(resolved.provider.config().special_handling.batch_api)
+    }
+
+    /// Submit requests as a provider-side batch job
+    ///
+    /// The requests are uploaded as a JSONL file and processed by the provider
+    /// within its completion window, at a discount. Collect the output with
+    /// `batch_results`; each result's `custom_id` is its index in `requests`.
+    pub async fn batch_submit(
+        &self,
+        model: &str,
+        requests: Vec<CompletionRequest>,
+    ) -> Result<BatchJob> {
+        let resolved = self.resolve_model(model)?;
+        let provider = &resolved.provider;
+
+        if !provider.config().special_handling.batch_api {
+            return Err(LlmaoError::Config(format!(
+                "Provider '{}' does not support the Batch API. Use completion_batch instead.",
+                provider.name()
+            )));
+        }
+
+        let bodies = requests
+            .iter()
+            .map(|request| build_chat_body(&resolved, request))
+            .collect::<Result<Vec<_>>>()?;
+        let input = api::batch::build_batch_input(&bodies)?;
+
+        // Batch jobs belong to the account that created them, so always use the same key
+        let key = provider.primary_key()?;
+
+        let form = reqwest::multipart::Form::new()
+            .text("purpose", "batch")
+            .part(
+                "file",
+                reqwest::multipart::Part::bytes(input).file_name("batch.jsonl"),
+            );
+        let file: serde_json::Value = self
+            .http_client
+            .post_multipart(
+                &provider.endpoint("files"),
+                form,
+                key.headers()?,
+                provider.name(),
+            )
+            .await?;
+        let file_id = file["id"].as_str().ok_or_else(|| {
+            LlmaoError::Response("Batch file upload returned no file id".to_string())
+        })?;
+
+        let body = serde_json::json!({
+            "input_file_id": file_id,
+            "endpoint": BATCH_ENDPOINT,
+            "completion_window": BATCH_COMPLETION_WINDOW,
+        });
+        self.http_client
+            .post_with_retry(
+                &provider.endpoint("batches"),
+                &body,
+                key.json_headers()?,
+                provider.name(),
+                3,
+            )
+            .await
+    }
+
+    /// Get the current state of a batch job
+    pub async fn batch_poll(&self, model: &str, batch_id: &str) -> Result<BatchJob> {
+        let provider = &self.resolve_model(model)?.provider;
+        let key = provider.primary_key()?;
+
+        self.http_client
+            .get_json(
+                &provider.endpoint(&format!("batches/{}", batch_id)),
+                key.headers()?,
+                provider.name(),
+            )
+            .await
+    }
+
+    /// Wait for a batch job to finish and collect its results
+    ///
+    /// Polls with exponential backoff (5s, doubling up to 60s). Requests the
+    /// provider could not complete are returned as errors.
+    pub async fn batch_results(&self, model: &str, batch_id: &str) -> Result<Vec<BatchResult>> {
+        let mut interval = std::time::Duration::from_secs(5);
+        let job = loop {
+            let job = self.batch_poll(model, batch_id).await?;
+            if job.is_finished() {
+                break job;
+            }
+            tokio::time::sleep(interval).await;
+            interval = (interval * 2).min(std::time::Duration::from_secs(60));
+        };
+
+        if job.output_file_id.is_none() && job.error_file_id.is_none() {
+            return Err(LlmaoError::Request(format!(
+                "Batch {} {} without results",
+                job.id, job.status
+            )));
+        }
+
+        let provider = &self.resolve_model(model)?.provider;
+        let key = provider.primary_key()?;
+
+        let mut results = Vec::new();
+        for file_id in job.output_file_id.iter().chain(&job.error_file_id) {
+            let content = self
+                .http_client
+                .get_bytes(
+                    &provider.endpoint(&format!("files/{}/content", file_id)),
+                    key.headers()?,
+                    provider.name(),
+                )
+                .await?;
+            results.extend(api::batch::parse_batch_output(&content)?);
+        }
+
+        Ok(results)
     }
 
     /// Make a streaming completion request
@@ -301,80 +719,73 @@ impl LlmClient {
     ) -> Result<Vec<api::StreamChunk>> {
         use futures::StreamExt;
 
-        let route = ModelRoute::parse(model)?;
-        let provider_config = self.get_provider(&route.provider)?;
+        let resolved = self.resolve_model(model)?;
+        let provider = &resolved.provider;
 
         // Build request body with stream=true
         let mut body = serde_json::to_value(&request)?;
         if let Some(obj) = body.as_object_mut() {
             obj.insert(
                 "model".to_string(),
-                serde_json::Value::String(route.model_id()),
+                serde_json::Value::String(resolved.model_id.clone()),
             );
             obj.insert("stream".to_string(), serde_json::Value::Bool(true));
         }
 
-        // Apply parameter mappings
-        provider_config.apply_param_mappings(&mut body);
-
-        // Build URL
-        let base_url = provider_config.get_base_url();
-        let url = format!("{}/chat/completions", base_url.trim_end_matches('/'));
-
-        // Build extra headers
-        let extra_headers = if provider_config.headers.is_empty() {
-            None
-        } else {
-            let mut headers = reqwest::header::HeaderMap::new();
-            for (key, value) in &provider_config.headers {
-                if let (Ok(name), Ok(val)) = (
-                    reqwest::header::HeaderName::try_from(key.as_str()),
-                    reqwest::header::HeaderValue::from_str(value),
-                ) {
-                    headers.insert(name, val);
-                }
-            }
-            Some(headers)
-        };
+        // Apply prompt caching and parameter mappings
+        provider.config().apply_prompt_caching(&mut body);
+        provider.config().apply_param_mappings(&mut body);
 
-        // Get API key
-        let api_key = self.get_api_key(&route.provider)?;
+        // Wait for the provider's rate limit, then get an API key
+        provider.wait_for_capacity().await;
+        let key = provider.get_key()?;
 
         // Make streaming request
         let mut stream = self
             .http_client
-            .post_stream(&url, &body, &api_key, extra_headers.as_ref(), &route.provider)
+            .post_stream(
+                provider.chat_url(),
+                &body,
+                key.json_headers()?,
+                provider.name(),
+            )
             .await?;
 
         // Collect chunks
         let mut chunks = Vec::new();
-        let mut buffer = String::new();
+        let mut decoder = api::SseDecoder::new();
 
         while let Some(result) = stream.next().await {
-            let bytes = result?;
-            buffer.push_str(&String::from_utf8_lossy(&bytes));
-
-            // Process complete lines
-            while let Some(newline_pos) = buffer.find('\n') {
-                let line = buffer[..newline_pos].to_string();
-                buffer = buffer[newline_pos + 1..].to_string();
-
-                if let Some(chunk) = api::parse_sse_line(&line)? {
-                    chunks.push(chunk);
-                }
-            }
+            chunks.extend(decoder.push(&result?)?);
         }
 
         // Process remaining buffer
-        if !buffer.trim().is_empty() {
-            if let Some(chunk) = api::parse_sse_line(&buffer)? {
-                chunks.push(chunk);
-            }
-        }
+        chunks.extend(decoder.finish()?);
 
         Ok(chunks)
     }
 
+    /// Connect to every configured provider in parallel
+    ///
+    /// The connections stay in the pool, so the first completion to each
+    /// provider skips the TCP + TLS handshake. Failures are ignored.
+    pub async fn prewarm(&self) {
+        let providers: Vec<Arc<ProviderHandle>> = self
+            .provider_handles
+            .read()
+            .values()
+            .filter(|p| !p.key_pool().is_empty())
+            .cloned()
+            .collect();
+
+        futures::future::join_all(
+            providers
+                .iter()
+                .map(|p| self.http_client.prewarm(p.base_url())),
+        )
+        .await;
+    }
+
     /// List available providers
     pub fn providers(&self) -> Vec<String> {
         self.provider_registry.keys().cloned().collect()
@@ -391,6 +802,79 @@ impl LlmClient {
     }
 }
 
+/// Build a chat completion request body for a resolved model
+fn build_chat_body(
+    resolved: &ResolvedModel,
+    request: &CompletionRequest,
+) -> Result<serde_json::Value> {
+    let mut body = serde_json::to_value(request)?;
+
+    // Set the actual model name
+    if let Some(obj) = body.as_object_mut() {
+        obj.insert(
+            "model".to_string(),
+            serde_json::Value::String(resolved.model_id.clone()),
+        );
+    }
+
+    // Apply prompt caching and parameter mappings
+    let config = resolved.provider.config();
+    config.apply_prompt_caching(&mut body);
+    config.apply_param_mappings(&mut body);
+
+    Ok(body)
+}
+
+/// Stand-in for the user message while a bound request body is serialized
+const USER_PLACEHOLDER: &str = "\u{0}llmao:user\u{0}";
+
+/// A chat completion with everything but the user message fixed
+///
+/// Created by `LlmClient::bind`. Holds the serialized request body split
+/// around the user message, so a call costs one JSON string encode.
+#[derive(Debug)]
+pub struct BoundCompletion {
+    /// Model string as given ("provider/model")
+    model: String,
+
+    /// Provider and model the body was built for
+    resolved: Arc<ResolvedModel>,
+
+    /// The bound request, ending with a placeholder user message
+    template: CompletionRequest,
+
+    /// Serialized body up to the user message's JSON string
+    prefix: Vec<u8>,
+
+    /// Serialized body after the user message's JSON string
+    suffix: Vec<u8>,
+}
+
+impl BoundCompletion {
+    /// Get the model string the request was bound to
+    pub fn model(&self) -> &str {
+        &self.model
+    }
+
+    /// Build the full request for a user message
+    pub fn request(&self, user: &str) -> CompletionRequest {
+        let mut request = self.template.clone();
+        if let Some(last) = request.messages.last_mut() {
+            last.content = MessageContent::Text(user.to_string());
+        }
+        request
+    }
+
+    /// Serialize the request body for a user message
+    pub fn body(&self, user: &str) -> Result<bytes::Bytes> {
+        let mut body = Vec::with_capacity(self.prefix.len() + user.len() + 2 + self.suffix.len());
+        body.extend_from_slice(&self.prefix);
+        serde_json::to_writer(&mut body, user)?;
+        body.extend_from_slice(&self.suffix);
+        Ok(body.into())
+    }
+}
+
 /// Provider information
 #[derive(Debug, Clone)]
 pub struct ProviderInfo {
@@ -400,6 +884,114 @@ pub struct ProviderInfo {
     pub has_keys: bool,
 }
 
+/// Core client paired with the runtime that drives its requests
+///
+/// Shared by every call in flight; the runtime shuts down when the last
+/// reference is dropped.
+struct ClientHandle {
+    client: Arc<LlmClient>,
+
+    /// Always set until the handle is dropped
+    runtime: Option<tokio::runtime::Runtime>,
+
+    /// Flipped by `close()` so calls in flight stop waiting
+    closed: tokio::sync::watch::Sender<bool>,
+}
+
+impl ClientHandle {
+    /// Create a handle with its own runtime
+    fn new(client: LlmClient) -> Result<Self> {
+        let runtime = tokio::runtime::Runtime::new()
+            .map_err(|e| LlmaoError::Internal(format!("Failed to create runtime: {}", e)))?;
+
+        Ok(Self {
+            client: Arc::new(client),
+            runtime: Some(runtime),
+            closed: tokio::sync::watch::Sender::new(false),
+        })
+    }
+
+    fn runtime(&self) -> &tokio::runtime::Runtime {
+        self.runtime
+            .as_ref()
+            .expect("runtime is only taken when the handle is dropped")
+    }
+
+    /// Wrap a future so it stops with "Client is closed" once the handle is closed
+    fn until_closed<T>(
+        &self,
+        future: impl std::future::Future<Output = Result<T>>,
+    ) -> impl std::future::Future<Output = Result<T>> {
+        let mut closed = self.closed.subscribe();
+        async move {
+            tokio::select! {
+                // Checked first, so a closed handle never starts new work
+                biased;
+                _ = closed.wait_for(|closed| *closed) => {
+                    Err(LlmaoError::Config("Client is closed".to_string()))
+                }
+                output = future => output,
+            }
+        }
+    }
+
+    /// Run a future on the runtime, blocking until it finishes or the handle is closed
+    fn block_on<T>(&self, future: impl std::future::Future<Output = Result<T>>) -> Result<T> {
+        self.runtime().block_on(self.until_closed(future))
+    }
+
+    /// Run a future on the runtime in the background, passing its output to `on_done`
+    ///
+    /// `on_done` is called exactly once: with the output, or with "Client is
+    /// closed" if the handle is closed or the task is aborted first.
+    fn spawn<T, D>(
+        &self,
+        future: impl std::future::Future<Output = Result<T>> + Send + 'static,
+        on_done: D,
+    ) -> tokio::task::AbortHandle
+    where
+        T: Send + 'static,
+        D: FnOnce(Result<T>) + Send + 'static,
+    {
+        let future = self.until_closed(future);
+        let mut on_done = OnDone(Some(on_done), std::marker::PhantomData);
+        self.runtime()
+            .spawn(async move { on_done.send(future.await) })
+            .abort_handle()
+    }
+
+    /// Cancel every call in flight; calls made afterwards fail straight away
+    fn close(&self) {
+        self.closed.send_replace(true);
+    }
+}
+
+impl Drop for ClientHandle {
+    fn drop(&mut self) {
+        // Don't wait on spawned work (e.g. a DNS lookup) that no one needs anymore
+        if let Some(runtime) = self.runtime.take() {
+            runtime.shutdown_background();
+        }
+    }
+}
+
+/// Calls a spawned task's `on_done`, even if the task is dropped before it finishes
+struct OnDone<T, D: FnOnce(Result<T>)>(Option<D>, std::marker::PhantomData<fn(T)>);
+
+impl<T, D: FnOnce(Result<T>)> OnDone<T, D> {
+    fn send(&mut self, output: Result<T>) {
+        if let Some(on_done) = self.0.take() {
+            on_done(output);
+        }
+    }
+}
+
+impl<T, D: FnOnce(Result<T>)> Drop for OnDone<T, D> {
+    fn drop(&mut self) {
+        self.send(Err(LlmaoError::Config("Client is closed".to_string())));
+    }
+}
+
 // =============================================================================
 // Python Bindings
 // =============================================================================
@@ -407,16 +999,42 @@ pub struct ProviderInfo {
 /// Python wrapper for the LLM client
 #[pyclass(name = "LLMClient")]
 struct PyLlmClient {
-    inner: Arc<LlmClient>,
-    runtime: tokio::runtime::Runtime,
+    /// Client and runtime, taken by `close()`
+    inner: parking_lot::Mutex<Option<Arc<ClientHandle>>>,
+}
+
+impl PyLlmClient {
+    /// Get the live client handle, failing if `close()` was called
+    fn handle(&self) -> Result<Arc<ClientHandle>> {
+        self.inner
+            .lock()
+            .clone()
+            .ok_or_else(|| LlmaoError::Config("Client is closed".to_string()))
+    }
+
+    /// Resolve model: use provided or get default from config
+    fn resolve_model(&self, model: Option<&str>) -> Result<String> {
+        if let Some(m) = model {
+            return Ok(m.to_string());
+        }
+        self.handle()?.client.get_default_model().ok_or_else(|| {
+            LlmaoError::Config("No model specified and no models configured. Either pass model parameter or add models to config.".to_string())
+        })
+    }
 }
 
 #[pymethods]
 impl PyLlmClient {
     /// Create a new client
     #[new]
-    #[pyo3(signature = (config_path=None, config=None))]
-    fn new(config_path: Option<&str>, config: Option<&Bound<'_, PyDict>>) -> PyResult<Self> {
+    #[pyo3(signature = (config_path=None, config=None, cache_ttl=None, cache_size=1024, prewarm=true))]
+    fn new(
+        config_path: Option<&str>,
+        config: Option<&Bound<'_, PyDict>>,
+        cache_ttl: Option<f64>,
+        cache_size: usize,
+        prewarm: bool,
+    ) -> PyResult<Self> {
         // Load .env file if present
         let _ = dotenvy::dotenv();
 
@@ -434,15 +1052,39 @@ impl PyLlmClient {
             LlmClient::new()?
         };
 
-        let runtime = tokio::runtime::Runtime::new()
-            .map_err(|e| LlmaoError::Internal(format!("Failed to create runtime: {}", e)))?;
+        // Cache deterministic responses if a TTL (in seconds) was given
+        let inner = match cache_ttl {
+            Some(ttl) if ttl > 0.0 => {
+                inner.with_response_cache(cache_size, std::time::Duration::from_secs_f64(ttl))
+            }
+            _ => inner,
+        };
+
+        let handle = ClientHandle::new(inner)?;
+
+        // Open provider connections in the background; construction doesn't wait
+        if prewarm {
+            let client = handle.client.clone();
+            handle
+                .runtime()
+                .spawn(async move { client.prewarm().await });
+        }
 
         Ok(Self {
-            inner: Arc::new(inner),
-            runtime,
+            inner: parking_lot::Mutex::new(Some(Arc::new(handle))),
         })
     }
 
+    /// Close the client, dropping its connection pool and runtime
+    ///
+    /// Calls still in flight on other threads fail with "Client is closed";
+    /// the runtime shuts down once the last of them returns.
+    fn close(&self) {
+        if let Some(handle) = self.inner.lock().take() {
+            handle.close();
+        }
+    }
+
     /// Make a completion request
     #[allow(clippy::too_many_arguments)]
     #[pyo3(signature = (messages, model=None, temperature=None, max_tokens=None, stream=None, **kwargs))]
@@ -456,129 +1098,364 @@ impl PyLlmClient {
         stream: Option<bool>,
         kwargs: Option<&Bound<'_, PyDict>>,
     ) -> PyResult<Py<PyAny>> {
-        // Resolve model: use provided or get default from config
-        let model_str = if let Some(m) = model {
-            m.to_string()
-        } else {
-            self.inner.get_default_model().ok_or_else(|| {
-                LlmaoError::Config("No model specified and no models configured. Either pass model parameter or add models to config.".to_string())
-            })?
-        };
-
-        // Convert Python messages to Rust
-        let rust_messages = convert_messages(messages)?;
-
-        // Build request
-        let mut request = CompletionRequest::new(model_str.clone(), rust_messages);
-
-        if let Some(temp) = temperature {
-            request.temperature = Some(temp);
-        }
-        if let Some(max) = max_tokens {
-            request.max_tokens = Some(max);
-        }
+        let handle = self.handle()?;
+        let model_str = self.resolve_model(model)?;
+
+        let mut request = build_request(
+            &model_str,
+            convert_messages(messages)?,
+            temperature,
+            max_tokens,
+            kwargs,
+        )?;
         if let Some(s) = stream {
             request.stream = Some(s);
         }
 
-        // Add extra kwargs
-        if let Some(extra) = kwargs {
-            for (key, value) in extra.iter() {
-                let key_str: String = key.extract()?;
-                let json_value = python_to_json(&value)?;
-                request.extra.insert(key_str, json_value);
-            }
-        }
-
-        // Run async completion
-        let client = self.inner.clone();
-
-        let response = self
-            .runtime
-            .block_on(async move { client.completion(&model_str, request).await })?;
-
-        // Convert response to Python dict
-        let dict = PyDict::new(py);
-        dict.set_item("id", &response.id)?;
-        dict.set_item("object", &response.object)?;
-        dict.set_item("created", response.created)?;
-        dict.set_item("model", &response.model)?;
-
-        // Convert choices
-        let choices = PyList::empty(py);
-        for choice in &response.choices {
-            let choice_dict = PyDict::new(py);
-            choice_dict.set_item("index", choice.index)?;
-            choice_dict.set_item("finish_reason", &choice.finish_reason)?;
-
-            let message_dict = PyDict::new(py);
-            message_dict.set_item("role", &choice.message.role)?;
-
-            // Use content, or fall back to reasoning if content is empty
-            let content = {
-                let main_content = choice.message.content.to_string_content();
-                if main_content.is_empty() {
-                    choice.message.reasoning.clone().unwrap_or_default()
-                } else {
-                    main_content
-                }
-            };
-            message_dict.set_item("content", content)?;
+        // Run async completion without holding the GIL so other Python threads can proceed
+        let client = handle.client.clone();
 
-            // Also expose reasoning if present
-            if let Some(reasoning) = &choice.message.reasoning {
-                message_dict.set_item("reasoning", reasoning)?;
-            }
+        let response = py.detach(|| {
+            handle.block_on(async move { client.completion(&model_str, request).await })
+        })?;
 
-            // Also expose tool_calls if present
-            if let Some(tool_calls) = &choice.message.tool_calls {
-                let tools_list = PyList::empty(py);
-                for tool in tool_calls {
-                    let tool_dict = PyDict::new(py);
-                    tool_dict.set_item("id", &tool.id)?;
-                    tool_dict.set_item("type", &tool.call_type)?;
+        response_to_py(py, &response)
+    }
 
-                    let func_dict = PyDict::new(py);
-                    func_dict.set_item("name", &tool.function.name)?;
-                    func_dict.set_item("arguments", &tool.function.arguments)?;
+    /// Make a completion request and return only the first message's text
+    ///
+    /// Skips building the full response dict, for callers that only read
+    /// `choices[0].message.content`.
+    #[pyo3(signature = (messages, model=None, temperature=None, max_tokens=None, **kwargs))]
+    fn completion_text(
+        &self,
+        py: Python<'_>,
+        messages: &Bound<'_, PyList>,
+        model: Option<&str>,
+        temperature: Option<f32>,
+        max_tokens: Option<u32>,
+        kwargs: Option<&Bound<'_, PyDict>>,
+    ) -> PyResult<Option<String>> {
+        let handle = self.handle()?;
+        let model_str = self.resolve_model(model)?;
+
+        let request = build_request(
+            &model_str,
+            convert_messages(messages)?,
+            temperature,
+            max_tokens,
+            kwargs,
+        )?;
+
+        let client = handle.client.clone();
+
+        let response = py.detach(|| {
+            handle.block_on(async move { client.completion(&model_str, request).await })
+        })?;
 
-                    tool_dict.set_item("function", func_dict)?;
-                    tools_list.append(tool_dict)?;
-                }
-                message_dict.set_item("tool_calls", tools_list)?;
-            }
+        Ok(response.text())
+    }
+
+    /// Look up a request in the response cache without sending it
+    ///
+    /// Returns the cached response dict, or None. Lets the semantic cache be
+    /// consulted only after an exact-match miss.
+    #[pyo3(signature = (messages, model=None, temperature=None, max_tokens=None, **kwargs))]
+    fn cached(
+        &self,
+        py: Python<'_>,
+        messages: &Bound<'_, PyList>,
+        model: Option<&str>,
+        temperature: Option<f32>,
+        max_tokens: Option<u32>,
+        kwargs: Option<&Bound<'_, PyDict>>,
+    ) -> PyResult<Option<Py<PyAny>>> {
+        let model_str = self.resolve_model(model)?;
+
+        let request = build_request(
+            &model_str,
+            convert_messages(messages)?,
+            temperature,
+            max_tokens,
+            kwargs,
+        )?;
+
+        self.handle()?
+            .client
+            .cached(&model_str, &request)?
+            .map(|response| response_to_py(py, &response))
+            .transpose()
+    }
+
+    /// Start a completion request on the runtime and return without waiting for it
+    ///
+    /// `callback(response, error)` is called from a runtime thread once the
+    /// request finishes; `acompletion` uses it to settle an asyncio future.
+    /// Cancel the returned `PendingCall` to abort the request.
+    #[pyo3(signature = (callback, messages, model=None, temperature=None, max_tokens=None, **kwargs))]
+    fn spawn_completion(
+        &self,
+        callback: Py<PyAny>,
+        messages: &Bound<'_, PyList>,
+        model: Option<&str>,
+        temperature: Option<f32>,
+        max_tokens: Option<u32>,
+        kwargs: Option<&Bound<'_, PyDict>>,
+    ) -> PyResult<PyPendingCall> {
+        let handle = self.handle()?;
+        let model_str = self.resolve_model(model)?;
+
+        let request = build_request(
+            &model_str,
+            convert_messages(messages)?,
+            temperature,
+            max_tokens,
+            kwargs,
+        )?;
+
+        let client = handle.client.clone();
+
+        let task = handle.spawn(
+            async move { client.completion(&model_str, request).await },
+            deliver(callback, |py, response| response_to_py(py, &response)),
+        );
+
+        Ok(PyPendingCall { task })
+    }
+
+    /// Fix the model, params and system prompt for repeated completions
+    ///
+    /// Returns a `BoundCompletion` to call with just the user message; the rest
+    /// of the request body is serialized once, here.
+    #[pyo3(signature = (model=None, temperature=None, max_tokens=None, system=None, **kwargs))]
+    fn bind(
+        slf: &Bound<'_, Self>,
+        model: Option<&str>,
+        temperature: Option<f32>,
+        max_tokens: Option<u32>,
+        system: Option<&str>,
+        kwargs: Option<&Bound<'_, PyDict>>,
+    ) -> PyResult<PyBoundCompletion> {
+        let this = slf.borrow();
+        let handle = this.handle()?;
+        let model_str = this.resolve_model(model)?;
+
+        let messages = system
+            .map(|s| vec![Message::text("system", s)])
+            .unwrap_or_default();
+        let request = build_request(&model_str, messages, temperature, max_tokens, kwargs)?;
+
+        Ok(PyBoundCompletion {
+            bound: Arc::new(handle.client.bind(&model_str, request)?),
+            client: slf.clone().unbind(),
+        })
+    }
+
+    /// Make several completion requests concurrently, one per message list
+    ///
+    /// All requests are in flight at once on the runtime, so the batch takes roughly
+    /// as long as its slowest request. Raises the first error if any request fails,
+    /// unless `return_errors` is set, in which case failed requests map to
+    /// `{"error": "<message>"}` like in `batch_results`.
+    #[allow(clippy::too_many_arguments)]
+    #[pyo3(signature = (messages_list, model=None, temperature=None, max_tokens=None, max_concurrency=None, return_errors=false, **kwargs))]
+    fn completion_batch(
+        &self,
+        py: Python<'_>,
+        messages_list: &Bound<'_, PyList>,
+        model: Option<&str>,
+        temperature: Option<f32>,
+        max_tokens: Option<u32>,
+        max_concurrency: Option<usize>,
+        return_errors: bool,
+        kwargs: Option<&Bound<'_, PyDict>>,
+    ) -> PyResult<Py<PyAny>> {
+        let handle = self.handle()?;
+        let model_str = self.resolve_model(model)?;
+        let requests = build_requests(&model_str, messages_list, temperature, max_tokens, kwargs)?;
+
+        let client = handle.client.clone();
+
+        let results = py.detach(|| {
+            handle.block_on(async move {
+                Ok(client
+                    .completion_batch(&model_str, requests, max_concurrency)
+                    .await)
+            })
+        })?;
 
-            choice_dict.set_item("message", message_dict)?;
+        results_to_py(py, results, return_errors)
+    }
 
-            choices.append(choice_dict)?;
+    /// Start a batch of completion requests on the runtime without waiting for it
+    ///
+    /// Like `completion_batch`, but the response list (or the first error) is
+    /// passed to `callback(responses, error)`; see `spawn_completion`.
+    #[allow(clippy::too_many_arguments)]
+    #[pyo3(signature = (callback, messages_list, model=None, temperature=None, max_tokens=None, max_concurrency=None, **kwargs))]
+    fn spawn_completion_batch(
+        &self,
+        callback: Py<PyAny>,
+        messages_list: &Bound<'_, PyList>,
+        model: Option<&str>,
+        temperature: Option<f32>,
+        max_tokens: Option<u32>,
+        max_concurrency: Option<usize>,
+        kwargs: Option<&Bound<'_, PyDict>>,
+    ) -> PyResult<PyPendingCall> {
+        let handle = self.handle()?;
+        let model_str = self.resolve_model(model)?;
+        let requests = build_requests(&model_str, messages_list, temperature, max_tokens, kwargs)?;
+
+        let client = handle.client.clone();
+
+        let task = handle.spawn(
+            async move {
+                Ok(client
+                    .completion_batch(&model_str, requests, max_concurrency)
+                    .await)
+            },
+            deliver(callback, |py, results| results_to_py(py, results, false)),
+        );
+
+        Ok(PyPendingCall { task })
+    }
+
+    /// Complete several independent prompts, in one request where the provider allows it
+    #[pyo3(signature = (prompts, model=None, temperature=None, max_tokens=None, **kwargs))]
+    fn completion_prompts(
+        &self,
+        py: Python<'_>,
+        prompts: Vec<String>,
+        model: Option<&str>,
+        temperature: Option<f32>,
+        max_tokens: Option<u32>,
+        kwargs: Option<&Bound<'_, PyDict>>,
+    ) -> PyResult<Py<PyAny>> {
+        let handle = self.handle()?;
+        let model_str = self.resolve_model(model)?;
+
+        let request = build_request(&model_str, Vec::new(), temperature, max_tokens, kwargs)?;
+
+        let client = handle.client.clone();
+
+        let results = py.detach(|| {
+            handle.block_on(async move {
+                client
+                    .completion_prompts(&model_str, prompts, request)
+                    .await
+            })
+        })?;
+
+        let responses = PyList::empty(py);
+        for response in &results {
+            responses.append(response_to_py(py, response)?)?;
         }
-        dict.set_item("choices", choices)?;
 
-        // Convert usage
-        if let Some(usage) = &response.usage {
-            let usage_dict = PyDict::new(py);
-            usage_dict.set_item("prompt_tokens", usage.prompt_tokens)?;
-            usage_dict.set_item("completion_tokens", usage.completion_tokens)?;
-            usage_dict.set_item("total_tokens", usage.total_tokens)?;
-            dict.set_item("usage", usage_dict)?;
+        Ok(responses.into())
+    }
+
+    /// Check if the model's provider supports the Batch API
+    #[pyo3(signature = (model=None))]
+    fn supports_batch(&self, model: Option<&str>) -> PyResult<bool> {
+        let model_str = self.resolve_model(model)?;
+        Ok(self.handle()?.client.supports_batch(&model_str)?)
+    }
+
+    /// Submit one request per message list as a provider-side batch job
+    #[pyo3(signature = (messages_list, model=None, temperature=None, max_tokens=None, **kwargs))]
+    fn batch_submit(
+        &self,
+        py: Python<'_>,
+        messages_list: &Bound<'_, PyList>,
+        model: Option<&str>,
+        temperature: Option<f32>,
+        max_tokens: Option<u32>,
+        kwargs: Option<&Bound<'_, PyDict>>,
+    ) -> PyResult<Py<PyAny>> {
+        let handle = self.handle()?;
+        let model_str = self.resolve_model(model)?;
+        let requests = build_requests(&model_str, messages_list, temperature, max_tokens, kwargs)?;
+
+        let client = handle.client.clone();
+
+        let job = py.detach(|| {
+            handle.block_on(async move { client.batch_submit(&model_str, requests).await })
+        })?;
+
+        batch_job_to_py(py, &job)
+    }
+
+    /// Get the current state of a batch job
+    #[pyo3(signature = (batch_id, model=None))]
+    fn batch_poll(
+        &self,
+        py: Python<'_>,
+        batch_id: &str,
+        model: Option<&str>,
+    ) -> PyResult<Py<PyAny>> {
+        let handle = self.handle()?;
+        let model_str = self.resolve_model(model)?;
+
+        let client = handle.client.clone();
+
+        let job = py.detach(|| {
+            handle.block_on(async move { client.batch_poll(&model_str, batch_id).await })
+        })?;
+
+        batch_job_to_py(py, &job)
+    }
+
+    /// Wait for a batch job to finish and return its results keyed by custom_id
+    ///
+    /// Failed requests map to `{"error": "<message>"}`.
+    #[pyo3(signature = (batch_id, model=None))]
+    fn batch_results(
+        &self,
+        py: Python<'_>,
+        batch_id: &str,
+        model: Option<&str>,
+    ) -> PyResult<Py<PyAny>> {
+        let handle = self.handle()?;
+        let model_str = self.resolve_model(model)?;
+
+        let client = handle.client.clone();
+
+        let results = py.detach(|| {
+            handle.block_on(async move { client.batch_results(&model_str, batch_id).await })
+        })?;
+
+        let dict = PyDict::new(py);
+        for BatchResult { custom_id, result } in results {
+            dict.set_item(custom_id, result_to_py(py, result)?)?;
         }
 
         Ok(dict.into())
     }
 
+    /// Get response cache statistics
+    fn cache_stats(&self, py: Python<'_>) -> PyResult<Py<PyAny>> {
+        let stats = self.handle()?.client.cache_stats().unwrap_or_default();
+        let dict = PyDict::new(py);
+        dict.set_item("hits", stats.hits)?;
+        dict.set_item("misses", stats.misses)?;
+        dict.set_item("size", stats.size)?;
+        Ok(dict.into())
+    }
+
     /// List available providers
-    fn providers(&self) -> Vec<String> {
-        self.inner.providers()
+    fn providers(&self) -> PyResult<Vec<String>> {
+        Ok(self.handle()?.client.providers())
     }
 
     /// List configured models
-    fn models(&self) -> Vec<String> {
-        self.inner.get_configured_models()
+    fn models(&self) -> PyResult<Vec<String>> {
+        Ok(self.handle()?.client.get_configured_models())
     }
 
     /// Get info about a provider
     fn provider_info(&self, py: Python<'_>, name: &str) -> PyResult<Option<Py<PyAny>>> {
-        match self.inner.provider_info(name) {
+        match self.handle()?.client.provider_info(name) {
             Some(info) => {
                 let dict = PyDict::new(py);
                 dict.set_item("name", &info.name)?;
@@ -597,8 +1474,8 @@ impl PyLlmClient {
     #[pyo3(signature = (callback, messages, model=None, temperature=None, max_tokens=None, tools=None, **kwargs))]
     fn stream_with_callback(
         &self,
-        _py: Python<'_>,
-        callback: &Bound<'_, PyAny>,
+        py: Python<'_>,
+        callback: Py<PyAny>,
         messages: &Bound<'_, PyList>,
         model: Option<&str>,
         temperature: Option<f32>,
@@ -606,197 +1483,501 @@ impl PyLlmClient {
         tools: Option<&Bound<'_, PyList>>,
         kwargs: Option<&Bound<'_, PyDict>>,
     ) -> PyResult<()> {
-        use futures::StreamExt;
+        let handle = self.handle()?;
+        let model_str = self.resolve_model(model)?;
 
-        // Resolve model
-        let model_str = if let Some(m) = model {
-            m.to_string()
-        } else {
-            self.inner.get_default_model().ok_or_else(|| {
-                LlmaoError::Config("No model specified and no models configured.".to_string())
-            })?
-        };
+        let request =
+            build_stream_request(&model_str, messages, temperature, max_tokens, tools, kwargs)?;
+
+        let client = handle.client.clone();
 
-        // Convert Python messages to Rust
-        let rust_messages = convert_messages(messages)?;
+        // Run the streaming in the runtime without holding the GIL, so the
+        // consuming Python thread sees each chunk as soon as it arrives
+        py.detach(|| handle.block_on(stream_to_callback(client, model_str, request, callback)))?;
 
-        // Build request
-        let mut request = CompletionRequest::new(model_str.clone(), rust_messages);
+        Ok(())
+    }
+
+    /// Start a streaming completion on the runtime without waiting for it
+    ///
+    /// `callback(chunk)` is called for each chunk as it arrives, then
+    /// `on_done(None, error)` once the stream ends; see `spawn_completion`.
+    #[allow(clippy::too_many_arguments)]
+    #[pyo3(signature = (callback, on_done, messages, model=None, temperature=None, max_tokens=None, tools=None, **kwargs))]
+    fn spawn_stream(
+        &self,
+        callback: Py<PyAny>,
+        on_done: Py<PyAny>,
+        messages: &Bound<'_, PyList>,
+        model: Option<&str>,
+        temperature: Option<f32>,
+        max_tokens: Option<u32>,
+        tools: Option<&Bound<'_, PyList>>,
+        kwargs: Option<&Bound<'_, PyDict>>,
+    ) -> PyResult<PyPendingCall> {
+        let handle = self.handle()?;
+        let model_str = self.resolve_model(model)?;
+
+        let request =
+            build_stream_request(&model_str, messages, temperature, max_tokens, tools, kwargs)?;
+
+        let client = handle.client.clone();
+
+        let task = handle.spawn(
+            stream_to_callback(client, model_str, request, callback),
+            deliver(on_done, |py, ()| Ok(py.None())),
+        );
+
+        Ok(PyPendingCall { task })
+    }
+}
+
+/// A request running in the background on a client's runtime
+#[pyclass(name = "PendingCall")]
+struct PyPendingCall {
+    task: tokio::task::AbortHandle,
+}
+
+#[pymethods]
+impl PyPendingCall {
+    /// Abort the request if it is still running; its callback is told "Client is closed"
+    fn cancel(&self) {
+        self.task.abort();
+    }
+}
+
+/// Python wrapper for a bound completion
+#[pyclass(name = "BoundCompletion")]
+struct PyBoundCompletion {
+    /// Client the request was bound with; its runtime drives the requests
+    client: Py<PyLlmClient>,
+
+    /// Pre-serialized request
+    bound: Arc<BoundCompletion>,
+}
+
+#[pymethods]
+impl PyBoundCompletion {
+    /// Make a completion request for a user message
+    fn __call__(&self, py: Python<'_>, user: &str) -> PyResult<Py<PyAny>> {
+        let handle = self.client.borrow(py).handle()?;
+        let client = handle.client.clone();
+        let bound = self.bound.clone();
+
+        let response = py.detach(|| {
+            handle.block_on(async move { client.completion_bound(&bound, user).await })
+        })?;
+
+        response_to_py(py, &response)
+    }
+
+    /// Make a completion request for a user message and return only the text
+    fn text(&self, py: Python<'_>, user: &str) -> PyResult<Option<String>> {
+        let handle = self.client.borrow(py).handle()?;
+        let client = handle.client.clone();
+        let bound = self.bound.clone();
+
+        let response = py.detach(|| {
+            handle.block_on(async move { client.completion_bound(&bound, user).await })
+        })?;
+
+        Ok(response.text())
+    }
 
-        if let Some(temp) = temperature {
-            request.temperature = Some(temp);
+    /// Make completion requests concurrently, one per user message
+    ///
+    /// Responses are in input order. Raises the first error if any request fails.
+    #[pyo3(signature = (users, max_concurrency=None))]
+    fn batch(
+        &self,
+        py: Python<'_>,
+        users: Vec<String>,
+        max_concurrency: Option<usize>,
+    ) -> PyResult<Py<PyAny>> {
+        let handle = self.client.borrow(py).handle()?;
+        let client = handle.client.clone();
+        let bound = self.bound.clone();
+
+        let results = py.detach(|| {
+            handle.block_on(async move {
+                Ok(client
+                    .completion_bound_batch(&bound, &users, max_concurrency)
+                    .await)
+            })
+        })?;
+
+        results_to_py(py, results, false)
+    }
+
+    /// Start completion requests for several user messages without waiting for them
+    ///
+    /// The response list (or the first error) is passed to `callback(responses, error)`.
+    #[pyo3(signature = (callback, users, max_concurrency=None))]
+    fn spawn_batch(
+        &self,
+        py: Python<'_>,
+        callback: Py<PyAny>,
+        users: Vec<String>,
+        max_concurrency: Option<usize>,
+    ) -> PyResult<PyPendingCall> {
+        let handle = self.client.borrow(py).handle()?;
+        let client = handle.client.clone();
+        let bound = self.bound.clone();
+
+        let task = handle.spawn(
+            async move {
+                Ok(client
+                    .completion_bound_batch(&bound, &users, max_concurrency)
+                    .await)
+            },
+            deliver(callback, |py, results| results_to_py(py, results, false)),
+        );
+
+        Ok(PyPendingCall { task })
+    }
+
+    /// Model the request was bound to
+    #[getter]
+    fn model(&self) -> &str {
+        self.bound.model()
+    }
+}
+
+/// Convert a stream chunk into the flat dict passed to streaming callbacks
+fn stream_chunk_to_py<'py>(py: Python<'py>, chunk: &api::StreamChunk) -> Bound<'py, PyDict> {
+    let dict = PyDict::new(py);
+    dict.set_item("id", &chunk.id).ok();
+    dict.set_item("model", &chunk.model).ok();
+    dict.set_item("created", chunk.created).ok();
+
+    // Extract content from first choice delta
+    if let Some(choice) = chunk.choices.first() {
+        if let Some(content) = &choice.delta.content {
+            dict.set_item("content", content).ok();
+        }
+        if let Some(role) = &choice.delta.role {
+            dict.set_item("role", role).ok();
         }
-        if let Some(max) = max_tokens {
-            request.max_tokens = Some(max);
+        if let Some(reason) = &choice.finish_reason {
+            dict.set_item("finish_reason", reason).ok();
         }
+        dict.set_item("index", choice.index).ok();
+
+        // Include tool call deltas if present
+        if let Some(tool_calls) = &choice.delta.tool_calls {
+            let tc_list = PyList::empty(py);
+            for tc in tool_calls {
+                let tc_dict = PyDict::new(py);
+                tc_dict.set_item("index", tc.index).ok();
+                if let Some(id) = &tc.id {
+                    tc_dict.set_item("id", id).ok();
+                }
+                if let Some(t) = &tc.call_type {
+                    tc_dict.set_item("type", t).ok();
+                }
+                if let Some(func) = &tc.function {
+                    let func_dict = PyDict::new(py);
+                    if let Some(name) = &func.name {
+                        func_dict.set_item("name", name).ok();
+                    }
+                    if let Some(args) = &func.arguments {
+                        func_dict.set_item("arguments", args).ok();
+                    }
+                    tc_dict.set_item("function", func_dict).ok();
+                }
+                tc_list.append(tc_dict).ok();
+            }
+            dict.set_item("tool_calls", tc_list).ok();
+        }
+    }
+
+    dict
+}
+
+/// Stream a completion, calling `callback` with each chunk as it arrives
+async fn stream_to_callback(
+    client: Arc<LlmClient>,
+    model: String,
+    request: CompletionRequest,
+    callback: Py<PyAny>,
+) -> Result<()> {
+    use futures::StreamExt;
+
+    let resolved = client.resolve_model(&model)?;
+    let provider = &resolved.provider;
+
+    // Build request body with stream=true
+    let mut body = serde_json::to_value(&request)?;
+    if let Some(obj) = body.as_object_mut() {
+        obj.insert(
+            "model".to_string(),
+            serde_json::Value::String(resolved.model_id.clone()),
+        );
+        obj.insert("stream".to_string(), serde_json::Value::Bool(true));
+    }
 
-        // Add tools if provided
-        if let Some(tools_list) = tools {
-            let tools_json = python_to_json(tools_list.as_any())?;
-            request.extra.insert("tools".to_string(), tools_json);
+    // Apply prompt caching and parameter mappings
+    provider.config().apply_prompt_caching(&mut body);
+    provider.config().apply_param_mappings(&mut body);
+
+    // Wait for the provider's rate limit, then get an API key
+    provider.wait_for_capacity().await;
+    let key = provider.get_key()?;
+
+    // Make streaming request
+    let mut stream = client
+        .http_client
+        .post_stream(
+            provider.chat_url(),
+            &body,
+            key.json_headers()?,
+            provider.name(),
+        )
+        .await?;
+
+    // Call the Python callback for each chunk, acquiring the GIL only for the call
+    let emit = |chunk: &api::StreamChunk| {
+        Python::attach(|py| {
+            callback.call1(py, (stream_chunk_to_py(py, chunk),)).ok();
+        });
+    };
+
+    let mut decoder = api::SseDecoder::new();
+    while let Some(result) = stream.next().await {
+        for chunk in decoder.push(&result?)? {
+            emit(&chunk);
         }
+    }
+
+    // Process remaining buffer
+    if let Some(chunk) = decoder.finish()? {
+        emit(&chunk);
+    }
 
-        // Add extra kwargs
-        if let Some(extra) = kwargs {
-            for (key, value) in extra.iter() {
-                let key_str: String = key.extract()?;
-                let json_value = python_to_json(&value)?;
-                request.extra.insert(key_str, json_value);
+    Ok(())
+}
+
+/// Build an `on_done` for `ClientHandle::spawn` that calls a Python `callback(result, error)`
+fn deliver<T: 'static>(
+    callback: Py<PyAny>,
+    to_py: impl FnOnce(Python<'_>, T) -> PyResult<Py<PyAny>> + Send + 'static,
+) -> impl FnOnce(Result<T>) + Send + 'static {
+    move |output| {
+        Python::attach(|py| {
+            let (result, error) = match output
+                .map_err(PyErr::from)
+                .and_then(|value| to_py(py, value))
+            {
+                Ok(result) => (result, py.None()),
+                Err(e) => (py.None(), e.into_value(py).into_any()),
+            };
+            // Fails only if the caller's event loop is already closed; no one is waiting then
+            callback.call1(py, (result, error)).ok();
+        });
+    }
+}
+
+/// Build a completion request from Python arguments
+///
+/// A `cache` kwarg opts the call in to (or out of) the response cache; it is
+/// taken out here and never sent to the provider.
+fn build_request(
+    model: &str,
+    messages: Vec<Message>,
+    temperature: Option<f32>,
+    max_tokens: Option<u32>,
+    kwargs: Option<&Bound<'_, PyDict>>,
+) -> PyResult<CompletionRequest> {
+    let mut request = CompletionRequest::new(model.to_string(), messages);
+
+    if let Some(temp) = temperature {
+        request.temperature = Some(temp);
+    }
+    if let Some(max) = max_tokens {
+        request.max_tokens = Some(max);
+    }
+
+    // Add extra kwargs
+    if let Some(extra) = kwargs {
+        for (key, value) in extra.iter() {
+            let key_str: String = key.extract()?;
+            if key_str == "cache" {
+                request.cache = value.extract()?;
+                continue;
             }
+            let json_value = python_to_json(&value)?;
+            request.extra.insert(key_str, json_value);
         }
+    }
 
-        // Get client and model for async block
-        let client = self.inner.clone();
-        let model_for_stream = model_str.clone();
-
-        // Stream with callback - we need to call into Python for each chunk
-        // Run the streaming in the runtime, calling back to Python for each chunk
-        self.runtime.block_on(async {
-            let route = ModelRoute::parse(&model_for_stream)?;
-            let provider_config = client.get_provider(&route.provider)?;
-
-            // Build request body with stream=true
-            let mut body = serde_json::to_value(&request)?;
-            if let Some(obj) = body.as_object_mut() {
-                obj.insert(
-                    "model".to_string(),
-                    serde_json::Value::String(route.model_id()),
-                );
-                obj.insert("stream".to_string(), serde_json::Value::Bool(true));
-            }
+    Ok(request)
+}
 
-            // Apply parameter mappings
-            provider_config.apply_param_mappings(&mut body);
+/// Build a streaming request from Python arguments, passing tool definitions through
+fn build_stream_request(
+    model: &str,
+    messages: &Bound<'_, PyList>,
+    temperature: Option<f32>,
+    max_tokens: Option<u32>,
+    tools: Option<&Bound<'_, PyList>>,
+    kwargs: Option<&Bound<'_, PyDict>>,
+) -> PyResult<CompletionRequest> {
+    let mut request = build_request(
+        model,
+        convert_messages(messages)?,
+        temperature,
+        max_tokens,
+        kwargs,
+    )?;
+
+    if let Some(tools_list) = tools {
+        let tools_json = python_to_json(tools_list.as_any())?;
+        request.extra.insert("tools".to_string(), tools_json);
+    }
 
-            // Build URL
-            let base_url = provider_config.get_base_url();
-            let url = format!("{}/chat/completions", base_url.trim_end_matches('/'));
+    Ok(request)
+}
 
-            // Build extra headers
-            let extra_headers = if provider_config.headers.is_empty() {
-                None
-            } else {
-                let mut headers = reqwest::header::HeaderMap::new();
-                for (key, value) in &provider_config.headers {
-                    if let (Ok(name), Ok(val)) = (
-                        reqwest::header::HeaderName::try_from(key.as_str()),
-                        reqwest::header::HeaderValue::from_str(value),
-                    ) {
-                        headers.insert(name, val);
-                    }
-                }
-                Some(headers)
-            };
+/// Build one completion request per message list
+fn build_requests(
+    model: &str,
+    messages_list: &Bound<'_, PyList>,
+    temperature: Option<f32>,
+    max_tokens: Option<u32>,
+    kwargs: Option<&Bound<'_, PyDict>>,
+) -> PyResult<Vec<CompletionRequest>> {
+    // Convert the shared params from Python once, then clone per request
+    let template = build_request(model, Vec::new(), temperature, max_tokens, kwargs)?;
+
+    let mut requests = Vec::with_capacity(messages_list.len());
+    for messages in messages_list.iter() {
+        let mut request = template.clone();
+        request.messages = convert_messages(messages.cast::<PyList>()?)?;
+        requests.push(request);
+    }
+    Ok(requests)
+}
 
-            // Get API key
-            let api_key = client.get_api_key(&route.provider)?;
+/// Convert a batch job to a Python dict
+fn batch_job_to_py(py: Python<'_>, job: &BatchJob) -> PyResult<Py<PyAny>> {
+    let dict = PyDict::new(py);
+    dict.set_item("id", &job.id)?;
+    dict.set_item("status", &job.status)?;
+    dict.set_item("output_file_id", &job.output_file_id)?;
+    dict.set_item("error_file_id", &job.error_file_id)?;
+
+    if let Some(counts) = &job.request_counts {
+        let counts_dict = PyDict::new(py);
+        counts_dict.set_item("total", counts.total)?;
+        counts_dict.set_item("completed", counts.completed)?;
+        counts_dict.set_item("failed", counts.failed)?;
+        dict.set_item("request_counts", counts_dict)?;
+    }
 
-            // Make streaming request
-            let mut stream = client
-                .http_client
-                .post_stream(&url, &body, &api_key, extra_headers.as_ref(), &route.provider)
-                .await?;
+    Ok(dict.into())
+}
 
-            let mut buffer = String::new();
-
-            while let Some(result) = stream.next().await {
-                let bytes = result?;
-                buffer.push_str(&String::from_utf8_lossy(&bytes));
-
-                // Process complete lines
-                while let Some(newline_pos) = buffer.find('\n') {
-                    let line = buffer[..newline_pos].to_string();
-                    buffer = buffer[newline_pos + 1..].to_string();
-
-                    if let Some(chunk) = api::parse_sse_line(&line)? {
-                        // Call Python callback with chunk data
-                        // We need to acquire GIL to call Python
-                        Python::attach(|py| {
-                            let dict = PyDict::new(py);
-                            dict.set_item("id", &chunk.id).ok();
-                            dict.set_item("model", &chunk.model).ok();
-                            dict.set_item("created", chunk.created).ok();
-
-                            // Extract content from first choice delta
-                            if let Some(choice) = chunk.choices.first() {
-                                if let Some(content) = &choice.delta.content {
-                                    dict.set_item("content", content).ok();
-                                }
-                                if let Some(role) = &choice.delta.role {
-                                    dict.set_item("role", role).ok();
-                                }
-                                if let Some(reason) = &choice.finish_reason {
-                                    dict.set_item("finish_reason", reason).ok();
-                                }
-                                dict.set_item("index", choice.index).ok();
-
-                                // Include tool call deltas if present
-                                if let Some(tool_calls) = &choice.delta.tool_calls {
-                                    let tc_list = PyList::empty(py);
-                                    for tc in tool_calls {
-                                        let tc_dict = PyDict::new(py);
-                                        tc_dict.set_item("index", tc.index).ok();
-                                        if let Some(id) = &tc.id {
-                                            tc_dict.set_item("id", id).ok();
-                                        }
-                                        if let Some(t) = &tc.call_type {
-                                            tc_dict.set_item("type", t).ok();
-                                        }
-                                        if let Some(func) = &tc.function {
-                                            let func_dict = PyDict::new(py);
-                                            if let Some(name) = &func.name {
-                                                func_dict.set_item("name", name).ok();
-                                            }
-                                            if let Some(args) = &func.arguments {
-                                                func_dict.set_item("arguments", args).ok();
-                                            }
-                                            tc_dict.set_item("function", func_dict).ok();
-                                        }
-                                        tc_list.append(tc_dict).ok();
-                                    }
-                                    dict.set_item("tool_calls", tc_list).ok();
-                                }
-                            }
+/// Convert a completion response to a Python dict
+fn response_to_py(py: Python<'_>, response: &CompletionResponse) -> PyResult<Py<PyAny>> {
+    let dict = PyDict::new(py);
+    dict.set_item("id", &response.id)?;
+    dict.set_item("object", &response.object)?;
+    dict.set_item("created", response.created)?;
+    dict.set_item("model", &response.model)?;
+
+    // Convert choices
+    let choices = PyList::empty(py);
+    for choice in &response.choices {
+        let choice_dict = PyDict::new(py);
+        choice_dict.set_item("index", choice.index)?;
+        choice_dict.set_item("finish_reason", &choice.finish_reason)?;
+
+        let message_dict = PyDict::new(py);
+        message_dict.set_item("role", &choice.message.role)?;
+
+        // Use content, or fall back to reasoning if content is empty
+        message_dict.set_item("content", choice.message.text_or_reasoning())?;
+
+        // Also expose reasoning if present
+        if let Some(reasoning) = &choice.message.reasoning {
+            message_dict.set_item("reasoning", reasoning)?;
+        }
 
-                            // Call the Python callback
-                            callback.call1((dict,)).ok();
-                        });
-                    }
-                }
-            }
+        // Also expose tool_calls if present
+        if let Some(tool_calls) = &choice.message.tool_calls {
+            let tools_list = PyList::empty(py);
+            for tool in tool_calls {
+                let tool_dict = PyDict::new(py);
+                tool_dict.set_item("id", &tool.id)?;
+                tool_dict.set_item("type", &tool.call_type)?;
 
-            // Process remaining buffer
-            if !buffer.trim().is_empty() {
-                if let Some(chunk) = api::parse_sse_line(&buffer)? {
-                    Python::attach(|py| {
-                        let dict = PyDict::new(py);
-                        dict.set_item("id", &chunk.id).ok();
-                        if let Some(choice) = chunk.choices.first() {
-                            if let Some(content) = &choice.delta.content {
-                                dict.set_item("content", content).ok();
-                            }
-                            if let Some(reason) = &choice.finish_reason {
-                                dict.set_item("finish_reason", reason).ok();
-                            }
-                        }
-                        callback.call1((dict,)).ok();
-                    });
-                }
+                let func_dict = PyDict::new(py);
+                func_dict.set_item("name", &tool.function.name)?;
+                func_dict.set_item("arguments", &tool.function.arguments)?;
+
+                tool_dict.set_item("function", func_dict)?;
+                tools_list.append(tool_dict)?;
             }
+            message_dict.set_item("tool_calls", tools_list)?;
+        }
 
-            Ok::<(), LlmaoError>(())
-        })?;
+        choice_dict.set_item("message", message_dict)?;
 
-        Ok(())
+        choices.append(choice_dict)?;
     }
+    dict.set_item("choices", choices)?;
+
+    // Convert usage
+    if let Some(usage) = &response.usage {
+        let usage_dict = PyDict::new(py);
+        usage_dict.set_item("prompt_tokens", usage.prompt_tokens)?;
+        usage_dict.set_item("completion_tokens", usage.completion_tokens)?;
+        usage_dict.set_item("total_tokens", usage.total_tokens)?;
+        dict.set_item("usage", usage_dict)?;
+    }
+
+    Ok(dict.into())
 }
 
+/// Convert a completion result to a response dict, or `{"error": "<message>"}` if it failed
+fn result_to_py(py: Python<'_>, result: Result<CompletionResponse>) -> PyResult<Py<PyAny>> {
+    match result {
+        Ok(response) => response_to_py(py, &response),
+        Err(e) => {
+            let error = PyDict::new(py);
+            error.set_item("error", e.to_string())?;
+            Ok(error.into())
+        }
+    }
+}
+
+/// Convert batch results to a list of response dicts
+///
+/// Raises the first error, unless `return_errors` is set, in which case failed
+/// requests map to `{"error": "<message>"}`.
+fn results_to_py(
+    py: Python<'_>,
+    results: Vec<Result<CompletionResponse>>,
+    return_errors: bool,
+) -> PyResult<Py<PyAny>> {
+    let responses = PyList::empty(py);
+    for result in results {
+        let response = if return_errors {
+            result_to_py(py, result)?
+        } else {
+            response_to_py(py, &result?)?
+        };
+        responses.append(response)?;
+    }
+
+    Ok(responses.into())
+}
 
 /// Convert Python list of message dicts to Rust Messages
 fn convert_messages(messages: &Bound<'_, PyList>) -> PyResult<Vec<Message>> {
     use api::{FunctionCall, ToolCall};
 
-    let mut result = Vec::new();
+    let mut result = Vec::with_capacity(messages.len());
 
     for item in messages.iter() {
         let dict: &Bound<'_, PyDict> = item.cast()?;
@@ -920,6 +2101,20 @@ fn python_to_json(obj: &Bound<'_, pyo3::PyAny>) -> PyResult<serde_json::Value> {
     }
 }
 
+/// Shared client for the module-level `completion()` helper, built on first use so
+/// repeated calls reuse one connection pool instead of re-reading config every time
+static DEFAULT_CLIENT: OnceLock<PyLlmClient> = OnceLock::new();
+
+/// Get the shared default client, creating it if needed
+fn default_client() -> PyResult<&'static PyLlmClient> {
+    if let Some(client) = DEFAULT_CLIENT.get() {
+        return Ok(client);
+    }
+    // No prewarm: this client is created for a request that is about to go out anyway
+    let client = PyLlmClient::new(None, None, None, 1024, false)?;
+    Ok(DEFAULT_CLIENT.get_or_init(|| client))
+}
+
 /// Convenience function for quick completions
 #[pyfunction]
 #[pyo3(signature = (messages, model=None, temperature=None, max_tokens=None, **kwargs))]
@@ -931,15 +2126,332 @@ fn completion(
     max_tokens: Option<u32>,
     kwargs: Option<&Bound<'_, PyDict>>,
 ) -> PyResult<Py<PyAny>> {
-    let client = PyLlmClient::new(None, None)?;
-    client.completion(py, messages, model, temperature, max_tokens, None, kwargs)
+    default_client()?.completion(py, messages, model, temperature, max_tokens, None, kwargs)
 }
 
 /// Python module definition
 #[pymodule]
 fn _llmao(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_class::<PyLlmClient>()?;
+    m.add_class::<PyBoundCompletion>()?;
+    m.add_class::<PyPendingCall>()?;
     m.add_function(wrap_pyfunction!(completion, m)?)?;
     m.add("__version__", env!("CARGO_PKG_VERSION"))?;
     Ok(())
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use std::time::{Duration, Instant};
+
+    const COMPLETION: &str = r#"{"id":"c1","object":"chat.completion","created":1,"model":"m","choices":[{"index":0,"message":{"role":"assistant","content":"Hi"},"finish_reason":"stop"}]}"#;
+
+    /// Client with a single custom provider, "mock", served from `base_url`
+    fn mock_client(base_url: &str, keys: &[&str]) -> LlmClient {
+        let config: config::ProvidersConfig = serde_json::from_value(serde_json::json!({
+            "mock": {"base_url": base_url, "keys": keys, "models": ["m"]}
+        }))
+        .unwrap();
+        LlmClient::from_loader(ConfigLoader::from_config(config).unwrap()).unwrap()
+    }
+
+    fn request() -> CompletionRequest {
+        CompletionRequest::new(String::new(), vec![Message::text("user", "Hello!")])
+    }
+
+    #[test]
+    fn test_bound_body_matches_regular_body() {
+        let config: config::ProvidersConfig = serde_json::from_value(serde_json::json!({
+            "mock": {
+                "base_url": "http://127.0.0.1:9",
+                "keys": ["key1"],
+                "models": ["m"],
+                "param_mappings": {"max_tokens": "max_completion_tokens"},
+                "special_handling": {"prompt_cache_control": true}
+            }
+        }))
+        .unwrap();
+        let client = LlmClient::from_loader(ConfigLoader::from_config(config).unwrap()).unwrap();
+
+        let mut template =
+            CompletionRequest::new(String::new(), vec![Message::text("system", "Be brief.")]);
+        template.temperature = Some(0.2);
+        template.max_tokens = Some(50);
+        template
+            .extra
+            .insert("cache_control".to_string(), serde_json::Value::Bool(true));
+        let bound = client.bind("mock/m", template).unwrap();
+
+        for user in [
+            "Hello!",
+            r#"Say "hi""#,
+            r"C:\path\to\file",
+            "line one\nline two\ttabbed\r\n",
+            "Jakarta, café, 日本語, 🎉",
+            USER_PLACEHOLDER,
+        ] {
+            let body: serde_json::Value =
+                serde_json::from_slice(&bound.body(user).unwrap()).unwrap();
+            let expected = build_chat_body(&bound.resolved, &bound.request(user)).unwrap();
+            assert_eq!(body, expected);
+            assert_eq!(body["messages"][1]["content"], user);
+        }
+
+        // The provider's mappings and caching markers made it into the template
+        let body: serde_json::Value = serde_json::from_slice(&bound.body("Hi").unwrap()).unwrap();
+        assert_eq!(body["max_completion_tokens"], 50);
+        assert_eq!(
+            body["messages"][0]["content"][0]["cache_control"]["type"],
+            "ephemeral"
+        );
+    }
+
+    #[tokio::test]
+    async fn test_legacy_completions_send_prompts_in_one_request() {
+        let mut server = mockito::Server::new_async().await;
+        let completions = server
+            .mock("POST", "/completions")
+            .match_body(mockito::Matcher::PartialJson(serde_json::json!({
+                "model": "m",
+                "prompt": ["Hi!", "Capital of Indonesia?"],
+                "n": 2
+            })))
+            .with_body(
+                r#"{"id":"cmpl-1","object":"text_completion","created":1,"model":"m","choices":[
+                    {"index":3,"text":"Jakarta.","finish_reason":"stop"},
+                    {"index":0,"text":"Hello!","finish_reason":"stop"},
+                    {"index":2,"text":"Jakarta","finish_reason":"stop"},
+                    {"index":1,"text":"Hi there!","finish_reason":"length"}
+                ],"usage":{"prompt_tokens":12,"completion_tokens":9,"total_tokens":21}}"#,
+            )
+            .expect(1)
+            .create_async()
+            .await;
+
+        let config: config::ProvidersConfig = serde_json::from_value(serde_json::json!({
+            "mock": {
+                "base_url": server.url(),
+                "keys": ["key1"],
+                "models": ["m"],
+                "special_handling": {"use_legacy_completions": true}
+            }
+        }))
+        .unwrap();
+        let client = LlmClient::from_loader(ConfigLoader::from_config(config).unwrap()).unwrap();
+
+        let mut request = CompletionRequest::new(String::new(), Vec::new());
+        request.extra.insert("n".to_string(), serde_json::json!(2));
+        let prompts = vec!["Hi!".to_string(), "Capital of Indonesia?".to_string()];
+        let responses = client
+            .completion_prompts("mock/m", prompts, request)
+            .await
+            .unwrap();
+
+        completions.assert_async().await;
+        let texts: Vec<Vec<String>> = responses
+            .iter()
+            .map(|r| {
+                r.choices
+                    .iter()
+                    .map(|c| c.message.text_or_reasoning())
+                    .collect()
+            })
+            .collect();
+        assert_eq!(texts, [["Hello!", "Hi there!"], ["Jakarta", "Jakarta."]]);
+        assert_eq!(responses[0].usage.as_ref().unwrap().total_tokens, 21);
+        assert!(responses[1].usage.is_none());
+    }
+
+    #[tokio::test]
+    async fn test_sampled_calls_are_cached_only_when_opted_in() {
+        let mut server = mockito::Server::new_async().await;
+        let completions = server
+            .mock("POST", "/chat/completions")
+            .with_body(COMPLETION)
+            .expect(3)
+            .create_async()
+            .await;
+
+        let client =
+            mock_client(&server.url(), &["key1"]).with_response_cache(16, Duration::from_secs(60));
+        let mut sampled = request();
+        sampled.temperature = Some(0.7);
+
+        // Each sampled call goes to the provider...
+        client.completion("mock/m", sampled.clone()).await.unwrap();
+        client.completion("mock/m", sampled.clone()).await.unwrap();
+
+        // ...unless it opts in to the cache
+        let opted_in = sampled.with_cache(true);
+        client.completion("mock/m", opted_in.clone()).await.unwrap();
+        client.completion("mock/m", opted_in).await.unwrap();
+
+        completions.assert_async().await;
+        assert_eq!(client.cache_stats().unwrap().hits, 1);
+    }
+
+    #[tokio::test]
+    async fn test_cached_looks_up_without_sending() {
+        let mut server = mockito::Server::new_async().await;
+        let completions = server
+            .mock("POST", "/chat/completions")
+            .with_body(COMPLETION)
+            .expect(1)
+            .create_async()
+            .await;
+
+        let client =
+            mock_client(&server.url(), &["key1"]).with_response_cache(16, Duration::from_secs(60));
+        let mut deterministic = request();
+        deterministic.temperature = Some(0.0);
+
+        assert!(client.cached("mock/m", &deterministic).unwrap().is_none());
+        client
+            .completion("mock/m", deterministic.clone())
+            .await
+            .unwrap();
+        assert!(client.cached("mock/m", &deterministic).unwrap().is_some());
+
+        // Sampled requests are only looked up if they opt in
+        let mut sampled = deterministic.clone();
+        sampled.temperature = Some(0.7);
+        assert!(client.cached("mock/m", &sampled).unwrap().is_none());
+
+        // The lookups count the hit; the miss is counted once, by the request
+        completions.assert_async().await;
+        let stats = client.cache_stats().unwrap();
+        assert_eq!((stats.hits, stats.misses), (1, 1));
+    }
+
+    #[test]
+    fn test_close_cancels_calls_in_flight() {
+        // Accepts connections but never answers, so requests hang until cancelled
+        let listener = std::net::TcpListener::bind("127.0.0.1:0").unwrap();
+        let base_url = format!("http://{}", listener.local_addr().unwrap());
+        let handle = Arc::new(ClientHandle::new(mock_client(&base_url, &["key1"])).unwrap());
+
+        let in_flight = {
+            let handle = handle.clone();
+            std::thread::spawn(move || {
+                let client = handle.client.clone();
+                handle.block_on(async move { client.completion("mock/m", request()).await })
+            })
+        };
+        std::thread::sleep(Duration::from_millis(200));
+
+        let start = Instant::now();
+        handle.close();
+        let result = in_flight.join().unwrap();
+        assert!(matches!(result, Err(LlmaoError::Config(_))));
+        assert!(start.elapsed() < Duration::from_secs(1));
+
+        // Nothing new runs on a closed handle
+        assert!(handle.block_on(async { Ok(()) }).is_err());
+    }
+
+    #[test]
+    fn test_spawned_calls_always_report_back() {
+        let handle = ClientHandle::new(mock_client("http://127.0.0.1:9", &["key1"])).unwrap();
+        let (sender, receiver) = std::sync::mpsc::channel();
+        let report = || {
+            let sender = sender.clone();
+            move |output: Result<u32>| sender.send(output).unwrap()
+        };
+        let next = || receiver.recv_timeout(Duration::from_secs(1)).unwrap();
+
+        handle.spawn(async { Ok(42) }, report());
+        assert_eq!(next().unwrap(), 42);
+
+        // Aborted tasks still call back, so nothing waits on them forever
+        handle.spawn(std::future::pending(), report()).abort();
+        assert!(matches!(next(), Err(LlmaoError::Config(_))));
+
+        handle.spawn(std::future::pending(), report());
+        handle.close();
+        assert!(matches!(next(), Err(LlmaoError::Config(_))));
+    }
+
+    #[tokio::test]
+    async fn test_rate_limited_key_rotates() {
+        let mut server = mockito::Server::new_async().await;
+        let limited = server
+            .mock("POST", "/chat/completions")
+            .match_header("authorization", "Bearer key1")
+            .with_status(429)
+            .expect(1)
+            .create_async()
+            .await;
+        let ok = server
+            .mock("POST", "/chat/completions")
+            .match_header("authorization", "Bearer key2")
+            .with_body(COMPLETION)
+            .expect(1)
+            .create_async()
+            .await;
+
+        let client = mock_client(&server.url(), &["key1", "key2"]);
+        let response = client.completion("mock/m", request()).await.unwrap();
+
+        assert_eq!(response.content(), Some("Hi".to_string()));
+        limited.assert_async().await;
+        ok.assert_async().await;
+    }
+
+    #[tokio::test]
+    async fn test_single_key_waits_for_retry_after() {
+        let mut server = mockito::Server::new_async().await;
+        let limited = server
+            .mock("POST", "/chat/completions")
+            .with_status(429)
+            .with_header("retry-after", "1")
+            .expect(1)
+            .create_async()
+            .await;
+        let ok = server
+            .mock("POST", "/chat/completions")
+            .with_body(COMPLETION)
+            .expect(1)
+            .create_async()
+            .await;
+
+        let client = mock_client(&server.url(), &["key1"]);
+        let start = Instant::now();
+        client.completion("mock/m", request()).await.unwrap();
+
+        // The jittered backoff alone would retry after at most 750ms
+        assert!(start.elapsed() >= Duration::from_millis(900));
+        limited.assert_async().await;
+        ok.assert_async().await;
+    }
+
+    #[tokio::test]
+    async fn test_open_circuit_fails_fast() {
+        let mut server = mockito::Server::new_async().await;
+        let limited = server
+            .mock("POST", "/chat/completions")
+            .with_status(429)
+            .expect(3)
+            .create_async()
+            .await;
+
+        let client = mock_client(&server.url(), &["key1"]);
+
+        // Three rate limits in a row open the key's circuit
+        let error = client.completion("mock/m", request()).await.unwrap_err();
+        assert!(matches!(
+            error,
+            LlmaoError::RateLimited {
+                retry_after: Some(30),
+                ..
+            }
+        ));
+
+        // While it is open, requests fail without reaching the provider
+        let start = Instant::now();
+        let error = client.completion("mock/m", request()).await.unwrap_err();
+        assert!(matches!(error, LlmaoError::RateLimited { .. }));
+        assert!(start.elapsed() < Duration::from_secs(1));
+        limited.assert_async().await;
+    }
+}
@@ -3,18 +3,38 @@
 //! Manages multiple API keys per provider with rotation strategies.
 
 use crate::config::RotationStrategy;
-use parking_lot::RwLock;
-use std::sync::atomic::{AtomicU64, AtomicUsize, Ordering};
+use crate::error::{LlmaoError, Result};
+use reqwest::header::{HeaderMap, HeaderValue, AUTHORIZATION, CONTENT_TYPE};
+use std::sync::atomic::{AtomicU32, AtomicU64, AtomicUsize, Ordering};
 use std::time::{Duration, Instant};
 
+/// Consecutive rate limit errors after which a key's circuit opens
+const BREAKER_THRESHOLD: u32 = 3;
+
+/// How long an open circuit keeps a key out of rotation
+const BREAKER_OPEN_FOR: Duration = Duration::from_secs(30);
+
 /// A single API key with usage tracking
+///
+/// All state is atomic so picking a key never takes a lock. Times are stored
+/// as milliseconds since `epoch`.
 #[derive(Debug)]
 pub struct ApiKey {
     /// The actual API key value
     value: String,
 
-    /// Time until which this key is rate limited (if any)
-    rate_limited_until: RwLock<Option<Instant>>,
+    /// Request headers for this key, built once (None if the key is not a
+    /// valid header value)
+    headers: Option<KeyHeaders>,
+
+    /// Reference point for the stored timestamps
+    epoch: Instant,
+
+    /// Time until which this key is rate limited (0 if not limited)
+    rate_limited_until: AtomicU64,
+
+    /// Rate limit errors since the last successful request
+    consecutive_failures: AtomicU32,
 
     /// Total number of requests made with this key
     request_count: AtomicU64,
@@ -27,8 +47,11 @@ impl ApiKey {
     /// Create a new API key
     pub fn new(value: String) -> Self {
         Self {
+            headers: build_headers(&value, None),
             value,
-            rate_limited_until: RwLock::new(None),
+            epoch: Instant::now(),
+            rate_limited_until: AtomicU64::new(0),
+            consecutive_failures: AtomicU32::new(0),
             request_count: AtomicU64::new(0),
             last_used: AtomicU64::new(0),
         }
@@ -39,26 +62,40 @@ impl ApiKey {
         &self.value
     }
 
+    /// Get the request headers for this key: Authorization plus provider extras
+    pub fn headers(&self) -> Result<&HeaderMap> {
+        Ok(&self.key_headers()?.plain)
+    }
+
+    /// Get the request headers for JSON requests with this key: `headers()`
+    /// plus a JSON Content-Type, unless the provider overrides it
+    pub fn json_headers(&self) -> Result<&HeaderMap> {
+        Ok(&self.key_headers()?.json)
+    }
+
+    fn key_headers(&self) -> Result<&KeyHeaders> {
+        self.headers.as_ref().ok_or_else(|| {
+            LlmaoError::Config("Invalid API key format: not a valid header value".to_string())
+        })
+    }
+
+    /// Milliseconds elapsed since `epoch`
+    fn now_millis(&self) -> u64 {
+        self.epoch.elapsed().as_millis() as u64
+    }
+
     /// Check if this key is currently rate limited
     pub fn is_rate_limited(&self) -> bool {
-        let guard = self.rate_limited_until.read();
-        if let Some(until) = *guard {
-            Instant::now() < until
-        } else {
-            false
-        }
+        let until = self.rate_limited_until.load(Ordering::Relaxed);
+        until != 0 && self.now_millis() < until
     }
 
     /// Get remaining rate limit duration
     pub fn rate_limit_remaining(&self) -> Option<Duration> {
-        let guard = self.rate_limited_until.read();
-        if let Some(until) = *guard {
-            let now = Instant::now();
-            if now < until {
-                Some(until - now)
-            } else {
-                None
-            }
+        let until = self.rate_limited_until.load(Ordering::Relaxed);
+        let now = self.now_millis();
+        if until != 0 && now < until {
+            Some(Duration::from_millis(until - now))
         } else {
             None
         }
@@ -66,21 +103,53 @@ impl ApiKey {
 
     /// Mark this key as rate limited
     pub fn mark_rate_limited(&self, duration: Duration) {
-        let mut guard = self.rate_limited_until.write();
-        *guard = Some(Instant::now() + duration);
+        let until = self.now_millis() + duration.as_millis() as u64;
+        self.rate_limited_until
+            .store(until.max(1), Ordering::Relaxed);
     }
 
     /// Clear rate limit status
     pub fn clear_rate_limit(&self) {
-        let mut guard = self.rate_limited_until.write();
-        *guard = None;
+        self.rate_limited_until.store(0, Ordering::Relaxed);
+    }
+
+    /// Record a rate limit error for this key
+    ///
+    /// Works as a circuit breaker: after `BREAKER_THRESHOLD` consecutive errors
+    /// the circuit opens and the key leaves rotation for `BREAKER_OPEN_FOR` (or
+    /// the provider's retry-after, if longer). Afterwards the key is tried again
+    /// (half-open): a success closes the circuit, another error reopens it.
+    pub fn record_rate_limited(&self, retry_after: Option<Duration>) {
+        let failures = self.consecutive_failures.fetch_add(1, Ordering::Relaxed) + 1;
+        if failures >= BREAKER_THRESHOLD {
+            self.mark_rate_limited(retry_after.unwrap_or_default().max(BREAKER_OPEN_FOR));
+        } else if let Some(retry_after) = retry_after {
+            self.mark_rate_limited(retry_after);
+        }
+    }
+
+    /// Record a successful request, closing the circuit
+    pub fn record_success(&self) {
+        if self.consecutive_failures.load(Ordering::Relaxed) != 0 {
+            self.consecutive_failures.store(0, Ordering::Relaxed);
+            self.clear_rate_limit();
+        }
+    }
+
+    /// Get the number of rate limit errors since the last success
+    pub fn consecutive_failures(&self) -> u32 {
+        self.consecutive_failures.load(Ordering::Relaxed)
+    }
+
+    /// Check if the circuit breaker has taken this key out of rotation
+    pub fn is_circuit_open(&self) -> bool {
+        self.consecutive_failures() >= BREAKER_THRESHOLD && self.is_rate_limited()
     }
 
     /// Record usage of this key
     pub fn record_usage(&self) {
         self.request_count.fetch_add(1, Ordering::Relaxed);
-        let now = Instant::now().elapsed().as_secs();
-        self.last_used.store(now, Ordering::Relaxed);
+        self.last_used.store(self.now_millis(), Ordering::Relaxed);
     }
 
     /// Get the request count
@@ -121,6 +190,14 @@ impl KeyPool {
         }
     }
 
+    /// Rebuild every key's headers with provider-specific extras
+    pub fn with_headers(mut self, extra_headers: Option<&HeaderMap>) -> Self {
+        for key in &mut self.keys {
+            key.headers = build_headers(&key.value, extra_headers);
+        }
+        self
+    }
+
     /// Get the provider name
     pub fn provider(&self) -> &str {
         &self.provider
@@ -136,17 +213,26 @@ impl KeyPool {
         self.keys.len()
     }
 
+    /// Get the first configured key, regardless of rotation or rate limits
+    pub fn primary_key(&self) -> Option<&ApiKey> {
+        self.keys.first()
+    }
+
     /// Get the next available key based on rotation strategy
     pub fn get_key(&self) -> Option<&ApiKey> {
-        if self.keys.is_empty() {
-            return None;
-        }
-
-        match self.strategy {
-            RotationStrategy::RoundRobin => self.get_round_robin(),
-            RotationStrategy::LeastRecentlyUsed => self.get_lru(),
-            RotationStrategy::Random => self.get_random(),
-        }
+        let key = match self.keys.len() {
+            0 => return None,
+            // Nothing to rotate; skip the shared counter entirely
+            1 => &self.keys[0],
+            _ => match self.strategy {
+                RotationStrategy::RoundRobin => self.get_round_robin()?,
+                RotationStrategy::LeastRecentlyUsed => self.get_lru()?,
+                RotationStrategy::Random => self.get_random()?,
+            },
+        };
+
+        key.record_usage();
+        Some(key)
     }
 
     /// Round-robin key selection
@@ -214,6 +300,11 @@ impl KeyPool {
         self.keys.iter().all(|k| k.is_rate_limited())
     }
 
+    /// Check if every key's circuit breaker is open
+    pub fn all_circuits_open(&self) -> bool {
+        !self.keys.is_empty() && self.keys.iter().all(|k| k.is_circuit_open())
+    }
+
     /// Get the minimum wait time until a key is available
     pub fn min_wait_time(&self) -> Option<Duration> {
         self.keys
@@ -237,6 +328,35 @@ impl KeyPool {
     }
 }
 
+/// Precomputed request headers for a key
+#[derive(Debug)]
+struct KeyHeaders {
+    /// For GET and multipart requests, which set their own Content-Type
+    plain: HeaderMap,
+
+    /// For JSON requests
+    json: HeaderMap,
+}
+
+/// Build the Authorization header for a key plus any provider-specific extras
+fn build_headers(value: &str, extra_headers: Option<&HeaderMap>) -> Option<KeyHeaders> {
+    let mut auth = HeaderValue::from_str(&format!("Bearer {}", value)).ok()?;
+    auth.set_sensitive(true);
+
+    let mut plain = HeaderMap::new();
+    plain.insert(AUTHORIZATION, auth);
+    if let Some(extra) = extra_headers {
+        for (key, value) in extra {
+            plain.insert(key.clone(), value.clone());
+        }
+    }
+
+    let mut json = plain.clone();
+    json.entry(CONTENT_TYPE)
+        .or_insert(HeaderValue::from_static("application/json"));
+    Some(KeyHeaders { plain, json })
+}
+
 /// Statistics about a key pool
 #[derive(Debug, Clone)]
 pub struct KeyPoolStats {
@@ -263,6 +383,71 @@ mod tests {
         assert!(!key.is_rate_limited());
     }
 
+    #[test]
+    fn test_key_circuit_breaker() {
+        let key = ApiKey::new("test-key".to_string());
+
+        // Stays in rotation until the threshold is reached
+        key.record_rate_limited(None);
+        key.record_rate_limited(None);
+        assert!(!key.is_rate_limited());
+
+        key.record_rate_limited(None);
+        assert!(key.is_rate_limited());
+        assert!(key.is_circuit_open());
+        assert!(key.rate_limit_remaining().unwrap() > Duration::from_secs(29));
+
+        // A success closes the circuit
+        key.record_success();
+        assert!(!key.is_rate_limited());
+        assert_eq!(key.consecutive_failures(), 0);
+
+        // A provider retry-after is honored even below the threshold
+        key.record_rate_limited(Some(Duration::from_secs(5)));
+        assert!(key.is_rate_limited());
+        assert!(!key.is_circuit_open());
+    }
+
+    #[test]
+    fn test_key_headers_precomputed() {
+        let mut extra = HeaderMap::new();
+        extra.insert("x-title", HeaderValue::from_static("llmao"));
+        let pool = KeyPool::new(
+            "test".to_string(),
+            vec!["key1".to_string(), "bad\nkey".to_string()],
+            RotationStrategy::RoundRobin,
+        )
+        .with_headers(Some(&extra));
+
+        let key = pool.get_key().unwrap();
+        let headers = key.headers().unwrap();
+        assert_eq!(headers[AUTHORIZATION], "Bearer key1");
+        assert_eq!(headers["x-title"], "llmao");
+        assert!(headers.get(CONTENT_TYPE).is_none());
+        assert_eq!(
+            key.json_headers().unwrap()[CONTENT_TYPE],
+            "application/json"
+        );
+        assert!(pool.get_key().unwrap().headers().is_err());
+    }
+
+    #[test]
+    fn test_key_pool_single_key() {
+        let pool = KeyPool::new(
+            "test".to_string(),
+            vec!["key1".to_string()],
+            RotationStrategy::RoundRobin,
+        );
+
+        assert_eq!(pool.get_key().unwrap().value(), "key1");
+        assert_eq!(pool.get_key().unwrap().value(), "key1");
+        assert_eq!(pool.stats().total_requests, 2);
+
+        // A rate limited single key is still returned
+        pool.mark_rate_limited("key1", Duration::from_secs(60));
+        assert_eq!(pool.get_key().unwrap().value(), "key1");
+    }
+
     #[test]
     fn test_key_pool_round_robin() {
         let pool = KeyPool::new(
@@ -3,7 +3,9 @@
 //! Handles model routing and API key pool management.
 
 pub mod key_pool;
+pub mod provider;
 pub mod strategy;
 
 pub use key_pool::{ApiKey, KeyPool, KeyPoolStats};
+pub use provider::{ProviderHandle, ResolvedModel};
 pub use strategy::ModelRoute;
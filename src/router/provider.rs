@@ -0,0 +1,203 @@
+//! Resolved Providers
+//!
+//! Per-provider state (URLs, headers, key pool) resolved once and shared by
+//! every request to that provider.
+
+use super::{ApiKey, KeyPool};
+use crate::client::TokenBucket;
+use crate::config::ProviderConfig;
+use crate::error::{LlmaoError, Result};
+use reqwest::header::{HeaderMap, HeaderName, HeaderValue};
+use std::sync::Arc;
+
+/// A provider resolved for sending requests
+#[derive(Debug)]
+pub struct ProviderHandle {
+    /// Provider name
+    name: String,
+
+    /// Provider configuration
+    config: ProviderConfig,
+
+    /// Base URL, without a trailing slash
+    base_url: String,
+
+    /// Chat completions endpoint
+    chat_url: String,
+
+    /// Legacy text completions endpoint
+    completions_url: String,
+
+    /// API keys for the provider
+    key_pool: Arc<KeyPool>,
+
+    /// Client-side request limit, if one was configured
+    rate_limit: Option<TokenBucket>,
+}
+
+impl ProviderHandle {
+    /// Resolve a provider
+    ///
+    /// The base URL and API keys are read from the environment here, once;
+    /// `key_pool` is the pool from user config, if any, which must already
+    /// carry this provider's headers (see `KeyPool::with_headers`). Otherwise
+    /// a pool is built from the provider's key environment variables.
+    pub fn new(name: &str, config: ProviderConfig, key_pool: Option<Arc<KeyPool>>) -> Self {
+        let base_url = config.get_base_url().trim_end_matches('/').to_string();
+        let key_pool = key_pool.unwrap_or_else(|| {
+            Arc::new(
+                KeyPool::new(name.to_string(), config.get_api_keys(), Default::default())
+                    .with_headers(build_extra_headers(&config).as_ref()),
+            )
+        });
+
+        Self {
+            name: name.to_string(),
+            chat_url: format!("{}/chat/completions", base_url),
+            completions_url: format!("{}/completions", base_url),
+            key_pool,
+            config,
+            base_url,
+            rate_limit: None,
+        }
+    }
+
+    /// Limit requests to this provider to `requests_per_minute`, if given
+    pub fn with_rate_limit(mut self, requests_per_minute: Option<u32>) -> Self {
+        self.rate_limit = requests_per_minute.map(TokenBucket::per_minute);
+        self
+    }
+
+    /// Wait until the provider's rate limit allows another request
+    pub async fn wait_for_capacity(&self) {
+        if let Some(bucket) = &self.rate_limit {
+            bucket.acquire().await;
+        }
+    }
+
+    /// Get the provider name
+    pub fn name(&self) -> &str {
+        &self.name
+    }
+
+    /// Get the provider configuration
+    pub fn config(&self) -> &ProviderConfig {
+        &self.config
+    }
+
+    /// Get the base URL
+    pub fn base_url(&self) -> &str {
+        &self.base_url
+    }
+
+    /// Get the URL for a path under the provider's base URL (e.g., "batches")
+    pub fn endpoint(&self, path: &str) -> String {
+        format!("{}/{}", self.base_url, path)
+    }
+
+    /// Get the chat completions endpoint
+    pub fn chat_url(&self) -> &str {
+        &self.chat_url
+    }
+
+    /// Get the legacy text completions endpoint
+    pub fn completions_url(&self) -> &str {
+        &self.completions_url
+    }
+
+    /// Get the provider's key pool
+    pub fn key_pool(&self) -> &KeyPool {
+        &self.key_pool
+    }
+
+    /// Get the next API key from the pool
+    pub fn get_key(&self) -> Result<&ApiKey> {
+        self.key_pool
+            .get_key()
+            .ok_or_else(|| LlmaoError::NoKeysAvailable(self.name.clone()))
+    }
+
+    /// Get the first API key, for resources tied to one account (e.g., batch jobs)
+    pub fn primary_key(&self) -> Result<&ApiKey> {
+        self.key_pool
+            .primary_key()
+            .ok_or_else(|| LlmaoError::NoKeysAvailable(self.name.clone()))
+    }
+}
+
+/// A model string resolved to the provider that serves it
+#[derive(Debug)]
+pub struct ResolvedModel {
+    /// Provider serving the model
+    pub provider: Arc<ProviderHandle>,
+
+    /// Model name sent to the provider (e.g., "llama-3.1-70b")
+    pub model_id: String,
+}
+
+/// Build the extra headers configured for a provider
+pub fn build_extra_headers(config: &ProviderConfig) -> Option<HeaderMap> {
+    if config.headers.is_empty() {
+        return None;
+    }
+
+    let mut headers = HeaderMap::new();
+    for (key, value) in &config.headers {
+        if let (Ok(name), Ok(val)) = (
+            HeaderName::try_from(key.as_str()),
+            HeaderValue::from_str(value),
+        ) {
+            headers.insert(name, val);
+        }
+    }
+    Some(headers)
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use std::collections::HashMap;
+
+    fn config(base_url: &str) -> ProviderConfig {
+        ProviderConfig {
+            base_url: base_url.to_string(),
+            api_key_env: None,
+            api_keys_env: None,
+            api_base_env: None,
+            models: vec![],
+            param_mappings: HashMap::new(),
+            headers: HashMap::from([("X-Title".to_string(), "llmao".to_string())]),
+            rate_limit: None,
+            special_handling: Default::default(),
+        }
+    }
+
+    #[test]
+    fn test_provider_handle_resolves_once() {
+        let config = config("https://api.test/v1/");
+        let pool = Arc::new(
+            KeyPool::new(
+                "test".to_string(),
+                vec!["key1".to_string()],
+                Default::default(),
+            )
+            .with_headers(build_extra_headers(&config).as_ref()),
+        );
+        let handle = ProviderHandle::new("test", config, Some(pool));
+
+        assert_eq!(handle.chat_url(), "https://api.test/v1/chat/completions");
+        assert_eq!(handle.completions_url(), "https://api.test/v1/completions");
+        assert_eq!(handle.endpoint("batches"), "https://api.test/v1/batches");
+
+        let key = handle.get_key().unwrap();
+        assert_eq!(key.value(), "key1");
+        assert_eq!(key.headers().unwrap()["x-title"], "llmao");
+    }
+
+    #[test]
+    fn test_provider_handle_without_keys() {
+        let handle = ProviderHandle::new("test", config("https://api.test/v1"), None);
+        assert!(handle.key_pool().is_empty());
+        assert!(handle.get_key().is_err());
+    }
+}
@@ -0,0 +1,312 @@
+"""Tests for the Python client wrapper, using a fake in place of the Rust client."""
+
+import asyncio
+import threading
+
+import pytest
+
+import llmao_py
+from llmao_py import LLMClient, SemanticCache
+
+
+def response(text: str) -> dict:
+    return {"choices": [{"message": {"role": "assistant", "content": text}}]}
+
+
+def text(response: dict) -> str:
+    return response["choices"][0]["message"]["content"]
+
+
+class FakeCall:
+    """PendingCall stand-in that records whether it was cancelled"""
+
+    def __init__(self):
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class FakeRustClient:
+    """
+    Answers every request with its last message, like an echoing provider.
+
+    Spawned calls call back from another thread, as the Rust runtime does;
+    with `answer` unset they never finish.
+    """
+
+    def __init__(self, **kwargs):
+        self.answer = True
+        self.error = None
+        self.calls = []
+        self.sent = 0
+        # Exact-match response cache, keyed by the last message
+        self.exact = {}
+
+    def close(self):
+        pass
+
+    def completion(self, messages, **kwargs):
+        self.sent += 1
+        return response(messages[-1]["content"])
+
+    def cached(self, messages, **kwargs):
+        return self.exact.get(messages[-1]["content"])
+
+    def supports_batch(self, model=None):
+        return False
+
+    def completion_batch(self, messages_list, return_errors=False, **kwargs):
+        return [
+            {"error": "rejected"} if m[-1]["content"] == "fail" else self.completion(m)
+            for m in messages_list
+        ]
+
+    def _spawn(self, callback, *outcome):
+        call = FakeCall()
+        self.calls.append(call)
+        if self.answer:
+            outcome = (None, self.error) if self.error is not None else outcome
+            threading.Thread(target=callback, args=outcome).start()
+        return call
+
+    def spawn_completion(self, callback, messages, **kwargs):
+        return self._spawn(callback, self.completion(messages), None)
+
+    def spawn_completion_batch(self, callback, messages_list, **kwargs):
+        return self._spawn(callback, [self.completion(m) for m in messages_list], None)
+
+    def bind(self, system=None, **kwargs):
+        return FakeBoundCompletion(self, system)
+
+    def spawn_stream(self, callback, on_done, messages, **kwargs):
+        def run():
+            for word in messages[-1]["content"].split():
+                callback({"content": word})
+            on_done(None, self.error)
+
+        call = FakeCall()
+        self.calls.append(call)
+        if self.answer:
+            threading.Thread(target=run).start()
+        return call
+
+
+class FakeBoundCompletion:
+    """Bound completion that sends through its FakeRustClient"""
+
+    model = "fake/model"
+
+    def __init__(self, client, system):
+        self._client = client
+        self._system = system
+
+    def _messages(self, user):
+        system = [] if self._system is None else [{"role": "system", "content": self._system}]
+        return [*system, {"role": "user", "content": user}]
+
+    def __call__(self, user):
+        return self._client.completion(self._messages(user))
+
+    def text(self, user):
+        return text(self(user))
+
+    def spawn_batch(self, callback, users, max_concurrency=None):
+        return self._client._spawn(callback, [self(u) for u in users], None)
+
+
+@pytest.fixture
+def fake_rust(monkeypatch):
+    monkeypatch.setattr(llmao_py, "_RustLLMClient", FakeRustClient)
+
+
+@pytest.fixture
+def client(fake_rust) -> LLMClient:
+    with LLMClient(prewarm=False) as client:
+        yield client
+
+
+def user(content: str) -> list[dict]:
+    return [{"role": "user", "content": content}]
+
+
+async def test_acompletion_is_settled_by_the_runtime(client):
+    responses = await asyncio.gather(*(client.acompletion(user(str(i))) for i in range(100)))
+
+    assert [text(r) for r in responses] == [str(i) for i in range(100)]
+
+
+async def test_acompletion_raises_call_errors(client):
+    client._client.error = ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        await client.acompletion(user("Hello!"))
+
+
+async def test_cancelling_acompletion_aborts_the_call(client):
+    client._client.answer = False
+    task = asyncio.create_task(client.acompletion(user("Hello!")))
+    await asyncio.sleep(0.01)
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert client._client.calls[0].cancelled
+
+
+async def test_completion_batch(client):
+    responses = await client.completion_batch([user("a"), user("b")])
+
+    assert [text(r) for r in responses] == ["a", "b"]
+
+
+async def test_astream_yields_chunks(client):
+    chunks = [chunk async for chunk in client.acompletion(user("one two three"), stream=True)]
+
+    assert [c["choices"][0]["delta"]["content"] for c in chunks] == ["one", "two", "three"]
+
+
+async def test_astream_raises_stream_errors(client):
+    client._client.error = ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        async for _ in client.acompletion(user("one two"), stream=True):
+            pass
+
+
+async def test_leaving_astream_early_aborts_the_call(client):
+    stream = client.acompletion(user("one two three"), stream=True)
+    async for _ in stream:
+        break
+    await stream.aclose()
+
+    assert client._client.calls[0].cancelled
+
+
+def test_local_batch_results_by_index(client):
+    batch_id = client.batch_submit([user("a"), user("fail"), user("c")])
+    results = client.batch_results(batch_id)
+
+    assert batch_id.startswith("local-")
+    assert {i: text(r) for i, r in results.items() if "error" not in r} == {"0": "a", "2": "c"}
+    assert results["1"] == {"error": "rejected"}
+
+
+def test_local_batch_can_be_read_again(client):
+    batch_id = client.batch_submit([user("a")])
+    first = client.batch_results(batch_id)
+
+    assert client.batch_results(batch_id) == first
+    assert client.batch_poll(batch_id) == {"id": batch_id, "status": "completed"}
+
+
+def test_local_batch_in_progress(client):
+    release = threading.Event()
+    completion_batch = client._client.completion_batch
+
+    def slow_batch(*args, **kwargs):
+        release.wait(timeout=5)
+        return completion_batch(*args, **kwargs)
+
+    client._client.completion_batch = slow_batch
+    batch_id = client.batch_submit([user("a")])
+
+    assert client.batch_poll(batch_id)["status"] == "in_progress"
+    release.set()
+    assert text(client.batch_results(batch_id)["0"]) == "a"
+
+
+def test_unknown_local_batch_is_not_sent_to_the_provider(client):
+    # The fake has no provider batch methods, so reaching them would raise AttributeError
+    with pytest.raises(ValueError, match="Unknown batch"):
+        client.batch_results("local-0123")
+    with pytest.raises(ValueError, match="Unknown batch"):
+        client.batch_poll("local-0123")
+
+
+class CountingEmbedder:
+    """Embeds every text as the same vector, counting the texts embedded"""
+
+    def __init__(self):
+        self.count = 0
+
+    def embed(self, texts):
+        np = pytest.importorskip("numpy")
+        for _ in texts:
+            self.count += 1
+            yield np.array([1.0, 0.0])
+
+
+@pytest.fixture
+def embedder() -> CountingEmbedder:
+    pytest.importorskip("numpy")
+    return CountingEmbedder()
+
+
+@pytest.fixture
+def cached_client(fake_rust, embedder) -> LLMClient:
+    with LLMClient(prewarm=False, semantic_cache=SemanticCache(embedder=embedder)) as client:
+        yield client
+
+
+def test_exact_cache_hit_skips_the_embedding(cached_client, embedder):
+    cached_client._client.exact["Hello!"] = response("exact")
+
+    assert text(cached_client.completion(user("Hello!"), temperature=0)) == "exact"
+    assert embedder.count == 0
+    assert cached_client._client.sent == 0
+
+
+def test_semantic_cache_after_exact_miss(cached_client, embedder):
+    cached_client.completion(user("Hello!"), temperature=0)
+    hit = cached_client.completion(user("Hi!"), temperature=0)
+
+    # Every text embeds the same, so the second prompt reuses the first response
+    assert text(hit) == "Hello!"
+    assert cached_client._client.sent == 1
+    assert cached_client.semantic_cache_stats()["hits"] == 1
+
+
+def test_semantic_cache_skips_sampled_calls(cached_client, embedder):
+    cached_client.completion(user("Hello!"), temperature=0.7)
+    cached_client.completion(user("Hi!"), temperature=0.7)
+
+    assert embedder.count == 0
+    assert cached_client._client.sent == 2
+    assert cached_client.semantic_cache_stats()["size"] == 0
+
+
+def test_semantic_cache_takes_opted_in_calls(cached_client, embedder):
+    cached_client.completion(user("Hello!"), temperature=0.7, cache=True)
+    hit = cached_client.completion(user("Hi!"), temperature=0.7, cache=True)
+
+    assert text(hit) == "Hello!"
+    assert cached_client._client.sent == 1
+
+
+async def test_acompletion_uses_the_semantic_cache(cached_client, embedder):
+    await cached_client.acompletion(user("Hello!"), temperature=0)
+    hit = await cached_client.acompletion(user("Hi!"), temperature=0)
+
+    assert text(hit) == "Hello!"
+    assert cached_client.semantic_cache_stats()["hits"] == 1
+
+
+async def test_bound_calls_use_the_semantic_cache(cached_client, embedder):
+    ask = cached_client.bind(temperature=0, system="Be brief.")
+
+    assert [text(r) for r in await ask.batch(["Hello!"])] == ["Hello!"]
+    assert text(ask("Hi!")) == "Hello!"
+    assert ask.text("Hey!") == "Hello!"
+    assert [text(r) for r in await ask.batch(["Yo!", "Howdy!"])] == ["Hello!", "Hello!"]
+    assert cached_client._client.sent == 1
+    assert cached_client.semantic_cache_stats()["hits"] == 4
+
+
+async def test_sampled_bound_batch_skips_the_semantic_cache(cached_client, embedder):
+    ask = cached_client.bind(temperature=0.7)
+
+    await ask.batch(["Hello!", "Hi!"])
+
+    assert embedder.count == 0
+    assert cached_client._client.sent == 2
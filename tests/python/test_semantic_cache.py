@@ -0,0 +1,95 @@
+"""Tests for the semantic response cache, using a stub embedder instead of fastembed."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from llmao_py.semantic_cache import SemanticCache
+
+
+class StubEmbedder:
+    """Maps known texts to fixed vectors, in the shape fastembed returns them"""
+
+    def __init__(self, vectors: dict[str, list[float]]):
+        self.vectors = vectors
+
+    def embed(self, texts):
+        for text in texts:
+            yield np.array(self.vectors[text], dtype=float)
+
+
+def make_cache(**kwargs) -> SemanticCache:
+    embedder = StubEmbedder({
+        "capital": [1.0, 0.0],
+        "capital?": [0.99, 0.141],
+        "weather": [0.0, 1.0],
+    })
+    return SemanticCache(embedder=embedder, **kwargs)
+
+
+def response(text: str) -> dict:
+    return {"choices": [{"message": {"role": "assistant", "content": text}}]}
+
+
+def test_hit_above_threshold():
+    cache = make_cache(threshold=0.9)
+    key = cache.context_key("groq/llama", [{"role": "user", "content": "capital"}])
+    cache.add(key, cache.embed("capital"), response("Jakarta"))
+
+    assert cache.search(key, cache.embed("capital?")) == response("Jakarta")
+    assert cache.search(key, cache.embed("weather")) is None
+    assert cache.stats() == {"hits": 1, "misses": 1, "size": 1}
+
+
+def test_context_must_match():
+    cache = make_cache()
+    key = cache.context_key("groq/llama", [{"role": "user", "content": "capital"}])
+    other = cache.context_key("groq/llama", [{"role": "user", "content": "capital"}], temperature=0.5)
+    cache.add(key, cache.embed("capital"), response("Jakarta"))
+
+    assert cache.search(other, cache.embed("capital")) is None
+
+
+def test_expired_entry_does_not_shadow_live_one():
+    cache = make_cache(threshold=0.9)
+    key = "ctx"
+
+    cache.ttl = -1
+    cache.add(key, cache.embed("capital"), response("stale"))
+    cache.ttl = 60
+    cache.add(key, cache.embed("capital?"), response("fresh"))
+
+    assert cache.search(key, cache.embed("capital")) == response("fresh")
+
+
+def test_add_prunes_expired_entries():
+    cache = make_cache()
+    cache.ttl = -1
+    cache.add("ctx", cache.embed("capital"), response("stale"))
+    cache.ttl = 60
+    cache.add("ctx", cache.embed("weather"), response("fresh"))
+
+    assert cache.stats()["size"] == 1
+
+
+def test_entries_are_copied():
+    cache = make_cache()
+    original = response("Jakarta")
+    cache.add("ctx", cache.embed("capital"), original)
+
+    original["choices"][0]["message"]["content"] = "mutated"
+    hit = cache.search("ctx", cache.embed("capital"))
+    hit["choices"].clear()
+
+    assert cache.search("ctx", cache.embed("capital")) == response("Jakarta")
+
+
+def test_oldest_entry_evicted_when_full():
+    cache = make_cache(max_entries=2)
+    cache.add("a", cache.embed("capital"), response("a"))
+    cache.add("b", cache.embed("capital"), response("b"))
+    cache.add("c", cache.embed("capital"), response("c"))
+
+    assert cache.stats()["size"] == 2
+    assert cache.search("a", cache.embed("capital")) is None
+    assert cache.search("c", cache.embed("capital")) == response("c")